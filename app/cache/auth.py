@@ -0,0 +1,147 @@
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.config.settings import settings
+from app.database.model.users import UserTokenRevoke
+from app.utils.logger import LOGGER_NAME
+
+logger = logging.getLogger(LOGGER_NAME)
+
+
+class AuthContextCache:
+    """
+    액세스 토큰 검증 결과 캐시 (워커 단위 LRU).
+    토큰 해시를 키로 디코딩된 claims 와 최소한의 회원 정보(id, email, is_active, is_block)를 보관하며,
+    만료 시각은 AUTH_CACHE_TTL 과 토큰 exp 중 빠른 쪽입니다.
+    """
+
+    def __init__(
+        self,
+        max_size: int = settings.AUTH_CACHE_SIZE,
+        ttl: int = settings.AUTH_CACHE_TTL,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._items: OrderedDict[str, tuple[float, dict, dict]] = OrderedDict()
+        self._user_keys: dict[int, set[str]] = {}
+
+    def __len__(self):
+        return len(self._items)
+
+    @classmethod
+    def make_key(cls, token: str):
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, token: str):
+        key = self.make_key(token)
+        item = self._items.get(key)
+        if item is None:
+            return None
+        expires_at, claims, user = item
+        if expires_at <= time.time():
+            self._remove(key)
+            return None
+        self._items.move_to_end(key)
+        return claims, user
+
+    def set(self, token: str, claims: dict, user: dict):
+        key = self.make_key(token)
+        expires_at = min(time.time() + self.ttl, float(claims["exp"]))
+        if key in self._items:
+            self._remove(key)
+        self._items[key] = (expires_at, claims, user)
+        self._user_keys.setdefault(user["id"], set()).add(key)
+        # 크기 제한 초과시 가장 오래 사용되지 않은 항목 제거
+        while len(self._items) > self.max_size:
+            self._remove(next(iter(self._items)))
+
+    def invalidate_user(self, user_id: int):
+        # 회원 상태 변경시 해당 회원의 캐시 제거
+        for key in self._user_keys.pop(user_id, set()):
+            self._items.pop(key, None)
+
+    def clear(self):
+        self._items.clear()
+        self._user_keys.clear()
+
+    def _remove(self, key: str):
+        item = self._items.pop(key, None)
+        if item is None:
+            return
+        user_id = item[2]["id"]
+        keys = self._user_keys.get(user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._user_keys[user_id]
+
+
+auth_context_cache = AuthContextCache()
+
+
+class TokenVersionMap:
+    """
+    회원 별 토큰 버전 맵 (워커 단위).
+    토큰 버전이 한 번이라도 변경된 회원만 보관하며 (그 외는 0),
+    rvvs_user_token_revoke 를 id 순으로 폴링하여 다른 워커의 변경도 반영합니다.
+    차단/비활성화(rvvs_user 트리거), 비밀번호 변경, 탈퇴는 모두 토큰 버전을 증가시키므로
+    최근 폴링이 성공한 상태(is_fresh)에서는 DB 조회 없이 토큰을 신뢰할 수 있습니다.
+    """
+
+    def __init__(self, poll_interval: int = settings.AUTH_TOKEN_VERSION_POLL_INTERVAL):
+        self.poll_interval = poll_interval
+        self.polled_at: float = 0.0
+        self._versions: dict[int, int] = {}
+        self._last_id: int = 0
+
+    def __len__(self):
+        return len(self._versions)
+
+    @property
+    def is_fresh(self):
+        return time.time() - self.polled_at < self.poll_interval * 3
+
+    def get(self, user_id: int):
+        return self._versions.get(user_id, 0)
+
+    def is_current(self, user_id: int, token_version: int | None):
+        return (token_version or 0) >= self.get(user_id)
+
+    def set(self, user_id: int, token_version: int):
+        if token_version > self._versions.get(user_id, 0):
+            self._versions[user_id] = token_version
+            auth_context_cache.invalidate_user(user_id)
+
+    async def refresh(self, db: AsyncSession):
+        result = await db.execute(
+            select(
+                UserTokenRevoke.id, UserTokenRevoke.user_id, UserTokenRevoke.token_version
+            )
+            .where(UserTokenRevoke.id > self._last_id)
+            .order_by(UserTokenRevoke.id)
+        )
+        for revoke_id, user_id, token_version in result.all():
+            self.set(user_id, token_version)
+            self._last_id = revoke_id
+        self.polled_at = time.time()
+
+    async def run(self, session_factory):
+        # 백그라운드 주기 갱신
+        while True:
+            try:
+                async with session_factory() as db:
+                    await self.refresh(db)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Failed to refresh token versions")
+            await asyncio.sleep(self.poll_interval)
+
+
+token_versions = TokenVersionMap()
@@ -0,0 +1,43 @@
+import asyncio
+import logging
+import os
+import time
+
+from app.cache.catalog import VideoCatalog, build_snapshot
+from app.config.settings import settings
+from app.database.database import AsyncSessionLocal
+from app.utils.logger import LOGGER_NAME
+
+logger = logging.getLogger(LOGGER_NAME)
+
+
+# 비디오 카탈로그 스냅샷 빌더
+# gunicorn 마스터가 워커와 별도로 실행하며 (gunicorn_conf.py 참고),
+# CATALOG_REFRESH_INTERVAL 마다 스냅샷 파일을 새로 기록합니다.
+# 실행: python -m app.cache.builder
+async def run_builder():
+    parent_pid = os.getppid()
+    catalog = VideoCatalog(snapshot_path=None)
+    while True:
+        started = time.time()
+        try:
+            async with AsyncSessionLocal() as db:
+                count = await build_snapshot(
+                    db, catalog, settings.CATALOG_SNAPSHOT_PATH
+                )
+            print(
+                f"Catalog snapshot written: {count} videos, "
+                f"{time.time() - started:.2f}s"
+            )
+        except Exception:
+            logger.exception("Failed to build catalog snapshot")
+        # 부모 프로세스(gunicorn 마스터)가 종료되면 함께 종료
+        if os.getppid() != parent_pid:
+            break
+        await asyncio.sleep(settings.CATALOG_REFRESH_INTERVAL)
+
+
+if __name__ == "__main__":
+    if not settings.CATALOG_SNAPSHOT_PATH:
+        raise SystemExit("CATALOG_SNAPSHOT_PATH is not set")
+    asyncio.run(run_builder())
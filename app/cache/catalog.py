@@ -0,0 +1,500 @@
+import asyncio
+import logging
+import time
+from datetime import datetime
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.cache.snapshot import SnapshotReader, write_snapshot
+from app.config.settings import settings
+from app.database.model.videos import Video, VideoGenre, VideoActor, VideoStaff
+from app.utils.logger import LOGGER_NAME
+
+
+# 메모리 정렬이 가능한 정렬 조건 (title 정렬은 DB에서 처리)
+CATALOG_ORDER_COLUMNS = {
+    "view_desc": ("view_count", True),
+    "view_asc": ("view_count", False),
+    "like_desc": ("like_count", True),
+    "like_asc": ("like_count", False),
+    "new_desc": ("created_at", True),
+    "new_asc": ("created_at", False),
+    "updated_desc": ("updated_at", True),
+    "updated_asc": ("updated_at", False),
+    "rating_desc": ("rating", True),
+    "rating_asc": ("rating", False),
+}
+# 비디오 상태 플래그
+FLAG_CONFIRM = 1
+FLAG_DELETE = 2
+# 스냅샷에 저장되는 링크 인덱스
+CATALOG_POSTINGS = ("genre", "actor", "staff")
+
+logger = logging.getLogger(LOGGER_NAME)
+
+
+def parse_id_list(value: str | None):
+    # "1,5,9" 형태의 파라메터를 정수 리스트로 변환 (중복 제거, 순서 유지)
+    if value is None:
+        return None
+    ids = []
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        if not item.isdigit():
+            raise ValueError(f"Invalid id: {item}")
+        if int(item) not in ids:
+            ids.append(int(item))
+    return ids or None
+
+
+def find_positions(video_ids: np.ndarray, ids: np.ndarray):
+    # 정렬된 video_ids 에서 ids 의 위치 (video_ids 에 있는 ID 만, 입력 순서 유지)
+    positions = np.searchsorted(video_ids, ids)
+    found = positions < len(video_ids)
+    found[found] = video_ids[positions[found]] == ids[found]
+    return positions[found], found
+
+
+class Postings:
+    """
+    키(장르/배우/스태프 ID) 별 비디오 ID 집합을 CSR 형태로 보관합니다.
+    keys[i] 의 비디오 ID 는 values[offsets[i]:offsets[i + 1]] (정렬된 uint32) 입니다.
+    """
+
+    EMPTY = np.empty(0, np.uint32)
+
+    def __init__(self, keys: np.ndarray, offsets: np.ndarray, values: np.ndarray):
+        self.keys = keys
+        self.offsets = offsets
+        self.values = values
+
+    @classmethod
+    def from_pairs(cls, keys: np.ndarray, values: np.ndarray):
+        # (key, video_id) 쌍으로 생성
+        if len(keys) == 0:
+            return cls.from_grouped(keys, values)
+        order = np.lexsort((values, keys))
+        keys = keys[order]
+        values = values[order]
+        # 중복 쌍 제거
+        unique = np.ones(len(keys), bool)
+        unique[1:] = (keys[1:] != keys[:-1]) | (values[1:] != values[:-1])
+        return cls.from_grouped(keys[unique], values[unique])
+
+    @classmethod
+    def from_grouped(cls, keys: np.ndarray, values: np.ndarray):
+        # key 순으로 정렬된 쌍으로 생성 (key 내부 values 순서 유지)
+        if len(keys) == 0:
+            return cls(cls.EMPTY, np.zeros(1, np.int64), cls.EMPTY)
+        unique_keys, starts = np.unique(keys, return_index=True)
+        offsets = np.append(starts, len(values)).astype(np.int64)
+        return cls(unique_keys.astype(np.uint32), offsets, values.astype(np.uint32))
+
+    def pairs(self):
+        # (key, video_id) 쌍으로 펼침
+        return np.repeat(self.keys, np.diff(self.offsets)), self.values
+
+    def get(self, key: int):
+        index = int(np.searchsorted(self.keys, key))
+        if index >= len(self.keys) or self.keys[index] != key:
+            return self.EMPTY
+        return self.values[self.offsets[index] : self.offsets[index + 1]]
+
+
+class CatalogState:
+    def __init__(
+        self,
+        video_ids: np.ndarray,
+        columns: dict[str, np.ndarray],
+        postings: dict[str, Postings],
+        ranked: dict[str, np.ndarray] | None = None,
+        browse: dict[str, Postings] | None = None,
+        updated_max: datetime | None = None,
+    ):
+        # 전체 비디오 ID, 오름차순
+        self.video_ids = video_ids
+        # video_ids 와 같은 순서의 컬럼 (flags, 정렬 컬럼)
+        self.columns = columns
+        # 장르/배우/스태프 ID 별 비디오 ID 집합
+        self.postings = postings
+        # 정렬 조건 별 공개 비디오 ID 목록
+        self.ranked = ranked
+        # 정렬 조건 별, 장르 ID 별 공개 비디오 ID 목록 (장르 탐색 페이지)
+        self.browse = browse
+        # 증분 갱신 기준 시각 (DB 의 updated_at 최대값)
+        self.updated_max = updated_max
+        if self.ranked is None or self.browse is None:
+            self.build_browse()
+
+    def build_browse(self):
+        # 공개(is_confirm=True, is_delete=False) 비디오
+        visible = self.columns["flags"] == FLAG_CONFIRM
+        positions = np.flatnonzero(visible)
+        # 장르 링크 중 공개 비디오만
+        genre_keys, genre_values = self.postings["genre"].pairs()
+        genre_positions, found = find_positions(self.video_ids, genre_values)
+        genre_keys = genre_keys[found]
+        valid = visible[genre_positions]
+        genre_keys = genre_keys[valid]
+        genre_positions = genre_positions[valid]
+        # 정렬 조건 별 순위 계산 후 장르 별로 그룹핑
+        self.ranked = {}
+        self.browse = {}
+        rank = np.zeros(len(self.video_ids), np.int64)
+        for order_by, (column_name, descending) in CATALOG_ORDER_COLUMNS.items():
+            values = self.columns[column_name][positions]
+            if descending:
+                values = -values
+            ordered = positions[np.lexsort((self.video_ids[positions], values))]
+            rank[ordered] = np.arange(len(ordered))
+            self.ranked[order_by] = self.video_ids[ordered]
+            order = np.lexsort((rank[genre_positions], genre_keys))
+            self.browse[order_by] = Postings.from_grouped(
+                genre_keys[order], self.video_ids[genre_positions[order]]
+            )
+
+    @classmethod
+    def _video_columns(cls):
+        return (
+            Video.id,
+            Video.view_count,
+            Video.like_count,
+            Video.rating,
+            Video.created_at,
+            Video.updated_at,
+            Video.is_confirm,
+            Video.is_delete,
+        )
+
+    @classmethod
+    def _rows_to_columns(cls, rows):
+        count = len(rows)
+        created_at = np.fromiter(
+            (row[4].timestamp() if row[4] else 0 for row in rows), np.float64, count
+        )
+        updated_at = np.fromiter(
+            (row[5].timestamp() if row[5] else 0 for row in rows), np.float64, count
+        )
+        columns = {
+            "flags": np.fromiter(
+                (
+                    (FLAG_CONFIRM if row[6] else 0) | (FLAG_DELETE if row[7] else 0)
+                    for row in rows
+                ),
+                np.uint8,
+                count,
+            ),
+            "view_count": np.fromiter((row[1] or 0 for row in rows), np.int64, count),
+            "like_count": np.fromiter((row[2] or 0 for row in rows), np.int64, count),
+            "rating": np.fromiter((row[3] or 0 for row in rows), np.float64, count),
+            "created_at": created_at,
+            "updated_at": np.where(updated_at > 0, updated_at, created_at),
+        }
+        return columns
+
+    @classmethod
+    async def load(cls, db: AsyncSession):
+        # 비디오 컬럼
+        result = await db.execute(select(*cls._video_columns()).order_by(Video.id))
+        rows = result.all()
+        columns = cls._rows_to_columns(rows)
+        # 링크 테이블
+        postings = {}
+        for name, key_column, video_column in (
+            ("genre", VideoGenre.genre_id, VideoGenre.video_id),
+            ("actor", VideoActor.actor_id, VideoActor.video_id),
+            ("staff", VideoStaff.staff_id, VideoStaff.video_id),
+        ):
+            result = await db.execute(select(key_column, video_column))
+            pairs = result.all()
+            postings[name] = Postings.from_pairs(
+                np.fromiter((pair[0] for pair in pairs), np.uint32, len(pairs)),
+                np.fromiter((pair[1] for pair in pairs), np.uint32, len(pairs)),
+            )
+        return cls(
+            np.fromiter((row[0] for row in rows), np.uint32, len(rows)),
+            columns,
+            postings,
+            updated_max=max((row[5] for row in rows if row[5]), default=None),
+        )
+
+    async def load_changes(self, db: AsyncSession):
+        # updated_at 이 갱신된 비디오의 컬럼만 반영한 새 상태 (카운터 변경 등)
+        # 새 비디오가 추가된 경우 None 반환 (전체 갱신 필요)
+        if self.updated_max is None:
+            return None
+        result = await db.execute(
+            select(*self._video_columns()).where(Video.updated_at >= self.updated_max)
+        )
+        rows = result.all()
+        if not rows:
+            return self
+        changed_ids = np.fromiter((row[0] for row in rows), np.uint32, len(rows))
+        positions = np.searchsorted(self.video_ids, changed_ids)
+        if np.any(positions >= len(self.video_ids)) or np.any(
+            self.video_ids[positions] != changed_ids
+        ):
+            return None
+        changed = self._rows_to_columns(rows)
+        columns = {}
+        for name, column in self.columns.items():
+            column = column.copy()
+            column[positions] = changed[name]
+            columns[name] = column
+        return CatalogState(
+            self.video_ids,
+            columns,
+            self.postings,
+            updated_max=max(self.updated_max, max(row[5] for row in rows if row[5])),
+        )
+
+    def to_arrays(self):
+        # 스냅샷 파일 저장용 배열 목록
+        arrays = {"video_ids": self.video_ids}
+        for name, column in self.columns.items():
+            arrays[f"column.{name}"] = column
+        for name, postings in self.postings.items():
+            arrays[f"{name}.keys"] = postings.keys
+            arrays[f"{name}.offsets"] = postings.offsets
+            arrays[f"{name}.values"] = postings.values
+        for order_by, ranked in self.ranked.items():
+            arrays[f"ranked.{order_by}"] = ranked
+        for order_by, postings in self.browse.items():
+            arrays[f"browse.{order_by}.keys"] = postings.keys
+            arrays[f"browse.{order_by}.offsets"] = postings.offsets
+            arrays[f"browse.{order_by}.values"] = postings.values
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays: dict[str, np.ndarray]):
+        # 스냅샷 배열로 생성 (복사 없음)
+        columns = {
+            name.split(".", 1)[1]: array
+            for name, array in arrays.items()
+            if name.startswith("column.")
+        }
+        postings = {
+            name: Postings(
+                arrays[f"{name}.keys"],
+                arrays[f"{name}.offsets"],
+                arrays[f"{name}.values"],
+            )
+            for name in CATALOG_POSTINGS
+        }
+        ranked = {
+            order_by: arrays[f"ranked.{order_by}"]
+            for order_by in CATALOG_ORDER_COLUMNS
+            if f"ranked.{order_by}" in arrays
+        }
+        browse = {
+            order_by: Postings(
+                arrays[f"browse.{order_by}.keys"],
+                arrays[f"browse.{order_by}.offsets"],
+                arrays[f"browse.{order_by}.values"],
+            )
+            for order_by in CATALOG_ORDER_COLUMNS
+            if f"browse.{order_by}.keys" in arrays
+        }
+        return cls(
+            arrays["video_ids"],
+            columns,
+            postings,
+            ranked=ranked if len(ranked) == len(CATALOG_ORDER_COLUMNS) else None,
+            browse=browse if len(browse) == len(CATALOG_ORDER_COLUMNS) else None,
+        )
+
+
+class VideoCatalog:
+    """
+    비디오 목록 필터링/정렬용 메모리 인덱스.
+    CATALOG_SNAPSHOT_PATH 가 설정되면 빌더 프로세스가 기록한 스냅샷을 모든 워커가 mmap 으로 공유하고,
+    그렇지 않으면 워커마다 링크 테이블을 주기적으로 읽어 인덱스를 만듭니다.
+    DB 에서는 최종 페이지의 비디오만 조회합니다.
+    """
+
+    def __init__(
+        self,
+        refresh_interval: int = settings.CATALOG_REFRESH_INTERVAL,
+        snapshot_path: str | None = settings.CATALOG_SNAPSHOT_PATH,
+    ):
+        self.refresh_interval = refresh_interval
+        self.refreshed_at: float = 0.0
+        self.full_refreshed_at: float = 0.0
+        self._state: CatalogState | None = None
+        self._snapshot = SnapshotReader(snapshot_path) if snapshot_path else None
+        # 마지막 스냅샷 로드 실패 여부 (실패시 교체될 때까지 DB 에서 직접 갱신)
+        self._snapshot_failed = False
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_ready(self):
+        return self._state is not None
+
+    def supports(self, order_by: str | None):
+        return self.is_ready and (order_by is None or order_by in CATALOG_ORDER_COLUMNS)
+
+    @property
+    def state(self):
+        return self._state
+
+    async def refresh(self, db: AsyncSession):
+        async with self._lock:
+            now = time.time()
+            state = None
+            # 카운터 변경분만 증분 반영, 링크 변경은 주기적 전체 갱신으로 반영
+            if (
+                self._state is not None
+                and now - self.full_refreshed_at < settings.CATALOG_FULL_REFRESH_INTERVAL
+            ):
+                state = await self._state.load_changes(db)
+            if state is None:
+                state = await CatalogState.load(db)
+                self.full_refreshed_at = now
+            self._state = state
+            self.refreshed_at = now
+
+    def reload_snapshot(self):
+        # 스냅샷 파일이 교체된 경우 다시 매핑, 사용할 수 있는 스냅샷이 없으면 False
+        try:
+            if self._snapshot.reload():
+                self._state = CatalogState.from_arrays(self._snapshot.arrays)
+                self.refreshed_at = self._snapshot.meta.get("created_at", time.time())
+                self._snapshot_failed = False
+        except Exception as e:
+            # 손상된 스냅샷은 사용하지 않고 DB 갱신으로 대체
+            logger.error(f"Failed to load catalog snapshot {self._snapshot.path}: {e}")
+            self._snapshot_failed = True
+        return self._snapshot.is_loaded and not self._snapshot_failed
+
+    async def run(self, session_factory):
+        # 백그라운드 주기 갱신
+        while True:
+            use_snapshot = False
+            try:
+                # 스냅샷이 없거나 손상된 경우 직접 DB 에서 갱신
+                use_snapshot = self._snapshot is not None and self.reload_snapshot()
+                if not use_snapshot:
+                    async with session_factory() as db:
+                        await self.refresh(db)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Failed to refresh video catalog")
+            await asyncio.sleep(
+                settings.CATALOG_SNAPSHOT_POLL_INTERVAL
+                if use_snapshot
+                else self.refresh_interval
+            )
+
+    @classmethod
+    def _combine(cls, postings: Postings, ids: list[int], match_all: bool):
+        sets = [postings.get(i) for i in ids]
+        if match_all:
+            # 작은 집합부터 교집합
+            sets.sort(key=len)
+            result = sets[0]
+            for s in sets[1:]:
+                if len(result) == 0:
+                    break
+                result = np.intersect1d(result, s, assume_unique=True)
+            return result
+        return np.unique(np.concatenate(sets))
+
+    def search(
+        self,
+        genre_ids: list[int] | None = None,
+        actor_ids: list[int] | None = None,
+        staff_ids: list[int] | None = None,
+        match_all: bool = False,
+        is_delete: bool | None = False,
+        is_confirm: bool | None = True,
+        order_by: str | None = None,
+        offset: int = 0,
+        limit: int = 20,
+    ):
+        state = self._state
+        # 정렬된 목록이 준비된 경우 배열 슬라이스로 처리 (전체 목록, 단일 장르 탐색)
+        if (
+            order_by is not None
+            and is_confirm is True
+            and is_delete is False
+            and not actor_ids
+            and not staff_ids
+            and (not genre_ids or len(genre_ids) == 1)
+        ):
+            if genre_ids:
+                ranked = state.browse[order_by].get(genre_ids[0])
+            else:
+                ranked = state.ranked[order_by]
+            page = ranked[offset : offset + limit]
+            return len(ranked), [int(video_id) for video_id in page]
+        # 상태 필터
+        flags = state.columns["flags"]
+        mask = np.ones(len(state.video_ids), bool)
+        if is_confirm is not None:
+            mask &= ((flags & FLAG_CONFIRM) != 0) == is_confirm
+        if is_delete is not None:
+            mask &= ((flags & FLAG_DELETE) != 0) == is_delete
+        # 링크 필터 (필터끼리는 AND, 필터 내부는 any/all)
+        for name, ids in (
+            ("genre", genre_ids),
+            ("actor", actor_ids),
+            ("staff", staff_ids),
+        ):
+            if not ids:
+                continue
+            candidates = self._combine(state.postings[name], ids, match_all)
+            found, _ = find_positions(state.video_ids, candidates)
+            link_mask = np.zeros(len(state.video_ids), bool)
+            link_mask[found] = True
+            mask &= link_mask
+        positions = np.flatnonzero(mask)
+        total = len(positions)
+        # 정렬
+        if order_by is not None:
+            column_name, descending = CATALOG_ORDER_COLUMNS[order_by]
+            values = state.columns[column_name][positions]
+            if descending:
+                values = -values
+            positions = positions[np.lexsort((state.video_ids[positions], values))]
+        page = state.video_ids[positions[offset : offset + limit]]
+        return total, [int(video_id) for video_id in page]
+
+    def genre_counts(self):
+        # 장르 별 공개 비디오 수
+        browse = next(iter(self._state.browse.values()))
+        return dict(zip(browse.keys.tolist(), np.diff(browse.offsets).tolist()))
+
+    def person_videos(
+        self, name: str, person_id: int, cursor: int | None = None, limit: int = 20
+    ):
+        # 배우/스태프 필모그래피 (공개 비디오, 최신 ID 순, cursor 미만 ID 부터)
+        state = self._state
+        video_ids = state.postings[name].get(person_id)
+        positions, found = find_positions(state.video_ids, video_ids)
+        visible = state.columns["flags"][positions] == FLAG_CONFIRM
+        video_ids = video_ids[found][visible][::-1]
+        total = len(video_ids)
+        if cursor is not None:
+            # 내림차순 배열에서 cursor 미만 시작 위치
+            start = len(video_ids) - int(np.searchsorted(video_ids[::-1], cursor))
+            video_ids = video_ids[start:]
+        return total, [int(video_id) for video_id in video_ids[:limit]]
+
+
+video_catalog = VideoCatalog()
+
+
+async def build_snapshot(
+    db: AsyncSession,
+    catalog: VideoCatalog,
+    path: str = settings.CATALOG_SNAPSHOT_PATH,
+):
+    # DB 에서 인덱스를 갱신하여 스냅샷 파일로 저장
+    await catalog.refresh(db)
+    write_snapshot(path, catalog.state.to_arrays(), meta={"created_at": time.time()})
+    return len(catalog.state.video_ids)
@@ -0,0 +1,59 @@
+import asyncio
+import hashlib
+import json
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache.catalog import video_catalog
+from app.config.settings import settings
+from app.database.queryset.videos import read_genre_list, read_genre_video_counts
+
+
+class GenreSnapshot:
+    """
+    장르 목록과 장르 별 공개 비디오 수의 메모리 스냅샷.
+    비디오 수는 카탈로그 인덱스에서 가져오며 (준비 전에는 DB 집계),
+    내용이 같으면 ETag 도 같으므로 클라이언트는 If-None-Match 로 재검증합니다.
+    """
+
+    def __init__(self, ttl: int = settings.GENRE_CACHE_TTL):
+        self.ttl = ttl
+        self.data: list[dict] | None = None
+        self.etag: str | None = None
+        self.expires_at: float = 0.0
+        self._catalog_state = None
+        self._lock = asyncio.Lock()
+
+    def is_fresh(self):
+        return (
+            self.data is not None
+            and time.time() < self.expires_at
+            and self._catalog_state is video_catalog.state
+        )
+
+    async def get(self, db: AsyncSession):
+        if self.is_fresh():
+            return self.data, self.etag
+        async with self._lock:
+            if self.is_fresh():
+                return self.data, self.etag
+            catalog_state = video_catalog.state
+            genres = await read_genre_list(db)
+            if catalog_state is not None:
+                counts = video_catalog.genre_counts()
+            else:
+                counts = await read_genre_video_counts(db)
+            data = [
+                {"id": genre_id, "name": name, "video_count": counts.get(genre_id, 0)}
+                for genre_id, name in genres
+            ]
+            body = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+            self.etag = f'"{hashlib.sha1(body.encode("utf-8")).hexdigest()}"'
+            self.data = data
+            self.expires_at = time.time() + self.ttl
+            self._catalog_state = catalog_state
+            return self.data, self.etag
+
+
+genre_snapshot = GenreSnapshot()
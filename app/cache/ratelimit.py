@@ -0,0 +1,130 @@
+import hashlib
+import mmap
+import os
+import time
+
+import numpy as np
+
+from app.config.settings import settings
+
+
+class RateLimiter:
+    """
+    토큰 버킷 레이트 리미터 (scope 별로 분리된 4-way set-associative 해시 테이블)
+    path 가 설정되면 파일 mmap(MAP_SHARED) 위에 테이블을 두어 같은 호스트의 모든 워커가 버킷을 공유하고,
+    없으면 워커 로컬 메모리를 사용합니다.
+    슬롯 위치는 비밀 키로 keyed blake2b 해시를 적용해 정하므로 외부에서 충돌 키를 계산할 수 없고,
+    세트가 가득 차면 다시 가득 찬(상태 손실 없는) 버킷만 교체하며 교체할 버킷이 없으면 거절합니다.
+    락을 사용하지 않으므로 워커 간 동시 갱신시 일부 차감이 유실될 수 있습니다. (제한이 약간 느슨해지는 방향)
+    """
+
+    WAYS = 4
+
+    def __init__(
+        self,
+        scopes: list[str],
+        slots: int,
+        path: str | None = None,
+        secret: str | None = None,
+    ):
+        self.scopes = {scope: index for index, scope in enumerate(scopes)}
+        # scope 당 슬롯 수 (WAYS 의 배수)
+        self.sets = max(slots // self.WAYS, 1)
+        self.slots = self.sets * self.WAYS
+        self.path = path
+        # 공유 테이블은 모든 워커가 같은 비밀 키를 사용해야 하므로 설정값에서 유도
+        self._secret = (
+            hashlib.sha256(secret.encode()).digest() if secret else os.urandom(32)
+        )
+        total = self.slots * len(self.scopes)
+        size = total * 24
+        if path:
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                if os.fstat(fd).st_size < size:
+                    os.ftruncate(fd, size)
+                self._buffer = mmap.mmap(fd, size, access=mmap.ACCESS_WRITE)
+            finally:
+                os.close(fd)
+        else:
+            self._buffer = bytearray(size)
+        # [keys(u64) * total][tokens(f64) * total][stamps(f64) * total], scope 마다 slots 구간
+        self._keys = np.frombuffer(self._buffer, dtype=np.uint64, count=total)
+        self._tokens = np.frombuffer(
+            self._buffer, dtype=np.float64, count=total, offset=total * 8
+        )
+        self._stamps = np.frombuffer(
+            self._buffer, dtype=np.float64, count=total, offset=total * 16
+        )
+
+    def _hash(self, scope: str, key: str):
+        digest = hashlib.blake2b(
+            f"{scope}:{key}".encode(), digest_size=8, key=self._secret
+        ).digest()
+        # 0 은 빈 슬롯 표시로 사용
+        return int.from_bytes(digest, "little") or 1
+
+    def _find_slot(
+        self, base: int, key_hash: int, now: float, capacity: float, rate: float
+    ):
+        # 세트 안에서 같은 키, 빈 슬롯, 가득 찬 버킷 순으로 선택
+        # 반환: (슬롯, 기존 키 여부), 교체할 슬롯이 없으면 (None, 가장 빨리 가득 차는 버킷까지 남은 초)
+        empty = None
+        refilled = None
+        wait = None
+        for slot in range(base, base + self.WAYS):
+            slot_hash = int(self._keys[slot])
+            if slot_hash == key_hash:
+                return slot, True
+            if slot_hash == 0:
+                if empty is None:
+                    empty = slot
+                continue
+            elapsed = max(now - float(self._stamps[slot]), 0.0)
+            missing = capacity - (float(self._tokens[slot]) + elapsed * rate)
+            if missing <= 0:
+                if refilled is None:
+                    refilled = slot
+            elif wait is None or missing / rate < wait:
+                wait = missing / rate
+        if empty is not None:
+            return empty, False
+        if refilled is not None:
+            return refilled, False
+        return None, wait
+
+    def hit(self, scope: str, key: str, per_minute: int, cost: float = 1.0):
+        # 버킷 용량 = per_minute, 초당 per_minute / 60 충전
+        # 허용 여부와 재시도까지 남은 초 반환
+        if not key or per_minute <= 0:
+            return True, 0
+        key_hash = self._hash(scope, key)
+        base = self.scopes[scope] * self.slots + (key_hash % self.sets) * self.WAYS
+        now = time.time()
+        capacity = float(per_minute)
+        rate = capacity / 60
+        slot, found = self._find_slot(base, key_hash, now, capacity, rate)
+        if slot is None:
+            # 세트의 모든 버킷이 사용 중이면 fail closed
+            return False, int(found) + 1
+        if found:
+            elapsed = max(now - float(self._stamps[slot]), 0.0)
+            tokens = min(capacity, float(self._tokens[slot]) + elapsed * rate)
+        else:
+            # 빈 슬롯 또는 이미 가득 찬 버킷 교체 (교체되는 키의 상태 손실 없음)
+            self._keys[slot] = key_hash
+            tokens = capacity
+        self._stamps[slot] = now
+        if tokens < cost:
+            self._tokens[slot] = tokens
+            return False, int((cost - tokens) / rate) + 1
+        self._tokens[slot] = tokens - cost
+        return True, 0
+
+
+rate_limiter = RateLimiter(
+    ["login_ip", "login_email", "video_view_ip"],
+    settings.RATE_LIMIT_SLOTS,
+    settings.RATE_LIMIT_SHM_PATH,
+    settings.RATE_LIMIT_SECRET,
+)
@@ -0,0 +1,108 @@
+import json
+import mmap
+import os
+
+import numpy as np
+
+
+# 스냅샷 파일 포맷
+# [MAGIC(4)][VERSION(4)][HEADER_SIZE(8)][HEADER(JSON)][ARRAYS(64바이트 정렬)]
+SNAPSHOT_MAGIC = b"RVCS"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_ALIGN = 64
+
+
+def _align(size: int):
+    return (size + SNAPSHOT_ALIGN - 1) // SNAPSHOT_ALIGN * SNAPSHOT_ALIGN
+
+
+def write_snapshot(path: str, arrays: dict[str, np.ndarray], meta: dict | None = None):
+    # 배열 레이아웃 계산
+    layout = {}
+    offset = 0
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        arrays[name] = array
+        layout[name] = {
+            "dtype": array.dtype.str,
+            "count": int(array.size),
+            "offset": offset,
+        }
+        offset = _align(offset + array.nbytes)
+    header = json.dumps({"arrays": layout, "meta": meta or {}}).encode("utf-8")
+    data_start = _align(16 + len(header))
+    # 임시 파일에 기록 후 rename 으로 원자적 교체
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(SNAPSHOT_MAGIC)
+            f.write(SNAPSHOT_VERSION.to_bytes(4, "little"))
+            f.write(len(header).to_bytes(8, "little"))
+            f.write(header)
+            for name, array in arrays.items():
+                f.seek(data_start + layout[name]["offset"])
+                f.write(array.tobytes())
+            f.truncate(data_start + offset)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class SnapshotReader:
+    """
+    스냅샷 파일을 읽기 전용 mmap 으로 매핑합니다.
+    배열은 복사 없이 mmap 위의 numpy 뷰로 제공되므로 여러 워커가 같은 페이지 캐시를 공유합니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.arrays: dict[str, np.ndarray] = {}
+        self.meta: dict = {}
+        self._mmap: mmap.mmap | None = None
+        self._stat_key = None
+
+    @property
+    def is_loaded(self):
+        return self._mmap is not None
+
+    def _current_stat_key(self):
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def reload(self):
+        # 파일이 교체된 경우에만 다시 매핑, 변경 여부 반환
+        stat_key = self._current_stat_key()
+        if stat_key is None or stat_key == self._stat_key:
+            return False
+        with open(self.path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if mapped[:4] != SNAPSHOT_MAGIC:
+            raise ValueError(f"Invalid snapshot file: {self.path}")
+        version = int.from_bytes(mapped[4:8], "little")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version: {version}")
+        header_size = int.from_bytes(mapped[8:16], "little")
+        header = json.loads(mapped[16 : 16 + header_size].decode("utf-8"))
+        data_start = _align(16 + header_size)
+        arrays = {
+            name: np.frombuffer(
+                mapped,
+                dtype=np.dtype(spec["dtype"]),
+                count=spec["count"],
+                offset=data_start + spec["offset"],
+            )
+            for name, spec in header["arrays"].items()
+        }
+        # 이전 mmap 은 참조하는 배열이 모두 해제되면 함께 해제됨
+        self._mmap = mapped
+        self.arrays = arrays
+        self.meta = header["meta"]
+        self._stat_key = stat_key
+        return True
@@ -0,0 +1,174 @@
+import asyncio
+import hashlib
+import logging
+import math
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.config.settings import settings
+from app.database.model.users import User
+from app.utils.logger import LOGGER_NAME
+
+logger = logging.getLogger(LOGGER_NAME)
+
+
+class BloomFilter:
+    """
+    비트 배열 기반 Bloom filter (false negative 없음, false positive 는 fp_rate 수준)
+    """
+
+    def __init__(self, capacity: int, fp_rate: float):
+        capacity = max(capacity, 1)
+        self.size = max(int(-capacity * math.log(fp_rate) / (math.log(2) ** 2)), 8)
+        self.hash_count = max(int(round(self.size / capacity * math.log(2))), 1)
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value: str):
+        # double hashing: h1 + i * h2
+        digest = hashlib.blake2b(value.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, value: str):
+        for position in self._positions(value):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value: str):
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(value)
+        )
+
+
+class UserNameFilter:
+    """
+    가입된 이메일/닉네임 Bloom filter (워커 단위)
+    필터에 없으면 확실히 사용 가능, 있으면 DB EXISTS 로 재확인합니다.
+    다른 워커의 가입/변경은 updated_at 증분 폴링으로 반영되며 그 사이의 오차는 가입시 유니크 제약이 막습니다.
+    삭제/변경 전 값은 필터에서 빠지지 않으므로 주기적으로 전체 재생성합니다.
+    """
+
+    def __init__(
+        self,
+        refresh_interval: int = settings.USER_NAME_FILTER_REFRESH_INTERVAL,
+        fp_rate: float = settings.USER_NAME_FILTER_FP_RATE,
+    ):
+        self.refresh_interval = refresh_interval
+        self.fp_rate = fp_rate
+        self.full_refreshed_at: float = 0.0
+        self._emails: BloomFilter | None = None
+        self._nicknames: BloomFilter | None = None
+        self._updated_max: datetime | None = None
+
+    @property
+    def is_ready(self):
+        return self._emails is not None
+
+    def might_contain_email(self, email: str):
+        # 준비 전에는 항상 DB 확인
+        return not self.is_ready or email in self._emails
+
+    def might_contain_nickname(self, nickname: str):
+        return not self.is_ready or nickname in self._nicknames
+
+    def add(self, email: str | None = None, nickname: str | None = None):
+        if not self.is_ready:
+            return
+        if email:
+            self._emails.add(email)
+        if nickname:
+            self._nicknames.add(nickname)
+
+    async def load(self, db: AsyncSession):
+        # 전체 재생성 (예상 증가분을 고려해 2배 용량으로 생성)
+        total = await db.scalar(select(User.id).order_by(User.id.desc()).limit(1)) or 0
+        capacity = max(total * 2, 100000)
+        emails = BloomFilter(capacity, self.fp_rate)
+        nicknames = BloomFilter(capacity, self.fp_rate)
+        updated_max = None
+        result = await db.stream(select(User.email, User.nickname, User.updated_at))
+        async for email, nickname, updated_at in result:
+            if email:
+                emails.add(email)
+            if nickname:
+                nicknames.add(nickname)
+            if updated_at and (updated_max is None or updated_at > updated_max):
+                updated_max = updated_at
+        self._emails = emails
+        self._nicknames = nicknames
+        self._updated_max = updated_max
+
+    async def load_changes(self, db: AsyncSession):
+        # 마지막 갱신 이후 가입/변경된 회원만 추가
+        stmt = select(User.email, User.nickname, User.updated_at)
+        if self._updated_max is not None:
+            stmt = stmt.where(User.updated_at >= self._updated_max)
+        result = await db.execute(stmt)
+        for email, nickname, updated_at in result.all():
+            self.add(email, nickname)
+            if updated_at and (self._updated_max is None or updated_at > self._updated_max):
+                self._updated_max = updated_at
+
+    async def refresh(self, db: AsyncSession):
+        now = time.time()
+        if (
+            not self.is_ready
+            or now - self.full_refreshed_at >= settings.USER_NAME_FILTER_FULL_REFRESH_INTERVAL
+        ):
+            await self.load(db)
+            self.full_refreshed_at = now
+        else:
+            await self.load_changes(db)
+
+    async def run(self, session_factory):
+        # 백그라운드 주기 갱신
+        while True:
+            try:
+                async with session_factory() as db:
+                    await self.refresh(db)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Failed to refresh user name filter")
+            await asyncio.sleep(self.refresh_interval)
+
+
+class SearchCountCache:
+    """
+    검색 조건별 전체 건수 캐시 (워커 단위 LRU + TTL)
+    """
+
+    def __init__(
+        self,
+        max_size: int = settings.USER_SEARCH_COUNT_CACHE_SIZE,
+        ttl: int = settings.USER_SEARCH_COUNT_CACHE_TTL,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._items: OrderedDict[tuple, tuple[float, int]] = OrderedDict()
+
+    def get(self, key: tuple):
+        item = self._items.get(key)
+        if item is None:
+            return None
+        expires_at, total = item
+        if expires_at <= time.time():
+            del self._items[key]
+            return None
+        self._items.move_to_end(key)
+        return total
+
+    def set(self, key: tuple, total: int):
+        self._items[key] = (time.time() + self.ttl, total)
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+
+user_name_filter = UserNameFilter()
+user_search_count_cache = SearchCountCache()
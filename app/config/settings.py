@@ -23,6 +23,49 @@ class Settings:
     FILE_DIR = os.path.join(BASE_DIR, "static/uploads/")
     FILE_DIR_TEMP = os.path.join(FILE_DIR, "temp/")
     FILE_UPLOAD_SIZE_LIMIT = 1024 * 1024 * 30
+    # 업로드 수신시 메모리에 보관하는 최대 크기 (초과시 FILE_DIR_TEMP 임시 파일로 기록)
+    FILE_UPLOAD_SPOOL_THRESHOLD: int = int(
+        os.getenv("FILE_UPLOAD_SPOOL_THRESHOLD", 1024 * 1024)
+    )
+    # 이미지 처리(프로세스 풀), 처리 중인 요청이 MAX_PENDING 을 넘으면 503
+    IMAGE_PROCESS_POOL_SIZE: int = int(os.getenv("IMAGE_PROCESS_POOL_SIZE", 2))
+    IMAGE_SERVICE_MAX_PENDING: int = int(os.getenv("IMAGE_SERVICE_MAX_PENDING", 16))
+    # 스토리지 (s3: AWS S3, local: STORAGE_LOCAL_DIR 디스크), I/O 는 스레드 풀에서 실행
+    STORAGE_BACKEND: str = os.getenv("STORAGE_BACKEND", "s3")
+    STORAGE_LOCAL_DIR: str = os.getenv(
+        "STORAGE_LOCAL_DIR", os.path.join(FILE_DIR, "storage/")
+    )
+    STORAGE_IO_POOL_SIZE: int = int(
+        os.getenv("STORAGE_IO_POOL_SIZE", os.getenv("IMAGE_UPLOAD_POOL_SIZE", 8))
+    )
+    # THRESHOLD 초과 객체는 PART_SIZE 단위 multipart 업로드 (파트 동시 업로드 CONCURRENCY 개)
+    STORAGE_MULTIPART_THRESHOLD: int = int(
+        os.getenv("STORAGE_MULTIPART_THRESHOLD", 1024 * 1024 * 16)
+    )
+    STORAGE_MULTIPART_PART_SIZE: int = int(
+        os.getenv("STORAGE_MULTIPART_PART_SIZE", 1024 * 1024 * 8)
+    )
+    STORAGE_MULTIPART_CONCURRENCY: int = int(
+        os.getenv("STORAGE_MULTIPART_CONCURRENCY", 4)
+    )
+    STORAGE_MULTIPART_RETRIES: int = int(os.getenv("STORAGE_MULTIPART_RETRIES", 3))
+    # 외부 URL 이미지 수집 (포스터/프로필 가져오기), 동시 다운로드 CONCURRENCY 개
+    REMOTE_IMAGE_SIZE_LIMIT: int = int(
+        os.getenv("REMOTE_IMAGE_SIZE_LIMIT", 1024 * 1024 * 30)
+    )
+    REMOTE_IMAGE_TIMEOUT: int = int(os.getenv("REMOTE_IMAGE_TIMEOUT", 10))
+    REMOTE_IMAGE_POOL_SIZE: int = int(os.getenv("REMOTE_IMAGE_POOL_SIZE", 32))
+    REMOTE_IMAGE_CONCURRENCY: int = int(os.getenv("REMOTE_IMAGE_CONCURRENCY", 8))
+    # 프로필 가져오기 허용 호스트 (쉼표 구분, 비어 있으면 가져오기 불가)
+    REMOTE_IMAGE_ALLOWED_HOSTS: list = [
+        host.strip()
+        for host in os.getenv("REMOTE_IMAGE_ALLOWED_HOSTS", "").split(",")
+        if host.strip()
+    ]
+    # 프로필 이미지 변형 (너비별 x 포맷별), 기본 이미지(profile_image)는 DEFAULT_WIDTH JPEG
+    PROFILE_IMAGE_WIDTHS: list = [64, 160, 400]
+    PROFILE_IMAGE_FORMATS: list = ["WEBP", "JPEG"]
+    PROFILE_IMAGE_DEFAULT_WIDTH: int = 160
     FILE_UPLOAD_TYPE_ALLOWED = [
         "image/jpeg",
         "image/jpg",
@@ -37,6 +80,45 @@ class Settings:
     ALGORITHM: str = os.getenv("ALGORITHM")
     ACCESS_TOKEN_EXPIRE_TIME: int = os.getenv("ACCESS_TOKEN_EXPIRE_TIME")
     REFRESH_TOKEN_EXPIRE_TIME: int = os.getenv("REFRESH_TOKEN_EXPIRE_TIME")
+    # 액세스 토큰 검증 결과 캐시 (워커 단위)
+    AUTH_CACHE_SIZE: int = int(os.getenv("AUTH_CACHE_SIZE", 10000))
+    AUTH_CACHE_TTL: int = int(os.getenv("AUTH_CACHE_TTL", 300))
+    # 토큰 버전(폐기) 변경 이력 폴링 주기
+    AUTH_TOKEN_VERSION_POLL_INTERVAL: int = int(
+        os.getenv("AUTH_TOKEN_VERSION_POLL_INTERVAL", 5)
+    )
+
+    # 비밀번호 해시/검증 전용 스레드 풀 (대기 작업이 MAX_PENDING 을 넘으면 503)
+    PASSWORD_POOL_SIZE: int = int(os.getenv("PASSWORD_POOL_SIZE", 4))
+    PASSWORD_POOL_MAX_PENDING: int = int(os.getenv("PASSWORD_POOL_MAX_PENDING", 32))
+
+    # 로그인 로그 배치 기록 (버퍼가 가득 차면 drop)
+    LOGIN_LOG_BATCH_SIZE: int = int(os.getenv("LOGIN_LOG_BATCH_SIZE", 200))
+    LOGIN_LOG_FLUSH_INTERVAL: int = int(os.getenv("LOGIN_LOG_FLUSH_INTERVAL", 2))
+    LOGIN_LOG_MAX_BUFFER: int = int(os.getenv("LOGIN_LOG_MAX_BUFFER", 10000))
+
+    # 레이트 리밋 (토큰 버킷, 분당 허용 횟수)
+    # RATE_LIMIT_SHM_PATH 설정시 파일 mmap 으로 워커 간 버킷 공유 (예: /dev/shm/rvvs-ratelimit)
+    RATE_LIMIT_SHM_PATH: str = os.getenv("RATE_LIMIT_SHM_PATH")
+    RATE_LIMIT_SLOTS: int = int(os.getenv("RATE_LIMIT_SLOTS", 65536))
+    # 슬롯 해시 비밀 키 (워커 간 공유를 위해 모든 워커가 같은 값 사용, 기본값 SECRET_KEY)
+    RATE_LIMIT_SECRET: str = os.getenv("RATE_LIMIT_SECRET", os.getenv("SECRET_KEY"))
+    RATE_LIMIT_LOGIN_IP: int = int(os.getenv("RATE_LIMIT_LOGIN_IP", 30))
+    RATE_LIMIT_LOGIN_EMAIL: int = int(os.getenv("RATE_LIMIT_LOGIN_EMAIL", 10))
+    RATE_LIMIT_VIDEO_VIEW_IP: int = int(os.getenv("RATE_LIMIT_VIDEO_VIEW_IP", 120))
+
+    # 가입된 이메일/닉네임 Bloom filter (중복 확인 fast path)
+    USER_NAME_FILTER_REFRESH_INTERVAL: int = int(
+        os.getenv("USER_NAME_FILTER_REFRESH_INTERVAL", 5)
+    )
+    USER_NAME_FILTER_FULL_REFRESH_INTERVAL: int = int(
+        os.getenv("USER_NAME_FILTER_FULL_REFRESH_INTERVAL", 3600)
+    )
+    USER_NAME_FILTER_FP_RATE: float = float(os.getenv("USER_NAME_FILTER_FP_RATE", 0.01))
+
+    # 회원 검색 조건별 전체 건수 캐시
+    USER_SEARCH_COUNT_CACHE_SIZE: int = int(os.getenv("USER_SEARCH_COUNT_CACHE_SIZE", 1000))
+    USER_SEARCH_COUNT_CACHE_TTL: int = int(os.getenv("USER_SEARCH_COUNT_CACHE_TTL", 60))
 
     # USER
     # 10: email, 11: google, 12: facebook, 13: kakao, 14: naver, 15: apple
@@ -68,7 +150,45 @@ class Settings:
     AWS_S3_BUCKET_NAME: str = os.getenv("AWS_S3_BUCKET_NAME")
     AWS_S3_ACCESS_KEY_ID: str = os.getenv("AWS_S3_ACCESS_KEY_ID")
     AWS_S3_SECRET_ACCESS_KEY: str = os.getenv("AWS_S3_SECRET_ACCESS_KEY")
+    # S3 호환 스토리지 사용시 (MinIO, LocalStack 등)
+    AWS_S3_ENDPOINT_URL: str = os.getenv("AWS_S3_ENDPOINT_URL")
     AWS_S3_PATH_USER_PROFILE_IMAGE = "users/profile/images/"
+    # 클라이언트 직접 업로드(presigned POST) 원본 임시 경로
+    # 처리에 실패했거나 complete 를 호출하지 않은 원본은 앱에서 삭제하지 않으므로
+    # 이 prefix 에 만료 수명 주기 규칙 필수 (complete 재요청 여유를 두고 1일 권장)
+    #   S3: aws s3api put-bucket-lifecycle-configuration --bucket <bucket> --lifecycle-configuration
+    #       '{"Rules": [{"ID": "profile-uploads", "Status": "Enabled",
+    #         "Filter": {"Prefix": "users/profile/uploads/"}, "Expiration": {"Days": 1},
+    #         "AbortIncompleteMultipartUpload": {"DaysAfterInitiation": 1}}]}'
+    #   MinIO: mc ilm rule add --prefix "users/profile/uploads/" --expire-days 1 <alias>/<bucket>
+    AWS_S3_PATH_USER_PROFILE_UPLOAD = "users/profile/uploads/"
+    # 외부 URL 에서 가져온 원본 경로 (내용 해시 키, 같은 이미지는 한 번만 저장)
+    AWS_S3_PATH_USER_PROFILE_IMPORT = "users/profile/imports/"
+    AWS_S3_PRESIGNED_UPLOAD_EXPIRE: int = int(
+        os.getenv("AWS_S3_PRESIGNED_UPLOAD_EXPIRE", 600)
+    )
+    # 워커 단위 공유 S3 client 커넥션 풀 (업로드 스레드 풀보다 크게 설정)
+    AWS_S3_MAX_POOL_CONNECTIONS: int = int(
+        os.getenv("AWS_S3_MAX_POOL_CONNECTIONS", 32)
+    )
+    AWS_S3_CONNECT_TIMEOUT: int = int(os.getenv("AWS_S3_CONNECT_TIMEOUT", 5))
+    AWS_S3_READ_TIMEOUT: int = int(os.getenv("AWS_S3_READ_TIMEOUT", 30))
+    AWS_S3_MAX_ATTEMPTS: int = int(os.getenv("AWS_S3_MAX_ATTEMPTS", 3))
+
+    # CATALOG (비디오 목록 메모리 인덱스)
+    CATALOG_REFRESH_INTERVAL: int = int(os.getenv("CATALOG_REFRESH_INTERVAL", 60))
+    # 링크 테이블까지 포함한 전체 갱신 주기 (그 사이에는 카운터 변경분만 반영)
+    CATALOG_FULL_REFRESH_INTERVAL: int = int(
+        os.getenv("CATALOG_FULL_REFRESH_INTERVAL", 600)
+    )
+    # 설정 시 빌더 프로세스가 기록한 스냅샷을 워커들이 mmap 으로 공유 (예: /dev/shm/rvvs_catalog.bin)
+    CATALOG_SNAPSHOT_PATH: str = os.getenv("CATALOG_SNAPSHOT_PATH")
+    CATALOG_SNAPSHOT_POLL_INTERVAL: int = int(
+        os.getenv("CATALOG_SNAPSHOT_POLL_INTERVAL", 5)
+    )
+
+    # 장르 목록 스냅샷 유지 시간
+    GENRE_CACHE_TTL: int = int(os.getenv("GENRE_CACHE_TTL", 60))
 
     # THUMBNAIL
     THUMBNAIL_BASE_URL: str = os.getenv("THUMBNAIL_BASE_URL")
@@ -18,6 +18,13 @@ messages["ACCESS_TOKEN_FOUND"] = "토큰은 찾았습니다."
 messages["ACCESS_TOKEN_EXPIRED"] = "토근이 만료되었습니다."
 messages["ACCESS_TOKEN_INVALID"] = "유효하지 않은 토큰입니다."
 messages["ACCESS_TOKEN_REQUIRE"] = "토큰은 필수 입력사항 입니다."
+messages["TOO_MANY_REQUESTS"] = "요청이 너무 많습니다. 잠시 후 다시 시도해 주세요."
+messages["IMAGE_SERVICE_BUSY"] = "이미지 처리 요청이 많습니다. 잠시 후 다시 시도해 주세요."
+messages["PASSWORD_SERVICE_BUSY"] = "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해 주세요."
+messages["REFRESH_TOKEN_SUCC"] = "토큰이 갱신되었습니다."
+messages["REFRESH_TOKEN_INVALID"] = "유효하지 않은 리프레시 토큰입니다."
+messages["REFRESH_TOKEN_REUSED"] = "이미 사용된 리프레시 토큰입니다. 다시 로그인해 주세요."
+messages["ACCESS_TOKEN_REVOKED"] = "더 이상 사용할 수 없는 토큰입니다. 다시 로그인해 주세요."
 
 messages["USER_LOGIN_SUCC"] = "로그인에 성공하였습니다."
 messages["USER_LOGIN_FAIL"] = "로그인에 실패하였습니다."
@@ -59,6 +66,9 @@ messages["USER_UPDATE_PROFILE_FAIL"] = "프로필 업데이트에 실패했습
 messages["USER_UPDATE_PROFILE_NOT_FOUND"] = "프로필을 찾을 수 없습니다."
 messages["USER_UPDATE_PROFILE_IMAGE_SUCC"] = "프로필 이미지 업데이트에 성공했습니다."
 messages["USER_UPDATE_PROFILE_IMAGE_FAIL"] = "프로필 이미지 업데이트에 실패했습니다."
+messages["USER_UPDATE_PROFILE_IMAGE_ACCEPTED"] = "프로필 이미지가 처리 중입니다."
+messages["USER_PROFILE_IMAGE_UPLOAD_URL_SUCC"] = "프로필 이미지 업로드 URL이 생성되었습니다."
+messages["USER_PROFILE_IMAGE_UPLOAD_URL_FAIL"] = "프로필 이미지 업로드 URL 생성에 실패했습니다."
 messages["USER_UPDATE_PROFILE_IMAGE_NOT_FOUND"] = "프로필 이미지를 찾을 수 없습니다."
 messages["USER_UPDATE_PROFILE_TEXT_SUCC"] = "프로필 이미지 업데이트에 성공했습니다."
 messages["USER_UPDATE_PROFILE_TEXT_FAIL"] = "프로필 이미지 업데이트에 실패했습니다."
@@ -121,10 +131,14 @@ messages["INVALID_PARAM_PAGE_SIZE"] = "유효하지 않은 페이지 크기입
 messages["INVALID_PARAM_KEYWORD"] = "유효하지 않은 검색어입니다."
 messages["INVALID_PARAM_TYPE"] = "유효하지 않은 타입입니다."
 messages["INVALID_PARAM_ORDER_BY"] = "유효하지 않은 정렬 조건입니다."
+messages["INVALID_PARAM_FILTER"] = "유효하지 않은 필터 조건입니다."
 messages["INVALID_PARAM_VIDEO_ID"] = "유효하지 않은 비디오 ID입니다."
 messages["INVALID_PARAM_REVIEW_ID"] = "유효하지 않은 리뷰 ID입니다."
 messages["INVALID_PARAM_USER_ID"] = "유효하지 않은 유저 ID입니다."
 messages["INVALID_PARAM_RATING"] = "유효하지 않은 평점입니다."
+messages["INVALID_PARAM_ACTOR_ID"] = "유효하지 않은 배우 ID입니다."
+messages["INVALID_PARAM_STAFF_ID"] = "유효하지 않은 스태프 ID입니다."
+messages["INVALID_PARAM_CURSOR"] = "유효하지 않은 커서입니다."
 
 messages["VIDEO_NOT_FOUND"] = "비디오를 찾을 수 없습니다."
 messages["VIDEO_CREATE_SUCC"] = "컨텐츠 생성에 성공하였습니다."
@@ -142,6 +156,12 @@ messages["VIDEO_LIKE_UPDATE_SUCC"] = "컨텐츠 좋아요를 갱신하였습니
 messages["VIDEO_LIKE_UPDATE_FAIL"] = "컨텐츠 좋아요 갱신에 실패하였습니다."
 messages["VIDEO_MYINFO_READ_SUCC"] = "내 컨텐츠 조회에 성공하였습니다."
 
+messages["GENRE_READ_SUCC"] = "장르 목록 조회에 성공하였습니다."
+messages["ACTOR_NOT_FOUND"] = "배우를 찾을 수 없습니다."
+messages["ACTOR_READ_SUCC"] = "배우 조회에 성공하였습니다."
+messages["STAFF_NOT_FOUND"] = "스태프를 찾을 수 없습니다."
+messages["STAFF_READ_SUCC"] = "스태프 조회에 성공하였습니다."
+
 messages["REVIEW_READ_LIST_SUCC"] = "리뷰 조회에 성공하였습니다."
 messages["REVIEW_CREATE_SUCC"] = "리뷰 등록에 성공했습니다."
 messages["REVIEW_CREATE_FAIL"] = "리뷰 등록에 실패했습니다."
@@ -1,4 +1,5 @@
 from datetime import datetime
+from sqlalchemy import JSON, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -17,3 +18,21 @@ class AccessLog(Base):
     created_at: Mapped[datetime] = mapped_column(
         server_default=func.now(), default=func.now()
     )
+
+
+class ImageHash(Base):
+    # 업로드 이미지 내용 해시 인덱스 (같은 내용은 재처리/재업로드 없이 기존 키 재사용)
+    __tablename__ = "rvvs_image_hash"
+    __table_args__ = (UniqueConstraint("hash", "kind"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    hash: Mapped[str] = mapped_column(nullable=False)
+    kind: Mapped[str] = mapped_column(nullable=False)
+    url: Mapped[str] = mapped_column(nullable=False)
+    variants: Mapped[dict] = mapped_column(JSON, nullable=True)
+    width: Mapped[int] = mapped_column(nullable=True)
+    height: Mapped[int] = mapped_column(nullable=True)
+    size: Mapped[int] = mapped_column(nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        server_default=func.now(), default=func.now()
+    )
@@ -1,9 +1,13 @@
 from datetime import datetime
 from sqlalchemy import (
+    DDL,
     Column,
     Integer,
+    event,
     func,
     ForeignKey,
+    Index,
+    JSON,
     Table,
 )
 from typing import List
@@ -20,13 +24,29 @@ user_favorite_list = Table(
 
 class User(Base):
     __tablename__ = "rvvs_user"
+    __table_args__ = (
+        # 닉네임 검색용 인덱스 (3자 이상 부분 일치: pg_trgm, 3자 미만 접두어 일치: text_pattern_ops)
+        Index(
+            "ix_rvvs_user_nickname_trgm",
+            "nickname",
+            postgresql_using="gin",
+            postgresql_ops={"nickname": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_rvvs_user_nickname_pattern",
+            "nickname",
+            postgresql_ops={"nickname": "text_pattern_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     code: Mapped[str]
     email: Mapped[str] = mapped_column(unique=True, index=True)
     password: Mapped[str] = mapped_column(nullable=True)
-    nickname: Mapped[str] = mapped_column(nullable=True)
+    nickname: Mapped[str] = mapped_column(nullable=True, unique=True, index=True)
     profile_image: Mapped[str] = mapped_column(nullable=True)
+    # 프로필 이미지 변형 키 ({"64_webp": key, "160_jpeg": key, ...})
+    profile_image_variants: Mapped[dict] = mapped_column(JSON, nullable=True)
     profile_text: Mapped[str] = mapped_column(nullable=True)
     birth_year: Mapped[int] = mapped_column(nullable=True)
     level: Mapped[int] = mapped_column(default=0)
@@ -41,6 +61,8 @@ class User(Base):
     is_terms_agree: Mapped[bool] = mapped_column(default=False)
     is_age_agree: Mapped[bool] = mapped_column(default=False)
     is_marketing_agree: Mapped[bool] = mapped_column(default=False)
+    # 비밀번호 변경, 차단, 비활성화, 탈퇴시 증가 (이전 버전으로 발급된 토큰 무효화)
+    token_version: Mapped[int] = mapped_column(default=0)
     created_at: Mapped[datetime] = mapped_column(
         server_default=func.now(), default=func.now()
     )
@@ -52,6 +74,38 @@ class User(Base):
     )
 
 
+# 차단/비활성화시 토큰 버전 증가 (관리 도구, DB 직접 변경 등 경로와 무관하게 기존 토큰 폐기)
+# 같은 UPDATE 에서 token_version 을 이미 변경한 경우는 제외
+user_status_revoke_ddl = (
+    DDL(
+        """
+        CREATE OR REPLACE FUNCTION rvvs_user_status_revoke() RETURNS trigger AS $$
+        BEGIN
+            NEW.token_version := OLD.token_version + 1;
+            INSERT INTO rvvs_user_token_revoke (user_id, token_version, created_at)
+            VALUES (NEW.id, NEW.token_version, now());
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    ),
+    DDL(
+        """
+        CREATE TRIGGER rvvs_user_status_revoke
+        BEFORE UPDATE OF is_block, is_active ON rvvs_user
+        FOR EACH ROW
+        WHEN (
+            ((NEW.is_block AND NOT OLD.is_block) OR (OLD.is_active AND NOT NEW.is_active))
+            AND NEW.token_version = OLD.token_version
+        )
+        EXECUTE FUNCTION rvvs_user_status_revoke()
+        """
+    ),
+)
+for ddl in user_status_revoke_ddl:
+    event.listen(User.__table__, "after_create", ddl.execute_if(dialect="postgresql"))
+
+
 class UserFavorite(Base):
     __tablename__ = "rvvs_user_favorite"
 
@@ -81,3 +135,32 @@ class UserLoginLog(Base):
     created_at: Mapped[datetime] = mapped_column(
         server_default=func.now(), default=func.now()
     )
+
+
+class UserTokenRevoke(Base):
+    # 토큰 버전 변경 이력 (워커들의 토큰 버전 맵 갱신용 change feed)
+    __tablename__ = "rvvs_user_token_revoke"
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(nullable=False, index=True)
+    token_version: Mapped[int] = mapped_column(nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        server_default=func.now(), default=func.now()
+    )
+
+
+class UserTokenFamily(Base):
+    # 리프레시 토큰 패밀리 (로그인 1회 = 패밀리 1개, 리프레시 할 때마다 current_jti 교체)
+    __tablename__ = "rvvs_user_token_family"
+
+    family_id: Mapped[str] = mapped_column(primary_key=True)
+    user_id: Mapped[int] = mapped_column(nullable=False, index=True)
+    current_jti: Mapped[str] = mapped_column(nullable=False)
+    is_revoked: Mapped[bool] = mapped_column(default=False)
+    expires_at: Mapped[datetime] = mapped_column(nullable=False, index=True)
+    created_at: Mapped[datetime] = mapped_column(
+        server_default=func.now(), default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        server_default=func.now(), onupdate=func.now()
+    )
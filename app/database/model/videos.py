@@ -4,6 +4,7 @@ from sqlalchemy import (
     Table,
     ForeignKey,
     Column,
+    Index,
     Integer,
 )
 from sqlalchemy.sql import func
@@ -172,6 +173,10 @@ class VideoGenre(Base):
 
 class VideoActor(Base):
     __tablename__ = "rvvs_video_actor"
+    __table_args__ = (
+        # 배우 필모그래피 조회용 커버링 인덱스
+        Index("ix_rvvs_video_actor_actor_id_video_id", "actor_id", "video_id"),
+    )
 
     code: Mapped[str] = mapped_column(nullable=True)
     role: Mapped[str] = mapped_column(nullable=True)
@@ -186,6 +191,10 @@ class VideoActor(Base):
 
 class VideoStaff(Base):
     __tablename__ = "rvvs_video_staff"
+    __table_args__ = (
+        # 스태프 필모그래피 조회용 커버링 인덱스
+        Index("ix_rvvs_video_staff_staff_id_video_id", "staff_id", "video_id"),
+    )
 
     code: Mapped[str] = mapped_column(nullable=True)
     video_id: Mapped[int] = mapped_column(
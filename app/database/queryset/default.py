@@ -0,0 +1,57 @@
+from fastapi import HTTPException, status
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.config.variables import messages
+from app.database.model.default import ImageHash
+
+
+async def read_image_hash(db: AsyncSession, hash: str, kind: str):
+    try:
+        result = await db.execute(
+            select(ImageHash.url, ImageHash.variants).where(
+                ImageHash.hash == hash, ImageHash.kind == kind
+            )
+        )
+        return result.mappings().first()
+    except Exception as e:
+        print(e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=messages["EXCEPTION"],
+            headers={"code": "EXCEPTION"},
+        )
+
+
+async def create_image_hash(
+    db: AsyncSession,
+    hash: str,
+    kind: str,
+    url: str,
+    variants: dict | None,
+    width: int | None,
+    height: int | None,
+    size: int | None,
+):
+    # 같은 이미지가 동시에 처리된 경우 먼저 기록된 행 유지 (키가 같으므로 결과 동일)
+    try:
+        await db.execute(
+            insert(ImageHash)
+            .values(
+                hash=hash,
+                kind=kind,
+                url=url,
+                variants=variants,
+                width=width,
+                height=height,
+                size=size,
+            )
+            .on_conflict_do_nothing(index_elements=["hash", "kind"])
+        )
+        await db.commit()
+        return True
+    except Exception as e:
+        print(e)
+        await db.rollback()
+        return False
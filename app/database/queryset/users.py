@@ -1,22 +1,88 @@
+import re
+from datetime import datetime
 from fastapi import HTTPException, status
 from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.sql.expression import insert, update, delete, exists
 
+from app.cache.auth import token_versions
+from app.cache.users import user_name_filter, user_search_count_cache
 from app.config.variables import messages
-from app.database.model.users import User, UserLoginLog
-from app.database.schema.users import UserMe, ReqUserCreate, ReqUserUpdate
+from app.database.model.users import (
+    User,
+    UserLoginLog,
+    UserTokenRevoke,
+    UserTokenFamily,
+)
+from app.database.schema.users import (
+    UserMe,
+    UserProfile,
+    ReqUserCreate,
+    ReqUserUpdate,
+)
+
+
+# UPDATE ... RETURNING 으로 ResUserMe 를 바로 만들기 위한 컬럼
+USER_ME_COLUMNS = [getattr(User, field) for field in UserMe.model_fields]
+# 회원 검색 결과(UserProfile) 컬럼 (favorite selectin 로딩 없음)
+USER_PROFILE_COLUMNS = [getattr(User, field) for field in UserProfile.model_fields]
+
+
+# 유니크 제약 컬럼 -> 중복 코드
+UNIQUE_VIOLATION_CODES = {
+    "nickname": "VALID_NICK_ALREADY_EXIST",
+    "email": "VALID_EMAIL_ALREADY_EXIST",
+}
+
+
+def get_unique_violation_code(e: IntegrityError):
+    # 유니크 제약 위반 -> 중복 코드
+    # 제약/인덱스 이름으로 판별하고, 없을 때만 에러 상세의 "Key (컬럼)=" 에서 컬럼명 추출
+    # (에러 메시지 전체에는 입력값이 포함되므로 전체 문자열로 판별하지 않음)
+    cause = getattr(e.orig, "__cause__", None)
+    constraint_name = getattr(cause, "constraint_name", None)
+    if constraint_name:
+        for column, code in UNIQUE_VIOLATION_CODES.items():
+            if column in constraint_name:
+                return code
+        return None
+    matched = re.search(r"Key \((\w+)\)=", str(e.orig))
+    if matched:
+        return UNIQUE_VIOLATION_CODES.get(matched.group(1))
+    return None
+
+
+def raise_unique_violation(e: IntegrityError):
+    code = get_unique_violation_code(e)
+    if not code:
+        print(e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=messages["EXCEPTION"],
+            headers={"code": "EXCEPTION"},
+        )
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=messages[code],
+        headers={"code": code},
+    )
 
 
 async def create_user(db: AsyncSession, user: ReqUserCreate):
+    # 중복 체크 없이 INSERT 1회, 이메일/닉네임 중복은 유니크 제약 위반으로 판별
     try:
-        created_user = await db.scalar(insert(User).returning(User), user.model_dump())
-        if created_user:
+        user_id = await db.scalar(insert(User).values(**user.model_dump()).returning(User.id))
+        if user_id:
             await db.commit()
-            return True
+            user_name_filter.add(user.email, user.nickname)
+            return user_id
         else:
-            return False
+            return None
+    except IntegrityError as e:
+        await db.rollback()
+        raise_unique_violation(e)
     except Exception as e:
         print(e)
         raise HTTPException(
@@ -33,28 +99,45 @@ async def read_user(
     user_id: int = 0,
     email: str = None,
     nickname: str = None,
-    order_by: str = None,
+    cursor: int = None,
+    with_total: bool = True,
 ):
-    unit_per_page = page_size
-    offset = (page - 1) * unit_per_page
+    # 조건은 모두 AND 로 조합, cursor(마지막 id) 가 있으면 page 대신 keyset 페이지네이션
+    # 반환: (total: with_total=False 면 None, users, next_cursor)
+    conditions = []
+    if user_id:
+        conditions.append(User.id == user_id)
+    if email:
+        conditions.append(User.email == email)
+    if nickname:
+        # 3자 이상은 부분 일치 (trigram 인덱스), 미만은 접두어 일치 (pattern 인덱스)
+        if len(nickname) >= 3:
+            conditions.append(User.nickname.contains(nickname, autoescape=True))
+        else:
+            conditions.append(User.nickname.startswith(nickname, autoescape=True))
 
     try:
-        stmt = select(User)
-        if user_id:
-            stmt = stmt.filter_by(id=user_id)
-        elif email:
-            stmt = stmt.filter_by(email=email)
-        elif nickname:
-            stmt = stmt.filter(User.nickname.contains(nickname, autoescape=True))
-        elif order_by is not None:
-            stmt = stmt.order_by(order_by)
-        # total
-        total = await db.scalar(select(func.count(User.id)).select_from(User))
+        # total (조건별 캐시)
+        total = None
+        if with_total:
+            cache_key = (user_id, email, nickname)
+            total = user_search_count_cache.get(cache_key)
+            if total is None:
+                total = await db.scalar(
+                    select(func.count(User.id)).where(*conditions)
+                )
+                user_search_count_cache.set(cache_key, total)
         # users
-        result = await db.execute(stmt.offset(offset).limit(unit_per_page))
-        users = result.scalars().all()
+        stmt = select(*USER_PROFILE_COLUMNS).where(*conditions).order_by(User.id)
+        if cursor is not None:
+            stmt = stmt.where(User.id > cursor)
+        else:
+            stmt = stmt.offset((page - 1) * page_size)
+        result = await db.execute(stmt.limit(page_size))
+        users = [dict(row._mapping) for row in result.all()]
+        next_cursor = users[-1]["id"] if len(users) == page_size else None
         # 결과 리턴
-        return total, users
+        return total, users, next_cursor
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -93,15 +176,57 @@ async def read_user_by_id(db: AsyncSession, user_id: int):
         )
 
 
+async def read_user_auth_by_id(db: AsyncSession, user_id: int):
+    # 토큰 검증용 최소 회원 정보 (favorite selectin 로딩 없음)
+    try:
+        result = await db.execute(
+            select(User.id, User.email, User.is_active, User.is_block).filter_by(
+                id=user_id
+            )
+        )
+        user = result.first()
+        return dict(user._mapping) if user else None
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=messages["EXCEPTION"],
+            headers={"code": "EXCEPTION"},
+        )
+
+
 async def update_user(db: AsyncSession, user_id: int, user: ReqUserUpdate):
+    # 변경된 회원 정보(UserMe 컬럼) 반환, 회원이 없으면 None
     user_data = {
         k: v for k, v in user.model_dump().items() if v is not None and v != ""
     }
     try:
-        stmt = update(User).where(User.id == user_id).values(**user_data)
-        await db.execute(stmt)
+        if not user_data:
+            result = await db.execute(select(*USER_ME_COLUMNS).filter_by(id=user_id))
+            row = result.first()
+            return dict(row._mapping) if row else None
+        # 비밀번호 변경시 기존 토큰 폐기
+        if "password" in user_data:
+            user_data["token_version"] = User.token_version + 1
+        result = await db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(**user_data)
+            .returning(*USER_ME_COLUMNS, User.token_version)
+        )
+        row = result.first()
+        if row is None:
+            await db.rollback()
+            return None
+        if "password" in user_data:
+            await insert_user_token_revoke(db, user_id, row.token_version)
         await db.commit()
-        return True
+        if "password" in user_data:
+            token_versions.set(user_id, row.token_version)
+        user_name_filter.add(nickname=row.nickname)
+        return {column.key: row._mapping[column.key] for column in USER_ME_COLUMNS}
+    except IntegrityError as e:
+        await db.rollback()
+        raise_unique_violation(e)
     except Exception as e:
         print(e)
         raise HTTPException(
@@ -111,14 +236,29 @@ async def update_user(db: AsyncSession, user_id: int, user: ReqUserUpdate):
         )
 
 
+async def insert_user_token_revoke(db: AsyncSession, user_id: int, token_version: int):
+    # 토큰 버전 변경 이력 기록 (commit 은 호출하는 쪽에서)
+    await db.execute(
+        insert(UserTokenRevoke).values(user_id=user_id, token_version=token_version)
+    )
+
+
 async def update_user_password(db: AsyncSession, user_id: int, password: str):
     try:
-        get_user = await db.scalar(select(User).filter_by(id=user_id))
-        if get_user:
-            setattr(get_user, "password", password)
-            await db.commit()
-            return True
-        return False
+        # 비밀번호 변경시 기존 토큰 폐기
+        token_version = await db.scalar(
+            update(User)
+            .where(User.id == user_id)
+            .values(password=password, token_version=User.token_version + 1)
+            .returning(User.token_version)
+        )
+        if token_version is None:
+            await db.rollback()
+            return False
+        await insert_user_token_revoke(db, user_id, token_version)
+        await db.commit()
+        token_versions.set(user_id, token_version)
+        return True
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -129,11 +269,18 @@ async def update_user_password(db: AsyncSession, user_id: int, password: str):
 
 async def update_user_nickname(db: AsyncSession, user_id: int, nickname: str):
     try:
-        await db.execute(
-            update(User).where(User.id == user_id).values(nickname=nickname)
+        updated_id = await db.scalar(
+            update(User)
+            .where(User.id == user_id)
+            .values(nickname=nickname)
+            .returning(User.id)
         )
         await db.commit()
-        return True
+        user_name_filter.add(nickname=nickname)
+        return updated_id is not None
+    except IntegrityError as e:
+        await db.rollback()
+        raise_unique_violation(e)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -144,11 +291,14 @@ async def update_user_nickname(db: AsyncSession, user_id: int, nickname: str):
 
 async def update_user_profile_text(db: AsyncSession, user_id: int, profile_text: str):
     try:
-        await db.execute(
-            update(User).where(User.id == user_id).values(profile_text=profile_text)
+        updated_id = await db.scalar(
+            update(User)
+            .where(User.id == user_id)
+            .values(profile_text=profile_text)
+            .returning(User.id)
         )
         await db.commit()
-        return True
+        return updated_id is not None
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -157,13 +307,24 @@ async def update_user_profile_text(db: AsyncSession, user_id: int, profile_text:
         )
 
 
-async def update_user_profile_image(db: AsyncSession, user_id: int, profile_image: str):
+async def update_user_profile_image(
+    db: AsyncSession,
+    user_id: int,
+    profile_image: str,
+    profile_image_variants: dict | None = None,
+):
     try:
-        await db.execute(
-            update(User).where(User.id == user_id).values(profile_image=profile_image)
+        updated_id = await db.scalar(
+            update(User)
+            .where(User.id == user_id)
+            .values(
+                profile_image=profile_image,
+                profile_image_variants=profile_image_variants,
+            )
+            .returning(User.id)
         )
         await db.commit()
-        return True
+        return updated_id is not None
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -176,13 +337,14 @@ async def update_user_marketing(
     db: AsyncSession, user_id: int, is_marketing_agree: bool
 ):
     try:
-        await db.execute(
+        updated_id = await db.scalar(
             update(User)
             .where(User.id == user_id)
             .values(is_marketing_agree=is_marketing_agree)
+            .returning(User.id)
         )
         await db.commit()
-        return True
+        return updated_id is not None
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -194,10 +356,97 @@ async def update_user_marketing(
 async def delete_user(db: AsyncSession, user_id: int):
     try:
         # TODO: 바로 삭제 할 지 is_delete=True로 변경 후 일정 기간 후 삭제할 지 고민 필요
-        await db.execute(delete(User).where(User.id == user_id))
+        token_version = await db.scalar(
+            delete(User).where(User.id == user_id).returning(User.token_version)
+        )
+        # 탈퇴시 기존 토큰 폐기
+        if token_version is not None:
+            await insert_user_token_revoke(db, user_id, token_version + 1)
+        await db.commit()
+        if token_version is not None:
+            token_versions.set(user_id, token_version + 1)
+        return True
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=messages["EXCEPTION"],
+            headers={"code": "EXCEPTION"},
+        )
+
+
+async def create_user_token_family(
+    db: AsyncSession, family_id: str, user_id: int, token_id: str, expires_at: datetime
+):
+    try:
+        await db.execute(
+            insert(UserTokenFamily).values(
+                family_id=family_id,
+                user_id=user_id,
+                current_jti=token_id,
+                expires_at=expires_at,
+            )
+        )
+        await db.commit()
+        return True
+    except Exception as e:
+        print(e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=messages["EXCEPTION"],
+            headers={"code": "EXCEPTION"},
+        )
+
+
+async def rotate_user_token_family(
+    db: AsyncSession, family_id: str, token_id: str, new_token_id: str
+):
+    # 현재 토큰(jti)이 일치하고 폐기/만료되지 않은 경우에만 새 토큰으로 교체 (PK 조회 1회)
+    # 같은 문장에서 회원 상태(id, email, token_version, is_active, is_block)를 함께 반환, 교체 실패시 None
+    try:
+        user_table = User.__table__
+        result = await db.execute(
+            update(UserTokenFamily)
+            .where(
+                UserTokenFamily.family_id == family_id,
+                UserTokenFamily.current_jti == token_id,
+                UserTokenFamily.is_revoked.is_(False),
+                UserTokenFamily.expires_at > datetime.now(),
+                User.id == UserTokenFamily.user_id,
+            )
+            .values(current_jti=new_token_id)
+            # ORM 속성으로 지정하면 다른 테이블 컬럼이 RETURNING 에서 빠지므로 테이블 컬럼 사용
+            .returning(
+                user_table.c.id,
+                user_table.c.email,
+                user_table.c.token_version,
+                user_table.c.is_active,
+                user_table.c.is_block,
+            )
+        )
+        user = result.first()
+        await db.commit()
+        return dict(user._mapping) if user else None
+    except Exception as e:
+        print(e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=messages["EXCEPTION"],
+            headers={"code": "EXCEPTION"},
+        )
+
+
+async def revoke_user_token_family(db: AsyncSession, family_id: str):
+    # 이미 사용된 리프레시 토큰이 재사용된 경우 패밀리 전체 폐기
+    try:
+        await db.execute(
+            update(UserTokenFamily)
+            .where(UserTokenFamily.family_id == family_id)
+            .values(is_revoked=True)
+        )
         await db.commit()
         return True
     except Exception as e:
+        print(e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=messages["EXCEPTION"],
@@ -205,6 +454,18 @@ async def delete_user(db: AsyncSession, user_id: int):
         )
 
 
+async def delete_expired_user_token_family(db: AsyncSession):
+    try:
+        await db.execute(
+            delete(UserTokenFamily).where(UserTokenFamily.expires_at <= datetime.now())
+        )
+        await db.commit()
+        return True
+    except Exception as e:
+        print(e)
+        return False
+
+
 async def verify_exist_email(db: AsyncSession, email: str):
     try:
         user = await db.scalar(select(exists().where(User.email == email)))
@@ -219,6 +480,18 @@ async def verify_exist_email(db: AsyncSession, email: str):
         )
 
 
+async def read_user_code_by_email(db: AsyncSession, email: str):
+    # 이메일 중복 확인용 (회원 유형 코드만 조회)
+    try:
+        return await db.scalar(select(User.code).filter_by(email=email))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=messages["EXCEPTION"],
+            headers={"code": "EXCEPTION"},
+        )
+
+
 async def verify_exist_nickname(db: AsyncSession, nickname: str):
     try:
         user = await db.scalar(select(exists().where(User.nickname == nickname)))
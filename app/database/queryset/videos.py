@@ -4,12 +4,16 @@ from sqlalchemy import func, desc
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.sql.expression import insert, update, delete
-from sqlalchemy.orm import aliased
+from sqlalchemy.orm import aliased, noload
 
+from app.cache.catalog import video_catalog
 from app.config.variables import messages
 from app.database.model.videos import (
     Video,
     Genre,
+    VideoGenre,
+    VideoActor,
+    VideoStaff,
     Actor,
     Staff,
     VideoViewLog,
@@ -27,9 +31,10 @@ async def search_video_list(
     video_code: str | None = None,
     keyword: str | None = None,
     video_id: int | None = None,
-    actor_id: int | None = None,
-    staff_id: int | None = None,
-    genre_id: int | None = None,
+    actor_ids: list[int] | None = None,
+    staff_ids: list[int] | None = None,
+    genre_ids: list[int] | None = None,
+    match_all: bool = False,
     is_delete: bool = False,
     is_confirm: bool = True,
     order_by: str | None = None,
@@ -38,6 +43,27 @@ async def search_video_list(
     offset = (page - 1) * unit_per_page
 
     try:
+        # 메모리 인덱스로 처리 가능한 경우 최종 페이지만 DB 조회
+        if (
+            video_code is None
+            and keyword is None
+            and video_id is None
+            and video_catalog.supports(order_by)
+        ):
+            total, page_ids = video_catalog.search(
+                genre_ids=genre_ids,
+                actor_ids=actor_ids,
+                staff_ids=staff_ids,
+                match_all=match_all,
+                is_delete=is_delete,
+                is_confirm=is_confirm,
+                order_by=order_by,
+                offset=offset,
+                limit=unit_per_page,
+            )
+            videos = await read_video_list_by_ids(db, page_ids)
+            return total, videos
+
         stmt = select(Video)
         if video_id is not None:
             stmt = stmt.filter_by(id=video_id)
@@ -49,12 +75,25 @@ async def search_video_list(
             stmt = stmt.filter_by(is_confirm=is_confirm)
         if keyword is not None:
             stmt = stmt.filter(Video.title.contains(keyword, autoescape=True))
-        if actor_id is not None:
-            stmt = stmt.join(Video.actor).filter_by(id=actor_id)
-        if staff_id is not None:
-            stmt = stmt.join(Video.staff).filter_by(id=staff_id)
-        if genre_id is not None:
-            stmt = stmt.join(Video.genre).filter_by(id=genre_id)
+        # 다중 필터는 JOIN 대신 세미조인으로 처리 (중복 행 방지)
+        for link_column, link_video_column, ids in (
+            (VideoActor.actor_id, VideoActor.video_id, actor_ids),
+            (VideoStaff.staff_id, VideoStaff.video_id, staff_ids),
+            (VideoGenre.genre_id, VideoGenre.video_id, genre_ids),
+        ):
+            if not ids:
+                continue
+            if match_all:
+                for link_id in ids:
+                    stmt = stmt.filter(
+                        Video.id.in_(
+                            select(link_video_column).where(link_column == link_id)
+                        )
+                    )
+            else:
+                stmt = stmt.filter(
+                    Video.id.in_(select(link_video_column).where(link_column.in_(ids)))
+                )
         if order_by is not None:
             if order_by == "view_desc":
                 stmt = stmt.order_by(Video.view_count.desc())
@@ -66,7 +105,7 @@ async def search_video_list(
                 stmt = stmt.order_by(Video.like_count.asc())
             elif order_by == "new_desc":
                 stmt = stmt.order_by(Video.created_at.desc())
-            elif order_by == "new_desc":
+            elif order_by == "new_asc":
                 stmt = stmt.order_by(Video.created_at.asc())
             elif order_by == "updated_desc":
                 stmt = stmt.order_by(Video.updated_at.desc())
@@ -96,6 +135,15 @@ async def search_video_list(
         )
 
 
+async def read_video_list_by_ids(db: AsyncSession, video_ids: list[int]):
+    # ID 목록 순서대로 비디오 조회
+    if not video_ids:
+        return []
+    result = await db.execute(select(Video).filter(Video.id.in_(video_ids)))
+    videos = {video.id: video for video in result.scalars().all()}
+    return [videos[video_id] for video_id in video_ids if video_id in videos]
+
+
 async def read_video(
     db: AsyncSession,
     video_id: int = None,
@@ -669,6 +717,39 @@ async def read_genre(db: AsyncSession, genre_id: int):
         )
 
 
+async def read_genre_list(db: AsyncSession):
+    # Genre.video selectin 로딩이 없도록 컬럼만 조회
+    try:
+        result = await db.execute(select(Genre.id, Genre.name).order_by(Genre.id))
+        return result.all()
+    except Exception as e:
+        print(e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            headers={"code": "EXCEPTION"},
+            detail=messages["EXCEPTION"],
+        )
+
+
+async def read_genre_video_counts(db: AsyncSession):
+    # 장르 별 공개 비디오 수
+    try:
+        result = await db.execute(
+            select(VideoGenre.genre_id, func.count())
+            .join(Video, Video.id == VideoGenre.video_id)
+            .where(Video.is_confirm.is_(True), Video.is_delete.is_(False))
+            .group_by(VideoGenre.genre_id)
+        )
+        return dict(result.all())
+    except Exception as e:
+        print(e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            headers={"code": "EXCEPTION"},
+            detail=messages["EXCEPTION"],
+        )
+
+
 async def read_actor(db: AsyncSession, actor_id: int):
     try:
         stmt = select(Actor).filter_by(id=actor_id)
@@ -695,3 +776,86 @@ async def read_staff(db: AsyncSession, staff_id: int):
             headers={"code": "EXCEPTION"},
             detail=messages["EXCEPTION"],
         )
+
+
+async def read_actor_profile(db: AsyncSession, actor_id: int):
+    # Actor.video selectin 로딩 없이 배우 정보만 조회
+    try:
+        stmt = select(Actor).options(noload(Actor.video)).filter_by(id=actor_id)
+        actor = await db.scalar(stmt)
+        return actor
+    except Exception as e:
+        print(e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            headers={"code": "EXCEPTION"},
+            detail=messages["EXCEPTION"],
+        )
+
+
+async def read_staff_profile(db: AsyncSession, staff_id: int):
+    # Staff.video selectin 로딩 없이 스태프 정보만 조회
+    try:
+        stmt = select(Staff).options(noload(Staff.video)).filter_by(id=staff_id)
+        staff = await db.scalar(stmt)
+        return staff
+    except Exception as e:
+        print(e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            headers={"code": "EXCEPTION"},
+            detail=messages["EXCEPTION"],
+        )
+
+
+async def read_person_video_list(
+    db: AsyncSession,
+    name: str,
+    person_id: int,
+    cursor: int | None = None,
+    page_size: int = 20,
+):
+    # 배우/스태프 필모그래피 (최신 ID 순 keyset 페이징)
+    try:
+        if video_catalog.is_ready:
+            total, video_ids = video_catalog.person_videos(
+                name, person_id, cursor=cursor, limit=page_size
+            )
+        else:
+            if name == "actor":
+                link_person_column, link_video_column = (
+                    VideoActor.actor_id,
+                    VideoActor.video_id,
+                )
+            else:
+                link_person_column, link_video_column = (
+                    VideoStaff.staff_id,
+                    VideoStaff.video_id,
+                )
+            # (person_id, video_id) 커버링 인덱스 사용
+            stmt = (
+                select(link_video_column)
+                .join(Video, Video.id == link_video_column)
+                .where(
+                    link_person_column == person_id,
+                    Video.is_confirm.is_(True),
+                    Video.is_delete.is_(False),
+                )
+            )
+            total = await db.scalar(select(func.count()).select_from(stmt.subquery()))
+            if cursor is not None:
+                stmt = stmt.where(link_video_column < cursor)
+            result = await db.execute(
+                stmt.order_by(link_video_column.desc()).limit(page_size)
+            )
+            video_ids = result.scalars().all()
+        videos = await read_video_list_by_ids(db, video_ids)
+        next_cursor = video_ids[-1] if len(video_ids) == page_size else None
+        return total, videos, next_cursor
+    except Exception as e:
+        print(e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            headers={"code": "EXCEPTION"},
+            detail=messages["EXCEPTION"],
+        )
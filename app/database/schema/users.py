@@ -11,6 +11,7 @@ class User(BaseModel):
     email: str
     nickname: str
     profile_image: str | None = None
+    profile_image_variants: dict[str, str] | None = None
 
     @field_validator("email")
     def mask_email(cls, value: str) -> str:
@@ -32,6 +33,12 @@ class User(BaseModel):
             return value
         return f"{settings.THUMBNAIL_BASE_URL}{value}"
 
+    @field_validator("profile_image_variants")
+    def variants_add_host(cls, value: dict) -> dict:
+        if not value:
+            return value
+        return {k: f"{settings.THUMBNAIL_BASE_URL}{v}" for k, v in value.items()}
+
     class Config:
         from_attributes = True
 
@@ -65,6 +72,7 @@ class ReqUserUpdate(BaseModel):
     password: Optional[str] = None
     birth_year: Optional[int] = None
     profile_image: Optional[str] = None
+    profile_image_variants: Optional[dict] = None
     profile_text: Optional[str] = None
     is_marketing_agree: Optional[bool] = None
 
@@ -121,5 +129,38 @@ class ResUserLogin(ResUserMe):
     refresh_token: str
 
 
+class ReqUserProfileImageUpload(BaseModel):
+    content_type: str
+    size: int
+    filename: Optional[str] = None
+
+
+class ResUserProfileImageUpload(BaseModel):
+    url: str
+    fields: dict[str, str]
+    key: str
+    expires_in: int
+
+
+class ReqUserProfileImageComplete(BaseModel):
+    key: str
+
+
+class ReqUserProfileImageImport(BaseModel):
+    url: str
+
+
+class ReqUserTokenRefresh(BaseModel):
+    refresh_token: str
+
+
+class ResUserToken(BaseModel):
+    access_token: str
+    refresh_token: str
+
+
 class ResUserProfileList(BaseModel):
+    total: int | None = None
+    count: int
+    cursor: int | None = None
     data: list[UserProfile]
@@ -13,6 +13,10 @@ class Genre(BaseModel):
         from_attributes = True
 
 
+class GenreCount(Genre):
+    video_count: int
+
+
 class Actor(BaseModel):
     id: int
     name: str
@@ -28,6 +32,13 @@ class Actor(BaseModel):
         from_attributes = True
 
 
+class ActorProfile(Actor):
+    profile: str | None = None
+
+    class Config:
+        from_attributes = True
+
+
 class VideoActor(Actor):
     code: str | None
     role: str | None
@@ -52,6 +63,13 @@ class Staff(BaseModel):
         from_attributes = True
 
 
+class StaffProfile(Staff):
+    profile: str | None = None
+
+    class Config:
+        from_attributes = True
+
+
 class VideoStaff(Staff):
     code: str | None
     # sort: int | None
@@ -204,3 +222,24 @@ class ResVideoReviewsWithRating(BaseModel):
     count: int
     page: int
     data: List[VideoReviewWithRating] | None = None
+
+
+class ResGenres(BaseModel):
+    count: int
+    data: List[GenreCount] | None = None
+
+
+class ResActorVideos(BaseModel):
+    total: int
+    count: int
+    cursor: int | None = None
+    actor: ActorProfile
+    data: List[VideoSimple] | None = None
+
+
+class ResStaffVideos(BaseModel):
+    total: int
+    count: int
+    cursor: int | None = None
+    staff: StaffProfile
+    data: List[VideoSimple] | None = None
@@ -0,0 +1,91 @@
+import asyncio
+import logging
+from collections import deque
+from itertools import islice
+
+from sqlalchemy.sql.expression import insert
+
+from app.config.settings import settings
+from app.database.model.users import UserLoginLog
+from app.utils.logger import LOGGER_NAME
+
+logger = logging.getLogger(LOGGER_NAME)
+
+
+class BatchWriter:
+    """
+    로그성 테이블 INSERT 를 메모리 버퍼에 모아 일정 개수/주기마다 multi-row INSERT 로 기록합니다.
+    요청 처리 중에는 버퍼에 추가만 하며, 버퍼가 가득 차면 기록하지 않고 drop 카운트만 증가합니다.
+    """
+
+    def __init__(self, model, batch_size: int, flush_interval: float, max_buffer: int):
+        self.model = model
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self._buffer: deque[dict] = deque()
+        self._wakeup: asyncio.Event | None = None
+        # 지표
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+
+    def __len__(self):
+        return len(self._buffer)
+
+    def stats(self):
+        return {
+            "buffered": len(self._buffer),
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+    def put(self, row: dict):
+        if len(self._buffer) >= self.max_buffer:
+            self.dropped += 1
+            return False
+        # created_at 은 기존 로그와 같이 DB 시간(func.now() 기본값) 사용 (기록 지연은 flush_interval 이내)
+        self._buffer.append(row)
+        if len(self._buffer) >= self.batch_size and self._wakeup is not None:
+            self._wakeup.set()
+        return True
+
+    async def flush(self, session_factory):
+        while self._buffer:
+            # 커밋 후에 버퍼에서 제거 (기록 중 취소되면 배치가 버퍼에 남아 종료시 다시 기록)
+            rows = list(islice(self._buffer, self.batch_size))
+            try:
+                async with session_factory() as db:
+                    await db.execute(insert(self.model), rows)
+                    await db.commit()
+                self.written += len(rows)
+            except Exception:
+                # 실패한 배치는 재시도하지 않음 (DB 장애시 메모리 누적 방지)
+                self.failed += len(rows)
+                logger.exception(f"Failed to write {self.model.__tablename__}")
+            # put 은 오른쪽에만 추가하므로 앞쪽 len(rows) 개가 이번 배치
+            for _ in range(len(rows)):
+                self._buffer.popleft()
+
+    async def run(self, session_factory):
+        # 백그라운드 주기 기록, 취소되면 남은 버퍼를 모두 기록 후 종료
+        self._wakeup = asyncio.Event()
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+                await self.flush(session_factory)
+        finally:
+            await self.flush(session_factory)
+
+
+login_log_writer = BatchWriter(
+    UserLoginLog,
+    settings.LOGIN_LOG_BATCH_SIZE,
+    settings.LOGIN_LOG_FLUSH_INTERVAL,
+    settings.LOGIN_LOG_MAX_BUFFER,
+)
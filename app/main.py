@@ -1,14 +1,27 @@
+import asyncio
+import logging
 import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Depends, Response
 from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
 from fastapi.staticfiles import StaticFiles
 
+from app.cache.auth import token_versions
+from app.cache.catalog import video_catalog
+from app.cache.users import user_name_filter
 from app.config.settings import settings
+from app.database.database import AsyncSessionLocal
+from app.database.queryset.users import delete_expired_user_token_family
+from app.database.writer import login_log_writer
 from app.middleware.logging import LoggingMiddleware
+from app.security.password import password_hasher
+from app.utils.remote import remote_image_ingestor
+from app.utils.s3client import storage_clients
+from app.utils.uploader import image_service
 from app.security.verifier import verify_access_docs
-from app.utils.logger import Logger
+from app.utils.logger import LOGGER_NAME, Logger
 from app.routes.v1 import (
     defaults as defaults_v1,
     users as users_v1,
@@ -16,6 +29,52 @@ from app.routes.v1 import (
     validation as validation_v1,
 )
 
+logger = logging.getLogger(LOGGER_NAME)
+
+
+# 주기 작업
+async def run_periodic(job, interval: int):
+    while True:
+        try:
+            async with AsyncSessionLocal() as db:
+                await job(db)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception(f"Periodic job {job.__name__} failed")
+        await asyncio.sleep(interval)
+
+
+# 워커 시작/종료 시 처리
+@asynccontextmanager
+async def lifespan(api: FastAPI):
+    # 워커 공유 S3 client 생성 (자격 증명/커넥션 풀 1회 초기화)
+    storage_clients.start()
+    # 비디오 목록 메모리 인덱스 주기 갱신
+    catalog_task = asyncio.create_task(video_catalog.run(AsyncSessionLocal))
+    # 토큰 버전(폐기) 맵 주기 갱신
+    token_version_task = asyncio.create_task(token_versions.run(AsyncSessionLocal))
+    # 만료된 리프레시 토큰 패밀리 정리
+    token_family_task = asyncio.create_task(
+        run_periodic(delete_expired_user_token_family, 3600)
+    )
+    # 가입된 이메일/닉네임 Bloom filter 주기 갱신
+    user_name_task = asyncio.create_task(user_name_filter.run(AsyncSessionLocal))
+    # 로그인 로그 배치 기록
+    login_log_task = asyncio.create_task(login_log_writer.run(AsyncSessionLocal))
+    yield
+    catalog_task.cancel()
+    token_version_task.cancel()
+    token_family_task.cancel()
+    user_name_task.cancel()
+    # 남은 로그인 로그 기록 후 종료
+    login_log_task.cancel()
+    await asyncio.gather(login_log_task, return_exceptions=True)
+    password_hasher.shutdown()
+    await remote_image_ingestor.close()
+    image_service.shutdown()
+    storage_clients.close()
+
 
 # FastAPI initialize
 def create_api() -> FastAPI:
@@ -23,6 +82,7 @@ def create_api() -> FastAPI:
         docs_url=None,
         redoc_url=None,
         openapi_url=None,
+        lifespan=lifespan,
     )
     # CORS Middleware 정의
     api.add_middleware(
@@ -1,28 +1,35 @@
+import logging
+import os
+import tempfile
 from fastapi import (
     APIRouter,
+    BackgroundTasks,
     Depends,
-    UploadFile,
     status,
     Request,
     Response,
     Request,
     HTTPException,
-    Form,
-    UploadFile,
-    File,
 )
-from typing import Optional
+from datetime import datetime, timedelta
 from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config.settings import settings
 from app.config.variables import messages
 from app.network.response import json_response
+from app.cache.auth import token_versions
 from app.security import validator
 from app.security.token import JWTManager
-from app.security.password import Password
-from app.security.verifier import verify_access_token_user, UserLoginVerifier
-from app.database.database import get_db
+from app.security.password import password_hasher
+from app.security.verifier import (
+    verify_access_token_user,
+    verify_login_rate_limit,
+    UserLoginVerifier,
+)
+from app.database.database import get_db, AsyncSessionLocal
 from app.database.queryset import users as queryset
 from app.database.schema.users import (
     UserMe,
@@ -33,15 +40,62 @@ from app.database.schema.users import (
     ReqUserPassword,
     ReqUserProfile,
     ReqUserMarketing,
+    ReqUserProfileImageUpload,
+    ReqUserProfileImageComplete,
+    ReqUserProfileImageImport,
+    ReqUserTokenRefresh,
     ResUserMe,
     ResUserLogin,
+    ResUserToken,
     ResUserProfileList,
+    ResUserProfileImageUpload,
 )
-from app.utils.uploader import S3ImageUploader
+from app.utils.ingest import ingest_multipart
+from app.utils.logger import LOGGER_NAME
+from app.utils.remote import is_allowed_url, remote_image_ingestor
+from app.utils.storage import storage
+from app.utils.uploader import image_service
 from app.utils.utils import make_s3_path
 
 router = APIRouter()
 tags = "USERS"
+logger = logging.getLogger(LOGGER_NAME)
+
+# multipart 본문을 직접 스트리밍으로 수신하는 라우트의 API 문서용 스키마
+profile_image_schema = {"type": "string", "format": "binary"}
+openapi_user_update = {
+    "requestBody": {
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "properties": {
+                        "nickname": {"type": "string"},
+                        "password": {"type": "string"},
+                        "birth_year": {"type": "integer"},
+                        "profile_image": profile_image_schema,
+                        "profile_text": {"type": "string"},
+                        "is_marketing_agree": {"type": "boolean"},
+                    },
+                }
+            }
+        }
+    }
+}
+openapi_profile_image = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "properties": {"profile_image": profile_image_schema},
+                    "required": ["profile_image"],
+                }
+            }
+        },
+    }
+}
 
 
 @router.get(
@@ -56,15 +110,37 @@ async def search_users(
     uid: int = 0,
     nm: str = None,
     em: str = None,
+    c: int = None,
+    tc: bool = True,
     response: Response = None,
     db: AsyncSession = Depends(get_db),
 ):
-    # 유저 정보 가져오기
-    total, users = await queryset.read_user(
-        db, page=p, page_size=ps, user_id=uid, email=em, nickname=nm
+    # 페이지 파라메터 체크
+    if p < 1:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            headers={"code": "INVALID_PARAM_PAGE"},
+            detail=messages["INVALID_PARAM_PAGE"],
+        )
+    if ps < 1 or ps > 100:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            headers={"code": "INVALID_PARAM_PAGE_SIZE"},
+            detail=messages["INVALID_PARAM_PAGE_SIZE"],
+        )
+    # 유저 정보 가져오기 (c: 다음 페이지 커서, tc: 전체 건수 포함 여부)
+    total, users, next_cursor = await queryset.read_user(
+        db,
+        page=p,
+        page_size=ps,
+        user_id=uid,
+        email=em,
+        nickname=nm,
+        cursor=c,
+        with_total=tc,
     )
     # 검색 결과 없을 경우
-    if total <= 0 or not users:
+    if not users:
         response.status_code = status.HTTP_204_NO_CONTENT
         response.headers["code"] = "SEARCH_NOT_FOUND"
         return None
@@ -74,7 +150,7 @@ async def search_users(
     response.headers["code"] = "SEARCH_SUCC"
     # 결과 출력
     return ResUserProfileList(
-        message=messages["SEARCH_SUCC"], data=users, total=total, count=count
+        total=total, count=count, cursor=next_cursor, data=users
     )
 
 
@@ -94,14 +170,14 @@ async def create_user(
     # 만 14세 이상 확인
     if not req_user.is_age_agree:
         return json_response(status.HTTP_400_BAD_REQUEST, "USER_AGREE_AGE_REQUIRED")
-    # 이메일 유효성 검사
-    valid_email_code = validator.validate_email(req_user.email)
-    if valid_email_code != "VALID_EMAIL_SUCC":
-        return json_response(status.HTTP_400_BAD_REQUEST, valid_email_code)
     # 비밀번호 유효성 검사
     valid_pwd_code = validator.validate_password(req_user.password)
     if valid_pwd_code != "VALID_PWD_SUCC":
         return json_response(status.HTTP_400_BAD_REQUEST, valid_pwd_code)
+    # 이메일 유효성 검사
+    valid_email_code = validator.validate_email(req_user.email)
+    if valid_email_code != "VALID_EMAIL_SUCC":
+        return json_response(status.HTTP_400_BAD_REQUEST, valid_email_code)
     # 닉네임 유효성 검사
     valid_nick_code = validator.validate_nickname(req_user.nickname)
     if valid_nick_code != "VALID_NICK_SUCC":
@@ -110,17 +186,9 @@ async def create_user(
     valid_code = validator.validate_usercode(req_user.code)
     if valid_code != "VALID_USER_CODE_SUCC":
         return json_response(status.HTTP_400_BAD_REQUEST, valid_code)
-    # 이메일 중복 체크
-    verify_email = await queryset.verify_exist_email(db, email=req_user.email)
-    if not verify_email:
-        return json_response(status.HTTP_400_BAD_REQUEST, "VALID_EMAIL_ALREADY_EXIST")
-    # 닉네임 중복 체크
-    verify_nick = await queryset.verify_exist_nickname(db, nickname=req_user.nickname)
-    if not verify_nick:
-        return json_response(status.HTTP_400_BAD_REQUEST, "VALID_NICK_ALREADY_EXIST")
-    # 비밀번호 암호화
-    req_user.password = Password.create_password_hash(req_user.password)
-    # 유저 생성
+    # 비밀번호 암호화 (모든 유효성 검사 통과 후에만 bcrypt 실행)
+    req_user.password = await password_hasher.hash(req_user.password)
+    # 유저 생성 (이메일/닉네임 중복은 유니크 제약으로 검사)
     result = await queryset.create_user(db, user=req_user)
     # TODO: 유저 생성시 is_email_verify = False 로 생성 후 이메일 인증 후 is_email_verify = True 로 변경하여야 함
     # TODO: 가입 시도 로그 기록 (IP, User-Agent, Host 등) 체크해서 하루 가입 가능 횟수 제한 필요
@@ -157,99 +225,84 @@ async def read_user_me(
     tags=[tags],
     status_code=status.HTTP_200_OK,
     response_model=ResUserMe,
+    openapi_extra=openapi_user_update,
 )
 async def update_user_me(
     request: Request,
     response: Response,
-    nickname: Optional[str] = Form(None),
-    password: Optional[str] = Form(None),
-    birth_year: Optional[int] = Form(None),
-    profile_image: Optional[UploadFile] = File(None),
-    profile_text: Optional[str] = Form(None),
-    is_marketing_agree: Optional[bool] = Form(None),
     db: AsyncSession = Depends(get_db),
     auth_user: UserMe = Depends(verify_access_token_user),
 ):
-    req_user = ReqUserUpdate(
-        nickname=nickname,
-        password=password,
-        birth_year=birth_year,
-        profile_image="",
-        profile_text=profile_text,
-        is_marketing_agree=is_marketing_agree,
-    )
-
-    # 유저 정보 입력 확인
-    if not req_user:
-        response.headers["code"] = "USER_UPDATE_NOT_FOUND"
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=messages["USER_UPDATE_NOT_FOUND"],
-        )
-    # 닉네임 입력이 있을 경우
-    if req_user.nickname:
-        valid_nick_code = validator.validate_nickname(req_user.nickname)
-        if valid_nick_code != "VALID_NICK_SUCC":
-            response.headers["code"] = valid_nick_code
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=messages[valid_nick_code],
+    # multipart 본문 스트리밍 수신 (크기/타입 검사는 수신 중에 처리)
+    form, profile_image = await ingest_multipart(request, "profile_image")
+    # 수신한 임시 파일은 어떤 응답/예외로 끝나더라도 정리
+    try:
+        try:
+            req_user = ReqUserUpdate(
+                nickname=form.get("nickname"),
+                password=form.get("password"),
+                birth_year=form.get("birth_year") or None,
+                profile_image="",
+                profile_text=form.get("profile_text"),
+                is_marketing_agree=form.get("is_marketing_agree") or None,
             )
-    # 패스워드 입력이 있을 경우
-    if req_user.password:
-        # 비밀번호 유효성 검사
-        valid_pwd_code = validator.validate_password(req_user.password)
-        if valid_pwd_code != "VALID_PWD_SUCC":
-            response.headers["code"] = valid_pwd_code
+        except ValidationError as e:
+            raise RequestValidationError(e.errors())
+
+        # 유저 정보 입력 확인
+        if not req_user:
+            response.headers["code"] = "USER_UPDATE_NOT_FOUND"
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST, detail=messages[valid_pwd_code]
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail=messages["USER_UPDATE_NOT_FOUND"],
             )
-        # 비밀번호 암호화
-        req_user.password = Password.create_password_hash(req_user.password)
-    # 프로필 이미지 입력 확인
-    if profile_image:
-        # 파일 타입 확인
-        if profile_image.content_type not in settings.FILE_UPLOAD_TYPE_ALLOWED:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                headers={"code": "FILE_TYPE_ERR"},
-                detail=messages["FILE_TYPE_ERR"],
+        # 닉네임 입력이 있을 경우
+        if req_user.nickname:
+            valid_nick_code = validator.validate_nickname(req_user.nickname)
+            if valid_nick_code != "VALID_NICK_SUCC":
+                response.headers["code"] = valid_nick_code
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=messages[valid_nick_code],
+                )
+        # 패스워드 입력이 있을 경우
+        if req_user.password:
+            # 비밀번호 유효성 검사
+            valid_pwd_code = validator.validate_password(req_user.password)
+            if valid_pwd_code != "VALID_PWD_SUCC":
+                response.headers["code"] = valid_pwd_code
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=messages[valid_pwd_code],
+                )
+            # 비밀번호 암호화
+            req_user.password = await password_hasher.hash(req_user.password)
+        # 프로필 이미지 입력 확인 (타입/용량은 수신시 검사됨)
+        if profile_image:
+            # 너비/포맷별 변형 이미지 생성 후 S3 업로드 (이미지 처리/업로드는 풀에서 실행)
+            # 내용 해시 기반 키이므로 이미 처리된 이미지는 기존 키 재사용
+            s3_uploaded_file = await image_service.upload_variants_by_hash(
+                db, profile_image.source, "profile"
             )
-        # 파일 용량 체크
-        if profile_image.file.__sizeof__() > settings.FILE_UPLOAD_SIZE_LIMIT:
+            # 업로드 성공시 req_user.profile_image에 기본 변형 URL 저장
+            if s3_uploaded_file:
+                req_user.profile_image = s3_uploaded_file["url"]
+                req_user.profile_image_variants = s3_uploaded_file["variants"]
+        # 유저 업데이트 (변경된 회원 정보 반환)
+        updated_user = await queryset.update_user(db, auth_user["id"], req_user)
+        # DB 업데이트 실패
+        if not updated_user:
+            response.headers["code"] = "USER_UPDATE_FAIL"
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                headers={"code": "FILE_SIZE_ERR"},
-                detail=messages["FILE_SIZE_ERR"],
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=messages["USER_UPDATE_FAIL"],
             )
-        # S3 업로드 경로 생성
-        s3_upload_path = make_s3_path(
-            "profile", auth_user["id"], profile_image.filename
-        )
-        # 파일 읽기
-        file_content = await profile_image.read()
-        # 파일 S3 업로드
-        uploader = S3ImageUploader()
-        s3_uploaded_file = uploader.upload_from_file(file_content, s3_upload_path)
-        # 리사이즈
-        # s3_uploaded_file = uploader.upload_from_file(profile_image.file, s3_upload_path, 300)
-        uploader.close()
-        # 업로드 성공시 req_user.profile_image에 URL 저장
-        if s3_uploaded_file:
-            req_user.profile_image = s3_uploaded_file["url"]
-    # 유저 업데이트
-    updated = await queryset.update_user(db, auth_user["id"], req_user)
-    # DB 업데이트 실패
-    if not updated:
-        response.headers["code"] = "USER_UPDATE_FAIL"
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=messages["USER_UPDATE_FAIL"],
-        )
-    updated_user = await queryset.read_user_by_id(db, auth_user["id"])
-    # Response Header code
-    response.headers["code"] = "USER_UPDATE_SUCC"
-    return ResUserMe(user=updated_user)
+        # Response Header code
+        response.headers["code"] = "USER_UPDATE_SUCC"
+        return ResUserMe(user=updated_user)
+    finally:
+        if profile_image:
+            profile_image.close()
 
 
 @router.delete("/users/{user_id}", tags=[tags], status_code=status.HTTP_204_NO_CONTENT)
@@ -294,17 +347,7 @@ async def patch_user_nickname(
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=messages[valid_code]
         )
-    # 닉네임 중복 체크
-    verify_nick_result = await queryset.verify_exist_nickname(
-        db, nickname=req_user.nickname
-    )
-    if not verify_nick_result:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            headers={"code": "VALID_NICK_ALREADY_EXIST"},
-            detail=messages["VALID_NICK_ALREADY_EXIST"],
-        )
-    # 닉네임 업데이트
+    # 닉네임 업데이트 (중복은 유니크 제약으로 검사)
     result = await queryset.update_user_nickname(db, auth_user["id"], req_user.nickname)
     # 결과 출력
     if not result:
@@ -350,14 +393,16 @@ async def patch_user_password(
         )
     # 기존 비밀번호 검증
     get_user = await queryset.read_user_by_id(db, auth_user["id"])
-    if not Password.verify_password(req_user.password_origin, get_user.password):
+    if not await password_hasher.verify(
+        req_user.password_origin, get_user.password
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             headers={"code": "USER_PASSWORD_NOT_MATCH"},
             detail=messages["USER_PASSWORD_NOT_MATCH"],
         )
     # 비밀번호 암호화
-    req_user.password_new = Password.create_password_hash(req_user.password_new)
+    req_user.password_new = await password_hasher.hash(req_user.password_new)
     # 비밀번호 업데이트
     result = await queryset.update_user_password(
         db, user_id=auth_user["id"], password=req_user.password_new
@@ -377,13 +422,16 @@ async def patch_user_password(
     "/users/{user_id}/profile_image",
     tags=[tags],
     status_code=status.HTTP_204_NO_CONTENT,
+    openapi_extra=openapi_profile_image,
 )
 async def patch_user_profile_image(
-    profile_image: UploadFile = None,
-    response: Response = None,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     auth_user: UserMe = Depends(verify_access_token_user),
 ):
+    # multipart 본문 스트리밍 수신 (크기/타입 검사는 수신 중에 처리)
+    _, profile_image = await ingest_multipart(request, "profile_image")
     # 프로필 이미지 입력 확인
     if profile_image is None:
         raise HTTPException(
@@ -391,46 +439,205 @@ async def patch_user_profile_image(
             headers={"code": "FILE_NOT_FOUND"},
             detail=messages["FILE_NOT_FOUND"],
         )
+    # 너비/포맷별 변형 이미지 생성 후 S3 업로드 (이미지 처리/업로드는 풀에서 실행)
+    # 내용 해시 기반 키이므로 이미 처리된 이미지는 기존 키 재사용
+    try:
+        s3_uploaded_file = await image_service.upload_variants_by_hash(
+            db, profile_image.source, "profile"
+        )
+    finally:
+        profile_image.close()
+    # 업로드 성공시 req_user.profile_image에 URL 저장
+    if not s3_uploaded_file:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            headers={"code": "USER_UPDATE_PROFILE_IMAGE_FAIL"},
+            detail=messages["USER_UPDATE_PROFILE_IMAGE_FAIL"],
+        )
+    # 프로필 이미지 업데이트
+    result = await queryset.update_user_profile_image(
+        db, auth_user["id"], s3_uploaded_file["url"], s3_uploaded_file["variants"]
+    )
+    if not result:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            headers={"code": "USER_UPDATE_PROFILE_IMAGE_FAIL"},
+            detail=messages["USER_UPDATE_PROFILE_IMAGE_FAIL"],
+        )
+    # Response Header code
+    response.headers["code"] = "USER_UPDATE_PROFILE_SUCC"
+
+
+@router.post(
+    "/users/{user_id}/profile_image/upload-url",
+    tags=[tags],
+    status_code=status.HTTP_200_OK,
+    response_model=ResUserProfileImageUpload,
+)
+async def create_user_profile_image_upload_url(
+    req_upload: ReqUserProfileImageUpload,
+    response: Response,
+    auth_user: UserMe = Depends(verify_access_token_user),
+):
     # 파일 타입 확인
-    if profile_image.content_type not in settings.FILE_UPLOAD_TYPE_ALLOWED:
+    if req_upload.content_type not in settings.FILE_UPLOAD_TYPE_ALLOWED:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             headers={"code": "FILE_TYPE_ERR"},
             detail=messages["FILE_TYPE_ERR"],
         )
     # 파일 용량 체크
-    if profile_image.file.__sizeof__() > settings.FILE_UPLOAD_SIZE_LIMIT:
+    if req_upload.size <= 0 or req_upload.size > settings.FILE_UPLOAD_SIZE_LIMIT:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             headers={"code": "FILE_SIZE_ERR"},
             detail=messages["FILE_SIZE_ERR"],
         )
-    # 파일 S3 업로드
-    uploader = S3ImageUploader()
-    s3_upload_path = make_s3_path("profile", auth_user["id"], profile_image.filename)
-    s3_uploaded_file = uploader.upload_from_file(profile_image.file, s3_upload_path)
-    # 리사이즈
-    # s3_uploaded_file = uploader.upload_from_file(profile_image.file, s3_upload_path, 300)
-    uploader.close()
-    # 업로드 성공시 req_user.profile_image에 URL 저장
-    if not s3_uploaded_file:
+    # 원본 업로드 경로 생성 (파일명이 없으면 content-type 으로 확장자 결정)
+    filename = req_upload.filename or f"image.{req_upload.content_type.split('/')[-1]}"
+    s3_upload_path = make_s3_path("profile_upload", auth_user["id"], filename)
+    # presigned POST 생성 (Content-Type, 신고한 크기 이하로 제한)
+    presigned = await storage.presign(
+        s3_upload_path,
+        req_upload.content_type,
+        req_upload.size,
+        settings.AWS_S3_PRESIGNED_UPLOAD_EXPIRE,
+    )
+    if not presigned:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            headers={"code": "USER_UPDATE_PROFILE_IMAGE_FAIL"},
-            detail=messages["USER_UPDATE_PROFILE_IMAGE_FAIL"],
+            headers={"code": "USER_PROFILE_IMAGE_UPLOAD_URL_FAIL"},
+            detail=messages["USER_PROFILE_IMAGE_UPLOAD_URL_FAIL"],
         )
-    # 프로필 이미지 업데이트
-    result = await queryset.update_user_profile_image(
-        db, auth_user["id"], s3_uploaded_file["url"]
+    # Response Header code
+    response.headers["code"] = "USER_PROFILE_IMAGE_UPLOAD_URL_SUCC"
+    return ResUserProfileImageUpload(
+        url=presigned["url"],
+        fields=presigned["fields"],
+        key=s3_upload_path,
+        expires_in=settings.AWS_S3_PRESIGNED_UPLOAD_EXPIRE,
     )
-    if not result:
+
+
+async def process_uploaded_profile_image(
+    user_id: int, upload_key: str, delete_upload: bool = True
+):
+    # 직접 업로드된 원본으로 변형 이미지 생성 후 프로필 이미지 갱신
+    # 원본은 임시 파일로 받아 경로만 프로세스 풀로 전달 (워커 메모리에 올리지 않음)
+    # 원본 삭제는 갱신 성공 후에만 (실패시 원본이 남아 complete 재요청 가능)
+    # 가져오기 원본은 해시 키로 다른 요청과 공유하므로 삭제하지 않음 (delete_upload=False)
+    os.makedirs(settings.FILE_DIR_TEMP, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=settings.FILE_DIR_TEMP)
+    os.close(fd)
+    try:
+        await storage.get_file(upload_key, temp_path)
+        async with AsyncSessionLocal() as db:
+            s3_uploaded_file = await image_service.upload_variants_by_hash(
+                db, temp_path, "profile"
+            )
+            if not s3_uploaded_file:
+                logger.error(f"Failed to process the uploaded profile image: {upload_key}")
+                return
+            updated = await queryset.update_user_profile_image(
+                db, user_id, s3_uploaded_file["url"], s3_uploaded_file["variants"]
+            )
+        if not updated:
+            logger.error(f"Failed to update the profile image: user {user_id}")
+            return
+        if delete_upload:
+            await storage.delete(upload_key)
+    except HTTPException as e:
+        # 이미지로 읽을 수 없는 원본 (FILE_TYPE_ERR)
+        logger.error(f"Invalid uploaded profile image {upload_key}: {e.headers['code']}")
+    except Exception as e:
+        logger.exception(f"Failed to process the uploaded profile image {upload_key}: {e}")
+    finally:
+        os.remove(temp_path)
+
+
+@router.post(
+    "/users/{user_id}/profile_image/complete",
+    tags=[tags],
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def complete_user_profile_image_upload(
+    req_complete: ReqUserProfileImageComplete,
+    response: Response,
+    background_tasks: BackgroundTasks,
+    auth_user: UserMe = Depends(verify_access_token_user),
+):
+    # 본인 업로드 경로인지 확인
+    upload_prefix = f"{settings.AWS_S3_PATH_USER_PROFILE_UPLOAD}{auth_user['id']}/"
+    if not req_complete.key.startswith(upload_prefix) or ".." in req_complete.key:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=status.HTTP_400_BAD_REQUEST,
+            headers={"code": "FILE_NOT_FOUND"},
+            detail=messages["FILE_NOT_FOUND"],
+        )
+    # 업로드된 객체 확인 (본문은 읽지 않음)
+    head = await storage.stat(req_complete.key)
+    if not head:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            headers={"code": "FILE_NOT_FOUND"},
+            detail=messages["FILE_NOT_FOUND"],
+        )
+    if head["content_type"] not in settings.FILE_UPLOAD_TYPE_ALLOWED:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            headers={"code": "FILE_TYPE_ERR"},
+            detail=messages["FILE_TYPE_ERR"],
+        )
+    if head["size"] > settings.FILE_UPLOAD_SIZE_LIMIT:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            headers={"code": "FILE_SIZE_ERR"},
+            detail=messages["FILE_SIZE_ERR"],
+        )
+    # 변형 이미지 생성은 응답 후 백그라운드에서 처리
+    background_tasks.add_task(
+        process_uploaded_profile_image, auth_user["id"], req_complete.key
+    )
+    # Response Header code
+    response.headers["code"] = "USER_UPDATE_PROFILE_IMAGE_ACCEPTED"
+
+
+@router.post(
+    "/users/{user_id}/profile_image/import",
+    tags=[tags],
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def import_user_profile_image(
+    req_import: ReqUserProfileImageImport,
+    response: Response,
+    background_tasks: BackgroundTasks,
+    auth_user: UserMe = Depends(verify_access_token_user),
+):
+    # 허용된 호스트의 https URL 만 가져오기 (내부 주소 요청 방지, 리다이렉트는 수집기에서 확인)
+    if not is_allowed_url(req_import.url, settings.REMOTE_IMAGE_ALLOWED_HOSTS):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            headers={"code": "FILE_NOT_FOUND"},
+            detail=messages["FILE_NOT_FOUND"],
+        )
+    # 원본 다운로드/저장 (크기, 형식 확인 포함), 실패시 None
+    imported = await remote_image_ingestor.ingest(
+        req_import.url,
+        settings.AWS_S3_PATH_USER_PROFILE_IMPORT,
+        allowed_hosts=settings.REMOTE_IMAGE_ALLOWED_HOSTS,
+    )
+    if not imported:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
             headers={"code": "USER_UPDATE_PROFILE_IMAGE_FAIL"},
             detail=messages["USER_UPDATE_PROFILE_IMAGE_FAIL"],
         )
+    # 변형 이미지 생성은 응답 후 백그라운드에서 처리
+    background_tasks.add_task(
+        process_uploaded_profile_image, auth_user["id"], imported["url"], False
+    )
     # Response Header code
-    response.headers["code"] = "USER_UPDATE_PROFILE_SUCC"
+    response.headers["code"] = "USER_UPDATE_PROFILE_IMAGE_ACCEPTED"
 
 
 @router.patch(
@@ -499,6 +706,7 @@ async def patch_user_marketing_agree(
     tags=[tags],
     status_code=status.HTTP_200_OK,
     response_model=ResUserLogin,
+    dependencies=[Depends(verify_login_rate_limit)],
 )
 async def login_user(
     req_user: ReqUserLogin,
@@ -514,7 +722,18 @@ async def login_user(
         raise e
     # 토큰 생성
     access_token = JWTManager.create_access_token(get_user)
-    refresh_token = JWTManager.create_refresh_token(get_user)
+    family_id = JWTManager.create_token_id()
+    token_id = JWTManager.create_token_id()
+    refresh_token = JWTManager.create_refresh_token(get_user, family_id, token_id)
+    # 리프레시 토큰 패밀리 등록
+    await queryset.create_user_token_family(
+        db,
+        family_id,
+        get_user["id"],
+        token_id,
+        datetime.now()
+        + timedelta(minutes=float(settings.REFRESH_TOKEN_EXPIRE_TIME)),
+    )
     # 결과 출력
     response.headers["code"] = "USER_LOGIN_SUCC"
     return ResUserLogin(
@@ -523,3 +742,71 @@ async def login_user(
         access_token=access_token,
         refresh_token=refresh_token,
     )
+
+
+@router.post(
+    "/users/token/refresh",
+    tags=[tags],
+    status_code=status.HTTP_200_OK,
+    response_model=ResUserToken,
+)
+async def refresh_user_token(
+    req_token: ReqUserTokenRefresh,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+):
+    # 리프레시 토큰 검증 (서명, 만료, 타입)
+    claims = JWTManager.decode_refresh_token(req_token.refresh_token)
+    if not claims:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            headers={"code": "REFRESH_TOKEN_INVALID"},
+            detail=messages["REFRESH_TOKEN_INVALID"],
+        )
+    # 토큰 버전 검증 (비밀번호 변경, 차단, 탈퇴시 폐기)
+    if not token_versions.is_current(claims["user"]["id"], claims.get("ver")):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            headers={"code": "ACCESS_TOKEN_REVOKED"},
+            detail=messages["ACCESS_TOKEN_REVOKED"],
+        )
+    # 리프레시 토큰 교체 (교체와 회원 상태 조회를 한 문장으로 처리)
+    token_id = JWTManager.create_token_id()
+    token_user = await queryset.rotate_user_token_family(
+        db, claims["fam"], claims["jti"], token_id
+    )
+    # 교체 실패: 이미 사용된 토큰의 재사용(탈취 의심)이거나 폐기/만료된 패밀리
+    if token_user is None:
+        await queryset.revoke_user_token_family(db, claims["fam"])
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            headers={"code": "REFRESH_TOKEN_REUSED"},
+            detail=messages["REFRESH_TOKEN_REUSED"],
+        )
+    # 회원 상태 검증 (DB 기준, 토큰 버전 맵 폴링이 중단된 경우에도 폐기 여부 확인)
+    # 거절된 경우 교체된 패밀리도 폐기 (새 토큰은 발급하지 않음)
+    code = None
+    if (claims.get("ver") or 0) < token_user["token_version"]:
+        code = "ACCESS_TOKEN_REVOKED"
+    elif not token_user["is_active"]:
+        code = "USER_LOGIN_AUTH_FAIL"
+    elif token_user["is_block"]:
+        code = "USER_BLOCKED"
+    if code:
+        await queryset.revoke_user_token_family(db, claims["fam"])
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            headers={"code": code},
+            detail=messages[code],
+        )
+    # 토큰 생성 (회원 정보는 DB 에서 확인한 값 사용)
+    user = {
+        "id": token_user["id"],
+        "email": token_user["email"],
+        "token_version": token_user["token_version"],
+    }
+    access_token = JWTManager.create_access_token(user)
+    refresh_token = JWTManager.create_refresh_token(user, claims["fam"], token_id)
+    # Response Header code
+    response.headers["code"] = "REFRESH_TOKEN_SUCC"
+    return ResUserToken(access_token=access_token, refresh_token=refresh_token)
@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends, Response, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.cache.users import user_name_filter
 from app.config.variables import messages
 from app.database.database import get_db
-from app.database.queryset.users import read_user_by_email, read_user_by_nickname
+from app.database.queryset.users import read_user_code_by_email, verify_exist_nickname
 
 from app.security.validator import validate_email
 from app.security import validator
@@ -29,12 +30,13 @@ async def find_user_by_nickname(
         if valid_code != "VALID_NICK_SUCC":
             response.headers["code"] = "VALID_NICK_FAIL"
             return
-        # 닉네임으로 회원정보 조회
-        user = await read_user_by_nickname(db, nickname)
-        # 닉네임 중복 있음
-        if user:
-            response.headers["code"] = "VALID_NICK_EXIST"
-            return
+        # 닉네임 중복 확인 (Bloom filter 에 없으면 DB 조회 없이 사용 가능)
+        if user_name_filter.might_contain_nickname(nickname):
+            is_available = await verify_exist_nickname(db, nickname)
+            # 닉네임 중복 있음
+            if not is_available:
+                response.headers["code"] = "VALID_NICK_EXIST"
+                return
         # 닉네임 중복 없음
         response.headers["code"] = "VALID_NICK_SUCC"
         return
@@ -61,10 +63,12 @@ async def find_user_by_email(
                 detail=messages[validate_code],
                 headers={"code": validate_code},
             )
-        user = await read_user_by_email(db, email)
-        if user:
-            response.headers["code"] = f"VALID_EMAIL_EXIST_{user.type}"
-            return
+        # 이메일 중복 확인 (Bloom filter 에 없으면 DB 조회 없이 사용 가능)
+        if user_name_filter.might_contain_email(email):
+            user_code = await read_user_code_by_email(db, email)
+            if user_code:
+                response.headers["code"] = f"VALID_EMAIL_EXIST_{user_code}"
+                return
         response.headers["code"] = "VALID_EMAIL_SUCC"
         return
     except HTTPException as e:
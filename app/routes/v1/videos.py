@@ -3,8 +3,13 @@ from typing import List
 from fastapi import APIRouter, Request, Response, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.cache.catalog import parse_id_list
+from app.cache.genres import genre_snapshot
 from app.config.variables import messages
-from app.security.verifier import verify_access_token_user
+from app.security.verifier import (
+    verify_access_token_user,
+    verify_video_view_rate_limit,
+)
 from app.database.database import get_db
 from app.database.queryset import videos as queryset
 from app.database.queryset.users import read_user_by_id
@@ -18,6 +23,9 @@ from app.database.schema.videos import (
     VideoStaff,
     VideoReviewWithRating,
     ReqVideoReview,
+    ResActorVideos,
+    ResGenres,
+    ResStaffVideos,
     ResVideo,
     ResVideos,
     ResVideoReviews,
@@ -28,6 +36,9 @@ router = APIRouter()
 tags_video = "VIDEOS"
 tags_review = "REVIEWS"
 tags_rating = "RATINGS"
+tags_genre = "GENRES"
+tags_actor = "ACTORS"
+tags_staff = "STAFF"
 
 
 # 비디오 목록 조회
@@ -43,9 +54,10 @@ async def content_videos(
     q: str = None,  # 검색 키워드
     t: str = None,  # 비디오 타입
     vid: int = None,  # 비디오 ID
-    aid: int = None,  # 배우 ID
-    sid: int = None,  # 스태프 ID
-    gid: int = None,  # 장르 ID
+    aid: str = None,  # 배우 ID (콤마 구분 다중 입력)
+    sid: str = None,  # 스태프 ID (콤마 구분 다중 입력)
+    gid: str = None,  # 장르 ID (콤마 구분 다중 입력)
+    fm: str = "any",  # 다중 필터 조건 (any: 하나라도 포함, all: 모두 포함)
     ob: str = None,  # 정렬 기준
     response: Response = None,
     db: AsyncSession = Depends(get_db),
@@ -86,7 +98,7 @@ async def content_videos(
             "like_desc",
             "like_asc",
             "new_desc",
-            "new_desc",
+            "new_asc",
             "updated_desc",
             "updated_asc",
             "title_desc",
@@ -99,6 +111,23 @@ async def content_videos(
                 headers={"code": "INVALID_PARAM_ORDER_BY"},
                 detail=messages["INVALID_PARAM_ORDER_BY"],
             )
+        # 필터 파라메터 정합성 체크
+        if fm not in ["any", "all"]:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                headers={"code": "INVALID_PARAM_FILTER"},
+                detail=messages["INVALID_PARAM_FILTER"],
+            )
+        try:
+            actor_ids = parse_id_list(aid)
+            staff_ids = parse_id_list(sid)
+            genre_ids = parse_id_list(gid)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                headers={"code": "INVALID_PARAM_FILTER"},
+                detail=messages["INVALID_PARAM_FILTER"],
+            )
         # 비디오 목록 조회
         total, videos = await queryset.search_video_list(
             db,
@@ -107,9 +136,10 @@ async def content_videos(
             video_code=t,
             keyword=q,
             video_id=vid,
-            actor_id=aid,
-            staff_id=sid,
-            genre_id=gid,
+            actor_ids=actor_ids,
+            staff_ids=staff_ids,
+            genre_ids=genre_ids,
+            match_all=fm == "all",
             order_by=ob,
         )
         # 가져온 비디오 컨텐츠 카운트
@@ -253,6 +283,7 @@ async def read_video_detail(
     tags=[tags_video],
     status_code=status.HTTP_200_OK,
     response_model=ResData,
+    dependencies=[Depends(verify_video_view_rate_limit)],
 )
 async def insert_video_view(
     video_id: int,
@@ -800,3 +831,164 @@ async def create_video_rating(
             headers={"code": "EXCEPTION"},
             detail=messages["EXCEPTION"],
         )
+
+
+# 장르 목록 조회 (장르 별 비디오 수 포함)
+@router.get(
+    "/genres",
+    tags=[tags_genre],
+    status_code=status.HTTP_200_OK,
+    response_model=ResGenres,
+)
+async def read_genre_list(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+):
+    try:
+        genres, etag = await genre_snapshot.get(db)
+        # 변경이 없으면 본문 없이 304 반환
+        if request.headers.get("if-none-match") == etag:
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+            )
+        # Response Header
+        response.headers["code"] = "GENRE_READ_SUCC"
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = f"public, max-age={genre_snapshot.ttl}"
+        return ResGenres(count=len(genres), data=genres)
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        print(e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            headers={"code": "EXCEPTION"},
+            detail=messages["EXCEPTION"],
+        )
+
+
+# 배우 정보 및 필모그래피 조회
+@router.get(
+    "/actors/{actor_id}",
+    tags=[tags_actor],
+    status_code=status.HTTP_200_OK,
+    response_model=ResActorVideos,
+)
+async def read_actor_videos(
+    response: Response,
+    actor_id: int,
+    c: int = None,  # 커서 (이전 페이지 마지막 비디오 ID)
+    ps: int = 20,  # 페이지 당 컨텐츠 수
+    db: AsyncSession = Depends(get_db),
+):
+    try:
+        # 배우 ID 파라메터 체크
+        if not actor_id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                headers={"code": "INVALID_PARAM_ACTOR_ID"},
+                detail=messages["INVALID_PARAM_ACTOR_ID"],
+            )
+        # 페이징 파라메터 체크
+        if ps < 5 or ps > 100:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                headers={"code": "INVALID_PARAM_PAGE_SIZE"},
+                detail=messages["INVALID_PARAM_PAGE_SIZE"],
+            )
+        if c is not None and c < 1:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                headers={"code": "INVALID_PARAM_CURSOR"},
+                detail=messages["INVALID_PARAM_CURSOR"],
+            )
+        # 배우 정보 조회
+        actor = await queryset.read_actor_profile(db, actor_id)
+        if not actor:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                headers={"code": "ACTOR_NOT_FOUND"},
+                detail=messages["ACTOR_NOT_FOUND"],
+            )
+        # 필모그래피 조회
+        total, videos, cursor = await queryset.read_person_video_list(
+            db, "actor", actor_id, cursor=c, page_size=ps
+        )
+        # Response Header Code
+        response.headers["code"] = "ACTOR_READ_SUCC"
+        return ResActorVideos(
+            total=total, count=len(videos), cursor=cursor, actor=actor, data=videos
+        )
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        print(e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            headers={"code": "EXCEPTION"},
+            detail=messages["EXCEPTION"],
+        )
+
+
+# 스태프 정보 및 필모그래피 조회
+@router.get(
+    "/staff/{staff_id}",
+    tags=[tags_staff],
+    status_code=status.HTTP_200_OK,
+    response_model=ResStaffVideos,
+)
+async def read_staff_videos(
+    response: Response,
+    staff_id: int,
+    c: int = None,  # 커서 (이전 페이지 마지막 비디오 ID)
+    ps: int = 20,  # 페이지 당 컨텐츠 수
+    db: AsyncSession = Depends(get_db),
+):
+    try:
+        # 스태프 ID 파라메터 체크
+        if not staff_id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                headers={"code": "INVALID_PARAM_STAFF_ID"},
+                detail=messages["INVALID_PARAM_STAFF_ID"],
+            )
+        # 페이징 파라메터 체크
+        if ps < 5 or ps > 100:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                headers={"code": "INVALID_PARAM_PAGE_SIZE"},
+                detail=messages["INVALID_PARAM_PAGE_SIZE"],
+            )
+        if c is not None and c < 1:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                headers={"code": "INVALID_PARAM_CURSOR"},
+                detail=messages["INVALID_PARAM_CURSOR"],
+            )
+        # 스태프 정보 조회
+        staff = await queryset.read_staff_profile(db, staff_id)
+        if not staff:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                headers={"code": "STAFF_NOT_FOUND"},
+                detail=messages["STAFF_NOT_FOUND"],
+            )
+        # 필모그래피 조회
+        total, videos, cursor = await queryset.read_person_video_list(
+            db, "staff", staff_id, cursor=c, page_size=ps
+        )
+        # Response Header Code
+        response.headers["code"] = "STAFF_READ_SUCC"
+        return ResStaffVideos(
+            total=total, count=len(videos), cursor=cursor, staff=staff, data=videos
+        )
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        print(e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            headers={"code": "EXCEPTION"},
+            detail=messages["EXCEPTION"],
+        )
@@ -1,4 +1,12 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 from bcrypt import hashpw, checkpw, gensalt
+from fastapi import HTTPException, status
+
+from app.config.settings import settings
+from app.config.variables import messages
 
 
 class Password:
@@ -20,5 +28,91 @@ class Password:
         return checkpw(cls.encode(plain_password), cls.encode(hashed_password))
 
 
+class PasswordHasher:
+    """
+    bcrypt 해시/검증을 전용 스레드 풀에서 실행합니다. (bcrypt 는 연산 중 GIL 을 해제)
+    대기 중인 작업이 max_pending 을 넘으면 이벤트 루프에 쌓지 않고 503 을 반환합니다.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending = 0
+        # 대기 시간 지표
+        self._completed = 0
+        self._rejected = 0
+        self._queue_time_total = 0.0
+        self._queue_time_max = 0.0
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="password"
+            )
+        return self._executor
+
+    def stats(self):
+        return {
+            "workers": self.max_workers,
+            "pending": self._pending,
+            "completed": self._completed,
+            "rejected": self._rejected,
+            "queue_time_avg": (
+                self._queue_time_total / self._completed if self._completed else 0.0
+            ),
+            "queue_time_max": self._queue_time_max,
+        }
+
+    def _timed(self, func, submitted_at: float, *args):
+        # 풀에서 실행이 시작되기까지의 대기 시간 기록
+        queue_time = time.monotonic() - submitted_at
+        self._queue_time_total += queue_time
+        if queue_time > self._queue_time_max:
+            self._queue_time_max = queue_time
+        return func(*args)
+
+    async def _run(self, func, *args):
+        if self._pending >= self.max_pending:
+            self._rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={"code": "PASSWORD_SERVICE_BUSY", "Retry-After": "1"},
+                detail=messages["PASSWORD_SERVICE_BUSY"],
+            )
+        loop = asyncio.get_running_loop()
+        future = self.executor.submit(self._timed, func, time.monotonic(), *args)
+        self._pending += 1
+        # 요청이 취소(클라이언트 연결 종료 등)되어도 풀의 작업은 계속 실행되므로
+        # 대기 수는 호출 측이 아닌 실제 작업 완료 시점에 감소
+        future.add_done_callback(lambda f: self._schedule_done(loop, f))
+        return await asyncio.wrap_future(future)
+
+    def _schedule_done(self, loop, future):
+        # 풀 스레드에서 호출되므로 카운터 갱신은 이벤트 루프에서 실행 (종료된 루프는 무시)
+        try:
+            loop.call_soon_threadsafe(self._on_done, future)
+        except RuntimeError:
+            pass
+
+    def _on_done(self, future):
+        self._pending -= 1
+        if not future.cancelled():
+            self._completed += 1
+
+    async def hash(self, password: str):
+        return await self._run(Password.create_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str):
+        return await self._run(Password.verify_password, plain_password, hashed_password)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
 
 
+password_hasher = PasswordHasher(
+    settings.PASSWORD_POOL_SIZE, settings.PASSWORD_POOL_MAX_PENDING
+)
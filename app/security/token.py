@@ -1,4 +1,5 @@
 import jwt
+import uuid
 from datetime import datetime, timedelta
 from fastapi import Request, HTTPException, status
 from fastapi.security.utils import get_authorization_scheme_param
@@ -30,6 +31,7 @@ class JWTManager:
                 "id": user['id'],
                 "email": user['email']
             },
+            "ver": user.get('token_version') or 0,
             "exp": exp
         }
         return data
@@ -47,16 +49,40 @@ class JWTManager:
     @classmethod
     def create_access_token(cls, user: dict):
         data = cls.set_token_data(user, float(settings.ACCESS_TOKEN_EXPIRE_TIME))
+        data["typ"] = "access"
         return JWTEncoder.encode(data, settings.SECRET_KEY, settings.ALGORITHM)
 
     @classmethod
-    def create_refresh_token(cls, user: dict):
+    def create_refresh_token(cls, user: dict, family_id: str = None, token_id: str = None):
+        # family_id: 로그인 단위 토큰 패밀리, token_id(jti): 리프레시 마다 교체되는 토큰 ID
         data = cls.set_token_data(user, float(settings.REFRESH_TOKEN_EXPIRE_TIME))
+        data["typ"] = "refresh"
+        data["fam"] = family_id or cls.create_token_id()
+        data["jti"] = token_id or cls.create_token_id()
         return JWTEncoder.encode(data, settings.SECRET_KEY, settings.ALGORITHM)
 
+    @classmethod
+    def create_token_id(cls):
+        return uuid.uuid4().hex
+
     @classmethod
     def decode_access_token(cls, token: str):
-        return JWTEncoder.decode(token)
+        payload = JWTEncoder.decode(token)
+        # 리프레시 토큰은 액세스 토큰으로 사용 불가
+        if payload and payload.get("typ") == "refresh":
+            return None
+        return payload
+
+    @classmethod
+    def decode_refresh_token(cls, token: str):
+        payload = JWTEncoder.decode(token)
+        if not payload or payload.get("typ") != "refresh":
+            return None
+        if not payload.get("fam") or not payload.get("jti"):
+            return None
+        if not cls.verify_access_token_expire(payload):
+            return None
+        return payload
 
     @classmethod
     def verify_access_token_expire(cls, payload: dict):
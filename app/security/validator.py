@@ -1,6 +1,11 @@
 import re
 from app.config.settings import settings
 from app.config.constraints import USER_NICKNAME_NOT_ALLOWED
+from app.utils.matcher import AhoCorasick
+
+
+# 허용되지 않는 닉네임 매처 (부분 문자열, 대소문자/전각/자모 정규화)
+reserved_nickname_matcher = AhoCorasick(USER_NICKNAME_NOT_ALLOWED)
 
 
 def validate_usercode(usercode):
@@ -43,7 +48,7 @@ def validate_nickname(nickname):
     if settings.USER_EMAIL_ALLOW_SPACE and ' ' in nickname:
         return "VALID_NICK_INCLUDE_SPACE_ERR"
     # 허용되지 않는 닉네임
-    if nickname in USER_NICKNAME_NOT_ALLOWED:
+    if reserved_nickname_matcher.search(nickname):
         return "VALID_NICK_FAIL"
     # 모든 조건 통과
     return "VALID_NICK_SUCC"
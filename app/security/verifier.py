@@ -4,13 +4,16 @@ from fastapi.encoders import jsonable_encoder
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.cache.auth import auth_context_cache, token_versions
+from app.cache.ratelimit import rate_limiter
 from app.config.settings import settings
 from app.config.variables import messages
 from app.database.database import get_db
 from app.database.schema.users import User
-from app.database.queryset.users import read_user_by_id, read_user_by_email, insert_user_login_log
+from app.database.queryset.users import read_user_auth_by_id, read_user_by_email
+from app.database.writer import login_log_writer
 from app.network.response import json_response
-from app.security.password import Password
+from app.security.password import password_hasher
 from app.security.token import JWTManager
 from app.utils.formatter import format_datetime
 
@@ -97,7 +100,7 @@ class UserLoginVerifier:
         # 일반 회원
         if self.user['code'] == "10":
             # 비밀번호 일치 여부 확인
-            if not Password.verify_password(self.user['password'], self.get_user['password']):
+            if not await password_hasher.verify(self.user['password'], self.get_user['password']):
                 status_code = status.HTTP_401_UNAUTHORIZED
                 code = "USER_LOGIN_AUTH_FAIL"
                 await self.log_login_attempt(status_code, code)
@@ -153,17 +156,17 @@ class UserLoginVerifier:
             return False
 
     async def log_login_attempt(self, status_code: int, code: str):
-        await insert_user_login_log(
-            self.db,
-            status_code,
-            code,
-            "",
-            "",
-            self.user['email'],
-            self.client_ip,
-            self.client_host,
-            self.user_agent
-        )
+        # 로그인 요청에서는 버퍼에 추가만 하고 기록은 login_log_writer 가 배치로 처리
+        login_log_writer.put({
+            "status": status_code,
+            "code": code,
+            "path": "",
+            "message": "",
+            "input_id": self.user['email'],
+            "client_ip": self.client_ip,
+            "client_host": self.client_host,
+            "user_agent": self.user_agent
+        })
 
 
 def verify_user(user: dict):
@@ -178,10 +181,10 @@ def verify_user_email(email: str):
     return True
 
 
-def verify_user_password(password: str, hashed_password: str):
+async def verify_user_password(password: str, hashed_password: str):
     if not password or not hashed_password:
         return json_response(status.HTTP_401_UNAUTHORIZED, "USER_LOGIN_AUTH_FAIL")
-    if not Password.verify_password(password, hashed_password):
+    if not await password_hasher.verify(password, hashed_password):
         return json_response(status.HTTP_401_UNAUTHORIZED, "USER_LOGIN_AUTH_FAIL")
     return True
 
@@ -204,21 +207,60 @@ def verify_user_isadmin(user: User):
     return True
 
 
+def get_client_ip(request: Request):
+    client_ip = request.headers.get('x-real-ip')
+    if not client_ip:
+        client_ip = request.client.host
+    return client_ip
+
+
+def verify_rate_limit(scope: str, key: str, per_minute: int):
+    is_allowed, retry_after = rate_limiter.hit(scope, key, per_minute)
+    if not is_allowed:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=messages["TOO_MANY_REQUESTS"],
+            headers={"code": "TOO_MANY_REQUESTS", "Retry-After": str(retry_after)}
+        )
+
+
+async def verify_login_rate_limit(request: Request):
+    # DB 세션, bcrypt 이전에 IP, 이메일 단위로 제한
+    verify_rate_limit("login_ip", get_client_ip(request), settings.RATE_LIMIT_LOGIN_IP)
+    try:
+        # FastAPI 가 이미 파싱한 body 캐시 사용
+        body = await request.json()
+        email = body.get('email') if isinstance(body, dict) else None
+    except Exception:
+        email = None
+    if email:
+        verify_rate_limit("login_email", str(email).lower(), settings.RATE_LIMIT_LOGIN_EMAIL)
+
+
+async def verify_video_view_rate_limit(request: Request):
+    verify_rate_limit("video_view_ip", get_client_ip(request), settings.RATE_LIMIT_VIDEO_VIEW_IP)
+
+
+def decode_request_token(request: Request):
+    # 토큰 존재 유무 검증
+    is_token, code, token = JWTManager.get_access_token(request)
+    if not is_token or not token:
+        return json_response(status.HTTP_400_BAD_REQUEST, "ACCESS_TOKEN_REQUIRE")
+    # 토큰 정합성 검증 (디코딩은 한 번만)
+    decoded_token = JWTManager.decode_access_token(token)
+    if not decoded_token:
+        return json_response(status.HTTP_400_BAD_REQUEST, "ACCESS_TOKEN_INVALID")
+    # 토큰 만료 검증
+    is_unexpire = JWTManager.verify_access_token_expire(decoded_token)
+    if not is_unexpire:
+        return json_response(status.HTTP_400_BAD_REQUEST, "ACCESS_TOKEN_EXPIRED")
+    return token, decoded_token
+
+
 def verify_access_token(request: Request):
     # 토큰 검증
     try:
-        # 토큰 존재 유무 검증
-        is_token, code, token = JWTManager.get_access_token(request)
-        if not is_token or not token:
-            return json_response(status.HTTP_400_BAD_REQUEST, "ACCESS_TOKEN_REQUIRE")
-        # 토큰 정합성 검증
-        decoded_token = JWTManager.decode_access_token(token)
-        if not JWTManager.decode_access_token(token):
-            return json_response(status.HTTP_400_BAD_REQUEST, "ACCESS_TOKEN_INVALID")
-        # 토큰 만료 검증
-        is_unexpire = JWTManager.verify_access_token_expire(decoded_token)
-        if not is_unexpire:
-            return json_response(status.HTTP_400_BAD_REQUEST, "ACCESS_TOKEN_EXPIRED")
+        token, _ = decode_request_token(request)
         # 결과 출력
         return token
     except HTTPException as e:
@@ -228,22 +270,54 @@ def verify_access_token(request: Request):
 
 
 async def verify_access_token_user(request: Request, db: AsyncSession = Depends(get_db)):
-    token = verify_access_token(request)
-    # 토큰 검증
     try:
-        decoded_token = JWTManager.decode_access_token(token)
-        # 토큰 유저 검증
-        user = await read_user_by_id(db, decoded_token['user']['id'])
-        if not user:
-            return json_response(status.HTTP_500_INTERNAL_SERVER_ERROR, "EXCEPTION")
+        # 캐시된 토큰 검증 결과
+        is_token, code, token = JWTManager.get_access_token(request)
+        if is_token and token:
+            cached = auth_context_cache.get(token)
+            if cached:
+                claims, user = cached
+                # 토큰 버전 검증 (비밀번호 변경, 차단, 탈퇴시 폐기)
+                if not token_versions.is_current(user['id'], claims.get('ver')):
+                    return json_response(status.HTTP_401_UNAUTHORIZED, "ACCESS_TOKEN_REVOKED")
+                return user
+        # 토큰 검증
+        token, decoded_token = decode_request_token(request)
+        # 토큰 버전 검증
+        user_id = decoded_token['user']['id']
+        if not token_versions.is_current(user_id, decoded_token.get('ver')):
+            return json_response(status.HTTP_401_UNAUTHORIZED, "ACCESS_TOKEN_REVOKED")
+        # 토큰 버전 맵이 최신이면 DB 조회 없이 토큰 정보 사용
+        # (차단, 비활성화, 탈퇴는 rvvs_user 트리거/쿼리셋에서 토큰 버전을 증가시키므로
+        # 버전이 같으면 로그인 당시 상태가 유지됨)
+        if token_versions.is_fresh and 'ver' in decoded_token:
+            user = {
+                'id': user_id,
+                'email': decoded_token['user']['email'],
+                'is_active': True,
+                'is_block': False,
+            }
+            auth_context_cache.set(token, decoded_token, user)
+            return user
+        # 토큰 유저 검증 (버전 없는 토큰, 버전 맵 갱신 지연시)
+        user = await read_user_auth_by_id(db, user_id)
         if not user:
             return json_response(status.HTTP_400_BAD_REQUEST, "USER_NOT_FOUND")
         # 토큰 유저 일치 검증
-        if not secrets.compare_digest(user.email, decoded_token['user']['email']):
+        if not secrets.compare_digest(user['email'], decoded_token['user']['email']):
             return json_response(status.HTTP_401_UNAUTHORIZED, "USER_NOT_MATCH")
+        # 회원 상태 검증
+        if not user['is_active']:
+            return json_response(status.HTTP_401_UNAUTHORIZED, "USER_LOGIN_AUTH_FAIL")
+        if user['is_block']:
+            return json_response(status.HTTP_401_UNAUTHORIZED, "USER_BLOCKED")
+        # 검증 결과 캐시
+        auth_context_cache.set(token, decoded_token, user)
         # 결과 출력
-        return jsonable_encoder(user)
-    except HTTPException:
+        return user
+    except HTTPException as e:
+        raise e
+    except Exception:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=messages['EXCEPTION'],
@@ -2,9 +2,6 @@ import os
 import uuid
 from urllib.request import urlretrieve
 
-from app.config.settings import settings
-from app.utils.s3client import S3Client
-
 
 class File:
     @classmethod
@@ -76,37 +73,6 @@ class File:
             print(e)
             return False
 
-    @classmethod
-    def update_to_s3(cls, path, s3_path):
-        # Upload the file to s3
-        file_name = cls.get_filename_from_path(path)
-        s3 = None
-        try:
-            if cls.is_file(path):
-                s3 = S3Client()
-                upload_object = s3.upload_file(path, s3_path + file_name)
-                s3.close()
-                return upload_object
-            return False
-        except Exception as e:
-            print(e)
-            return False
-        finally:
-            if s3:
-                s3.close()
-
-    @classmethod
-    def delete_from_s3(cls, s3_path):
-        # Delete the file from s3
-        try:
-            s3 = S3Client()
-            s3.delete_file(s3_path)
-            s3.close()
-            return True
-        except Exception as e:
-            print(e)
-            return False
-
     @classmethod
     def get_filename_from_path(cls, path):
         # Get the filename from the path
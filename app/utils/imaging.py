@@ -0,0 +1,89 @@
+import hashlib
+from io import BytesIO
+
+from PIL import Image, ImageOps
+
+
+# 이미지 처리 함수 (프로세스 풀에서 실행되므로 모듈 수준 함수로 정의하고 설정/DB 의존성 없음)
+
+
+def resize_image(image, size):
+    aspect_ratio = image.height / image.width
+    if image.width >= image.height:  # 가로 이미지
+        width = size
+        height = int(size * aspect_ratio)
+    else:  # 세로 이미지
+        height = size
+        width = int(size / aspect_ratio)
+
+    return image.resize((width, height), Image.Resampling.LANCZOS)
+
+
+# 변형 이미지 포맷별 확장자
+VARIANT_EXTENSIONS = {"WEBP": "webp", "JPEG": "jpg"}
+
+
+def make_variant_key(base_path: str, width: int, image_format: str):
+    # users/profile/images/1/uuid.png -> users/profile/images/1/uuid_160.webp
+    base_path = base_path.rsplit(".", 1)[0]
+    return f"{base_path}_{width}.{VARIANT_EXTENSIONS[image_format]}"
+
+
+def process_image_variant(data: bytes | str, width: int, image_formats: list[str]):
+    # 한 너비의 변형 이미지를 포맷별로 생성, [(포맷, 인코딩된 바이트, 이미지 정보)] 반환
+    # data 는 이미지 바이트 또는 임시 파일 경로 (큰 파일은 경로만 프로세스 풀로 전달)
+    with Image.open(BytesIO(data) if isinstance(data, bytes) else data) as source:
+        # JPEG 는 draft 모드로 필요한 크기 이상의 가장 작은 1/2^n 스케일로만 디코딩
+        # (EXIF 회전 전이므로 가로/세로 모두 width 이상 요청)
+        if source.format == "JPEG":
+            source.draft("RGB", (width, width))
+        # EXIF 방향 적용
+        image = ImageOps.exif_transpose(source)
+        has_alpha = image.mode in ("RGBA", "LA") or (
+            image.mode == "P" and "transparency" in image.info
+        )
+        image = image.convert("RGBA" if has_alpha else "RGB")
+        # 긴 쪽 기준 리사이즈 (확대 없음)
+        if max(image.size) > width:
+            image = resize_image(image, width)
+        variants = []
+        for image_format in image_formats:
+            output = image
+            if image_format == "JPEG" and has_alpha:
+                # JPEG 는 알파 채널이 없으므로 흰 배경에 합성
+                output = Image.new("RGB", image.size, (255, 255, 255))
+                output.paste(image, mask=image.getchannel("A"))
+            # exif/icc 를 전달하지 않으므로 메타데이터 제거됨
+            with BytesIO() as buffer:
+                output.save(buffer, format=image_format, quality=85, optimize=True)
+                encoded = buffer.getvalue()
+            variants.append(
+                (
+                    image_format,
+                    encoded,
+                    {
+                        "extension": image_format,
+                        "width": output.width,
+                        "height": output.height,
+                        "size": len(encoded),
+                    },
+                )
+            )
+    return variants
+
+
+def hash_image(data: bytes | str):
+    # 내용 SHA-256 과 원본 크기 (파일 경로는 청크 단위로 읽음), 크기는 헤더만 읽어 확인
+    digest = hashlib.sha256()
+    if isinstance(data, bytes):
+        digest.update(data)
+        size = len(data)
+    else:
+        size = 0
+        with open(data, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+                size += len(chunk)
+    with Image.open(BytesIO(data) if isinstance(data, bytes) else data) as image:
+        width, height = image.size
+    return digest.hexdigest(), width, height, size
@@ -0,0 +1,248 @@
+import os
+import tempfile
+from io import BytesIO
+from urllib.parse import parse_qsl
+
+from fastapi import HTTPException, Request, status
+from multipart.multipart import MultipartParser, parse_options_header
+from starlette.concurrency import run_in_threadpool
+
+from app.config.settings import settings
+from app.config.variables import messages
+
+
+# 매직 바이트 -> MIME 타입
+FILE_SIGNATURES = [
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"BM", "image/bmp"),
+]
+FILE_SIGNATURE_SIZE = 16
+# 파일 외 텍스트 필드 전체 크기 제한
+FORM_FIELDS_SIZE_LIMIT = 64 * 1024
+
+
+def sniff_content_type(header: bytes):
+    # 파일 앞부분으로 실제 타입 판별, 알 수 없으면 None
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "image/webp"
+    for signature, content_type in FILE_SIGNATURES:
+        if header.startswith(signature):
+            return content_type
+    return None
+
+
+class IngestedFile:
+    """
+    스트리밍으로 수신한 업로드 파일
+    spool_threshold 까지는 메모리에 두고, 넘으면 FILE_DIR_TEMP 아래 임시 파일로 옮겨 기록합니다.
+    """
+
+    def __init__(self, filename: str | None, spool_threshold: int):
+        self.filename = filename
+        self.content_type: str | None = None
+        self.size = 0
+        self.path: str | None = None
+        self._spool_threshold = spool_threshold
+        self._buffer: BytesIO | None = BytesIO()
+        self._file = None
+        self._header = b""
+
+    @property
+    def source(self):
+        # 이미지 처리 입력 (메모리: bytes, 디스크: 파일 경로)
+        return self.path if self.path else self._buffer.getvalue()
+
+    async def write(self, data: bytes):
+        self.size += len(data)
+        if len(self._header) < FILE_SIGNATURE_SIZE:
+            self._header += data[: FILE_SIGNATURE_SIZE - len(self._header)]
+        if self._file is None and self.size > self._spool_threshold:
+            # 메모리 한도 초과시 임시 파일로 전환
+            os.makedirs(settings.FILE_DIR_TEMP, exist_ok=True)
+            self._file = tempfile.NamedTemporaryFile(
+                dir=settings.FILE_DIR_TEMP, delete=False
+            )
+            self.path = self._file.name
+            await run_in_threadpool(self._file.write, self._buffer.getvalue())
+            self._buffer = None
+        if self._file is not None:
+            await run_in_threadpool(self._file.write, data)
+        else:
+            self._buffer.write(data)
+
+    async def finish(self):
+        if self._file is not None:
+            await run_in_threadpool(self._file.close)
+
+    def sniff(self):
+        # 헤더가 충분히 모였거나 파일이 끝난 경우에만 판별 가능
+        return sniff_content_type(self._header)
+
+    def close(self):
+        if self._file is not None and not self._file.closed:
+            self._file.close()
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+        self.path = None
+        self._buffer = None
+
+
+def _raise(status_code: int, code: str):
+    raise HTTPException(
+        status_code=status_code, headers={"code": code}, detail=messages[code]
+    )
+
+
+async def ingest_multipart(
+    request: Request,
+    file_field: str,
+    size_limit: int = settings.FILE_UPLOAD_SIZE_LIMIT,
+    allowed_types: list = settings.FILE_UPLOAD_TYPE_ALLOWED,
+    spool_threshold: int = settings.FILE_UPLOAD_SPOOL_THRESHOLD,
+):
+    """
+    multipart 본문을 청크 단위로 읽으면서 file_field 파일을 수신합니다.
+    크기 초과(413) 또는 허용되지 않는 타입(400)이면 본문을 끝까지 읽지 않고 즉시 중단하며,
+    파일 타입은 content-type 헤더가 아닌 매직 바이트로 판별합니다.
+    반환: (텍스트 필드 dict, IngestedFile 또는 None)
+    """
+    # Content-Length 로 미리 거절
+    content_length = request.headers.get("content-length", "")
+    content_length = int(content_length) if content_length.isdigit() else 0
+    if content_length > size_limit + FORM_FIELDS_SIZE_LIMIT:
+        _raise(status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, "FILE_SIZE_ERR")
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    if content_type != b"multipart/form-data":
+        # 파일 없는 요청 (urlencoded 폼 또는 빈 본문)
+        if content_type == b"application/x-www-form-urlencoded":
+            if content_length > FORM_FIELDS_SIZE_LIMIT:
+                _raise(status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, "FILE_SIZE_ERR")
+            # Content-Length 없는(chunked) 본문도 읽는 동안 크기 제한
+            body = b""
+            async for chunk in request.stream():
+                body += chunk
+                if len(body) > FORM_FIELDS_SIZE_LIMIT:
+                    _raise(status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, "FILE_SIZE_ERR")
+            form = parse_qsl(body.decode("utf-8", "replace"), keep_blank_values=True)
+            return dict(form), None
+        return {}, None
+    boundary = params.get(b"boundary")
+    if not boundary:
+        _raise(status.HTTP_400_BAD_REQUEST, "FILE_NOT_FOUND")
+
+    fields: dict[str, str] = {}
+    fields_size = 0
+    upload: IngestedFile | None = None
+    # 파서 콜백은 동기 함수이므로 이벤트만 모아서 청크마다 처리
+    events: list[tuple[str, bytes | None]] = []
+    header_field = b""
+    header_value = b""
+    part: dict = {}
+
+    def on_part_begin():
+        events.append(("begin", None))
+
+    def on_header_field(data, start, end):
+        nonlocal header_field
+        header_field += data[start:end]
+
+    def on_header_value(data, start, end):
+        nonlocal header_value
+        header_value += data[start:end]
+
+    def on_header_end():
+        nonlocal header_field, header_value
+        events.append(("header", header_field.lower() + b"\0" + header_value))
+        header_field = b""
+        header_value = b""
+
+    def on_headers_finished():
+        events.append(("headers_finished", None))
+
+    def on_part_data(data, start, end):
+        events.append(("data", data[start:end]))
+
+    def on_part_end():
+        events.append(("end", None))
+
+    parser = MultipartParser(
+        boundary,
+        {
+            "on_part_begin": on_part_begin,
+            "on_part_data": on_part_data,
+            "on_part_end": on_part_end,
+            "on_header_field": on_header_field,
+            "on_header_value": on_header_value,
+            "on_header_end": on_header_end,
+            "on_headers_finished": on_headers_finished,
+        },
+    )
+    try:
+        async for chunk in request.stream():
+            parser.write(chunk)
+            for event, data in events:
+                if event == "begin":
+                    part = {"headers": {}, "target": None, "value": b""}
+                elif event == "header":
+                    name, value = data.split(b"\0", 1)
+                    part["headers"][name] = value
+                elif event == "headers_finished":
+                    _, options = parse_options_header(
+                        part["headers"].get(b"content-disposition", b"")
+                    )
+                    part["name"] = options.get(b"name", b"").decode("latin-1")
+                    if b"filename" in options:
+                        # 지정된 파일 필드 하나만 수신, 나머지 파일은 버림
+                        if part["name"] == file_field and upload is None:
+                            upload = IngestedFile(
+                                options[b"filename"].decode("utf-8", "replace"),
+                                spool_threshold,
+                            )
+                            part["target"] = "file"
+                        else:
+                            part["target"] = "skip"
+                    else:
+                        part["target"] = "field"
+                elif event == "data":
+                    if part["target"] == "file":
+                        await upload.write(data)
+                        if upload.size > size_limit:
+                            _raise(
+                                status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, "FILE_SIZE_ERR"
+                            )
+                        # 시그니처 길이만큼 모이면 바로 타입 검사
+                        if (
+                            upload.content_type is None
+                            and upload.size >= FILE_SIGNATURE_SIZE
+                        ):
+                            upload.content_type = upload.sniff()
+                            if upload.content_type not in allowed_types:
+                                _raise(status.HTTP_400_BAD_REQUEST, "FILE_TYPE_ERR")
+                    elif part["target"] == "field":
+                        fields_size += len(data)
+                        if fields_size > FORM_FIELDS_SIZE_LIMIT:
+                            _raise(status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, "FILE_SIZE_ERR")
+                        part["value"] += data
+                elif event == "end":
+                    if part["target"] == "field":
+                        fields[part["name"]] = part["value"].decode("utf-8", "replace")
+            events.clear()
+        parser.finalize()
+        if upload is not None:
+            await upload.finish()
+            # 시그니처보다 작은 파일
+            if upload.content_type is None:
+                upload.content_type = upload.sniff()
+            if upload.size == 0:
+                upload.close()
+                upload = None
+            elif upload.content_type not in allowed_types:
+                _raise(status.HTTP_400_BAD_REQUEST, "FILE_TYPE_ERR")
+        return fields, upload
+    except Exception:
+        if upload is not None:
+            upload.close()
+        raise
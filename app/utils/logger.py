@@ -4,9 +4,13 @@ from datetime import datetime
 from logging.handlers import TimedRotatingFileHandler
 
 
+# 앱 공용 로거 이름 (핸들러는 Logger 생성시 등록, 다른 모듈은 logging.getLogger(LOGGER_NAME) 사용)
+LOGGER_NAME = "FastAPI_Logger"
+
+
 class Logger:
     def __init__(self, log_dir="logs", log_level=logging.INFO):
-        self.logger = logging.getLogger("FastAPI_Logger")
+        self.logger = logging.getLogger(LOGGER_NAME)
         self.logger.setLevel(log_level)
 
         # Ensure log directory exists
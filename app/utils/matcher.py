@@ -0,0 +1,90 @@
+import unicodedata
+from collections import deque
+
+
+def _build_jamo_table():
+    # 초성/중성/종성 조합형 자모 -> 호환 자모 (ᄀ, ᆨ -> ㄱ)
+    table = {}
+    for code in range(0x1100, 0x1200):
+        name = unicodedata.name(chr(code), "")
+        for prefix in ("HANGUL CHOSEONG ", "HANGUL JUNGSEONG ", "HANGUL JONGSEONG "):
+            if name.startswith(prefix):
+                try:
+                    letter = unicodedata.lookup("HANGUL LETTER " + name[len(prefix):])
+                except KeyError:
+                    break
+                table[code] = letter
+                break
+    return table
+
+
+JAMO_TABLE = _build_jamo_table()
+
+
+def normalize_text(text: str):
+    """
+    비교용 문자열 정규화
+    전각/호환 문자(NFKC), 대소문자, 한글 음절/자모 표기 차이를 없애고 문자/숫자만 남깁니다.
+    예: "ＡＤＭＩＮ" -> "admin", "관리자" / "ㄱㅘㄴㄹㅣㅈㅏ" -> "ㄱㅘㄴㄹㅣㅈㅏ"
+    """
+    text = unicodedata.normalize("NFKC", text).casefold()
+    text = unicodedata.normalize("NFD", text).translate(JAMO_TABLE)
+    return "".join(char for char in text if char.isalnum())
+
+
+class AhoCorasick:
+    """
+    여러 단어의 부분 문자열 포함 여부를 입력 길이에 비례하는 시간에 검사합니다.
+    단어와 입력은 모두 normalize_text 로 정규화한 뒤 비교합니다.
+    """
+
+    def __init__(self, words: list[str]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[str | None] = [None]
+        for word in words:
+            self._add(word)
+        self._build()
+
+    def _add(self, word: str):
+        normalized = normalize_text(word)
+        if not normalized:
+            return
+        state = 0
+        for char in normalized:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(None)
+            state = next_state
+        self._output[state] = word
+
+    def _build(self):
+        # BFS 로 실패 링크 계산, 실패 링크 쪽 출력도 상속 (가장 먼저 발견되는 단어만 보관)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(char, 0)
+                self._fail[next_state] = fail
+                if self._output[next_state] is None:
+                    self._output[next_state] = self._output[fail]
+
+    def search(self, text: str):
+        # 처음 발견된 단어 반환, 없으면 None
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for char in normalize_text(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state] is not None:
+                return output[state]
+        return None
@@ -0,0 +1,165 @@
+import asyncio
+import hashlib
+import mimetypes
+from io import BytesIO
+from urllib.parse import urljoin, urlsplit
+
+import aiohttp
+from PIL import Image
+
+from app.config.settings import settings
+from app.utils.ingest import FILE_SIGNATURE_SIZE, sniff_content_type
+from app.utils.storage import StorageBackend, storage
+
+
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+
+def is_allowed_url(url: str, allowed_hosts) -> bool:
+    # 허용된 호스트의 https URL 인지 확인
+    parts = urlsplit(url)
+    return parts.scheme == "https" and parts.hostname in allowed_hosts
+
+
+class RemoteImageIngestor:
+    """
+    외부 URL 이미지를 수집해 스토리지에 저장합니다. (포스터/프로필 가져오기)
+    워커 공유 aiohttp 세션으로 한 번만 다운로드하고, 내용 SHA-256 을 키로 저장하므로
+    이미 저장된 이미지는 업로드를 건너뜁니다. 같은 URL/내용의 동시 요청은 하나로 합칩니다.
+    """
+
+    def __init__(
+        self,
+        storage: StorageBackend,
+        size_limit: int = settings.REMOTE_IMAGE_SIZE_LIMIT,
+        timeout: int = settings.REMOTE_IMAGE_TIMEOUT,
+        pool_size: int = settings.REMOTE_IMAGE_POOL_SIZE,
+        concurrency: int = settings.REMOTE_IMAGE_CONCURRENCY,
+        max_redirects: int = 3,
+    ):
+        self.storage = storage
+        self.size_limit = size_limit
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.concurrency = concurrency
+        self.max_redirects = max_redirects
+        self._session: aiohttp.ClientSession | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        # 진행 중인 다운로드(URL별)/저장(키별) 공유
+        self._fetching: dict[str, asyncio.Task] = {}
+        self._storing: dict[str, asyncio.Task] = {}
+
+    @property
+    def session(self):
+        # 이벤트 루프 안에서 최초 사용시 생성
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    @property
+    def semaphore(self):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._semaphore
+
+    async def fetch(self, url: str, allowed_hosts: tuple[str, ...] | None = None):
+        # (본문, SHA-256) 반환, 크기 제한을 넘으면 본문을 끝까지 받지 않고 중단
+        # 해시는 청크 단위로 계산해 전체 본문 해시로 이벤트 루프를 막지 않음
+        # 리다이렉트는 직접 따라가며 allowed_hosts 가 있으면 매 단계 URL 을 확인
+        async with self.semaphore:
+            for _ in range(self.max_redirects + 1):
+                if allowed_hosts is not None and not is_allowed_url(url, allowed_hosts):
+                    raise ValueError(f"Remote image URL not allowed: {url}")
+                async with self.session.get(url, allow_redirects=False) as response:
+                    if response.status in REDIRECT_STATUSES:
+                        location = response.headers.get("Location")
+                        if not location:
+                            raise ValueError(f"Redirect without location: {url}")
+                        url = urljoin(url, location)
+                        continue
+                    response.raise_for_status()
+                    if (response.content_length or 0) > self.size_limit:
+                        raise ValueError(f"Remote image too large: {url}")
+                    buffer = BytesIO()
+                    digest = hashlib.sha256()
+                    async for chunk in response.content.iter_chunked(64 * 1024):
+                        buffer.write(chunk)
+                        if buffer.tell() > self.size_limit:
+                            raise ValueError(f"Remote image too large: {url}")
+                        digest.update(chunk)
+                    return buffer.getvalue(), digest.hexdigest()
+            raise ValueError(f"Too many redirects: {url}")
+
+    async def _store(self, key: str, data: bytes, content_type: str):
+        # 이미 저장된 내용이면 업로드 생략
+        if await self.storage.stat(key):
+            return True
+        await self.storage.put(key, data, content_type)
+        return False
+
+    async def _ingest(self, url: str, s3_dir: str, allowed_hosts):
+        data, digest = await self.fetch(url, allowed_hosts)
+        content_type = sniff_content_type(data[:FILE_SIGNATURE_SIZE])
+        if content_type not in settings.FILE_UPLOAD_TYPE_ALLOWED:
+            raise ValueError(f"Unsupported remote image type: {url}")
+        # 헤더만 읽으므로 이벤트 루프에서 실행
+        with Image.open(BytesIO(data)) as image:
+            image_format = image.format
+            image_width, image_height = image.size
+        key = f"{s3_dir}{digest}{mimetypes.guess_extension(content_type)}"
+        task = self._storing.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._store(key, data, content_type))
+            self._storing[key] = task
+            task.add_done_callback(lambda _: self._storing.pop(key, None))
+        existed = await asyncio.shield(task)
+        return {
+            "url": key,
+            "hash": digest,
+            "extension": image_format,
+            "width": image_width,
+            "height": image_height,
+            "size": len(data),
+            "existed": existed,
+        }
+
+    async def ingest(
+        self, url: str, s3_dir: str, allowed_hosts: list[str] | None = None
+    ):
+        # 저장 결과(url, hash, extension, width, height, size, existed) 반환, 실패시 None
+        # allowed_hosts 가 있으면 리다이렉트를 포함한 모든 요청을 허용 호스트의 https 로 제한
+        if allowed_hosts is not None:
+            allowed_hosts = tuple(sorted(allowed_hosts))
+        # 호스트 제한이 다른 요청끼리는 다운로드를 공유하지 않음
+        fetch_key = f"{s3_dir}\0{url}\0{allowed_hosts}"
+        task = self._fetching.get(fetch_key)
+        if task is None:
+            task = asyncio.ensure_future(self._ingest(url, s3_dir, allowed_hosts))
+            self._fetching[fetch_key] = task
+            task.add_done_callback(lambda _: self._fetching.pop(fetch_key, None))
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"Failed to ingest the remote image: {e}")
+            return None
+
+    async def ingest_many(
+        self, urls: list[str], s3_dir: str, allowed_hosts: list[str] | None = None
+    ):
+        # 입력 순서대로 결과 반환 (동시 다운로드 수는 semaphore 로 제한)
+        return await asyncio.gather(
+            *[self.ingest(url, s3_dir, allowed_hosts) for url in urls]
+        )
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+remote_image_ingestor = RemoteImageIngestor(storage)
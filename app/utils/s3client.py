@@ -1,27 +1,108 @@
+import threading
+
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from app.config.settings import settings
 
 
+class StorageClientManager:
+    """
+    워커 단위 공유 S3 client
+    자격 증명/엔드포인트 해석과 커넥션 풀 생성을 워커당 한 번만 하고 모든 업로드/삭제 경로가 재사용합니다.
+    (boto3 client 는 스레드 간 공유 가능, lifespan 에서 start/close)
+    """
+
+    def __init__(
+        self,
+        access_key_id: str = settings.AWS_S3_ACCESS_KEY_ID,
+        secret_access_key: str = settings.AWS_S3_SECRET_ACCESS_KEY,
+        region: str = settings.AWS_S3_BUCKET_REGION,
+        endpoint_url: str = settings.AWS_S3_ENDPOINT_URL,
+        max_pool_connections: int = settings.AWS_S3_MAX_POOL_CONNECTIONS,
+    ):
+        self.access_key_id = access_key_id
+        self.secret_access_key = secret_access_key
+        self.region = region
+        self.endpoint_url = endpoint_url
+        self.config = Config(
+            max_pool_connections=max_pool_connections,
+            connect_timeout=settings.AWS_S3_CONNECT_TIMEOUT,
+            read_timeout=settings.AWS_S3_READ_TIMEOUT,
+            retries={"max_attempts": settings.AWS_S3_MAX_ATTEMPTS, "mode": "standard"},
+            tcp_keepalive=True,
+        )
+        self._client = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self):
+        # lifespan 밖(스크립트 등)에서 사용시 최초 접근에 생성
+        if self._client is None:
+            self.start()
+        return self._client
+
+    def start(self):
+        # client 생성은 스레드 안전하지 않으므로 잠금 후 한 번만 생성
+        with self._lock:
+            if self._client is None:
+                self._client = boto3.session.Session().client(
+                    "s3",
+                    aws_access_key_id=self.access_key_id,
+                    aws_secret_access_key=self.secret_access_key,
+                    region_name=self.region,
+                    endpoint_url=self.endpoint_url,
+                    config=self.config,
+                )
+        return self._client
+
+    def close(self):
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+
+storage_clients = StorageClientManager()
+
+
 class S3Client:
     def __init__(
             self,
             aws_s3_access_key_id: str = settings.AWS_S3_ACCESS_KEY_ID,
             aws_s3_secret_access_key: str = settings.AWS_S3_SECRET_ACCESS_KEY,
             aws_s3_bucket_name: str = settings.AWS_S3_BUCKET_NAME,
-            aws_s3_bucket_region: str = settings.AWS_S3_BUCKET_REGION
+            aws_s3_bucket_region: str = settings.AWS_S3_BUCKET_REGION,
+            aws_s3_endpoint_url: str = settings.AWS_S3_ENDPOINT_URL,
+            client=None
     ):
         self.aws_s3_access_key_id = aws_s3_access_key_id
         self.aws_s3_secret_access_key = aws_s3_secret_access_key
         self.aws_s3_bucket_name = aws_s3_bucket_name
         self.aws_s3_bucket_region = aws_s3_bucket_region
 
-        self.client = boto3.client(
-            "s3",
-            aws_access_key_id=self.aws_s3_access_key_id,
-            aws_secret_access_key=self.aws_s3_secret_access_key,
-            region_name=self.aws_s3_bucket_region
-        )
+        # 기본 설정이면 워커 공유 client 사용, 다른 자격 증명/엔드포인트면 전용 client 생성
+        self._owns_client = False
+        if client is not None:
+            self.client = client
+        elif (
+            aws_s3_access_key_id == storage_clients.access_key_id
+            and aws_s3_secret_access_key == storage_clients.secret_access_key
+            and aws_s3_bucket_region == storage_clients.region
+            and aws_s3_endpoint_url == storage_clients.endpoint_url
+        ):
+            self.client = storage_clients.client
+        else:
+            self.client = boto3.client(
+                "s3",
+                aws_access_key_id=self.aws_s3_access_key_id,
+                aws_secret_access_key=self.aws_s3_secret_access_key,
+                region_name=self.aws_s3_bucket_region,
+                endpoint_url=aws_s3_endpoint_url,
+                config=storage_clients.config
+            )
+            self._owns_client = True
         
     def upload_file(self, path_from, path_to):
         try:
@@ -29,13 +110,87 @@ class S3Client:
                 raise ClientError("S3 client not initialized")
             if not path_from or not path_to:
                 raise ClientError("Invalid file path or destination")
-            self.client.upload_file(path_from, self.aws_s3_bucket_name, path_to)
+            self.client.upload_file(
+                path_from,
+                self.aws_s3_bucket_name,
+                path_to,
+                Config=TransferConfig(
+                    multipart_threshold=settings.STORAGE_MULTIPART_THRESHOLD,
+                    multipart_chunksize=settings.STORAGE_MULTIPART_PART_SIZE,
+                    max_concurrency=settings.STORAGE_MULTIPART_CONCURRENCY,
+                ),
+            )
             return path_to
         
         except ClientError as e:
             str(e)
             return False
 
+    def put_object(self, object_name, data, content_type=None):
+        # 메모리 데이터 업로드 (실패시 예외 전달)
+        extra = {'ContentType': content_type} if content_type else {}
+        self.client.put_object(
+            Bucket=self.aws_s3_bucket_name, Key=object_name, Body=data, **extra
+        )
+        return object_name
+
+    def create_multipart_upload(self, object_name, content_type=None):
+        extra = {'ContentType': content_type} if content_type else {}
+        response = self.client.create_multipart_upload(
+            Bucket=self.aws_s3_bucket_name, Key=object_name, **extra
+        )
+        return response['UploadId']
+
+    def upload_part(self, object_name, upload_id, part_number, data):
+        response = self.client.upload_part(
+            Bucket=self.aws_s3_bucket_name,
+            Key=object_name,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=data,
+        )
+        return response['ETag']
+
+    def complete_multipart_upload(self, object_name, upload_id, parts):
+        # parts: [(part_number, etag)]
+        self.client.complete_multipart_upload(
+            Bucket=self.aws_s3_bucket_name,
+            Key=object_name,
+            UploadId=upload_id,
+            MultipartUpload={
+                'Parts': [
+                    {'PartNumber': number, 'ETag': etag} for number, etag in parts
+                ]
+            },
+        )
+        return object_name
+
+    def abort_multipart_upload(self, object_name, upload_id):
+        # 업로드된 파트 정리 (실패해도 버킷 lifecycle 로 정리되므로 예외 전달 안함)
+        try:
+            self.client.abort_multipart_upload(
+                Bucket=self.aws_s3_bucket_name, Key=object_name, UploadId=upload_id
+            )
+        except Exception as e:
+            print(e)
+
+    def delete_files(self, object_names):
+        # 한 요청에 최대 1000 개씩 일괄 삭제, 삭제된 개수 반환
+        deleted = 0
+        for i in range(0, len(object_names), 1000):
+            try:
+                result = self.client.delete_objects(
+                    Bucket=self.aws_s3_bucket_name,
+                    Delete={
+                        'Objects': [{'Key': key} for key in object_names[i:i + 1000]],
+                        'Quiet': False,
+                    },
+                )
+                deleted += len(result.get('Deleted', []))
+            except Exception as e:
+                print(e)
+        return deleted
+
     def delete_file(self, object_name):
         try:
             if not self.client:
@@ -64,7 +219,46 @@ class S3Client:
             print(e)
             return None
 
+    def create_presigned_post(self, object_name, content_type, max_size, expiration=600):
+        # 클라이언트 직접 업로드용 presigned POST (Content-Type, 크기 조건 포함)
+        try:
+            return self.client.generate_presigned_post(
+                Bucket=self.aws_s3_bucket_name,
+                Key=object_name,
+                Fields={'Content-Type': content_type},
+                Conditions=[
+                    {'Content-Type': content_type},
+                    ['content-length-range', 1, max_size],
+                ],
+                ExpiresIn=expiration
+            )
+        except Exception as e:
+            print(e)
+            return None
+
+    def head_file(self, object_name):
+        # 업로드된 객체 메타데이터 (ContentLength, ContentType), 없으면 None
+        try:
+            return self.client.head_object(Bucket=self.aws_s3_bucket_name, Key=object_name)
+        except Exception as e:
+            print(e)
+            return None
+
+    def read_file(self, object_name):
+        try:
+            response = self.client.get_object(Bucket=self.aws_s3_bucket_name, Key=object_name)
+            return response['Body'].read()
+        except Exception as e:
+            print(e)
+            return None
+
+    def download_file(self, object_name, path):
+        # 객체를 파일로 스트리밍 저장 (전체를 메모리에 올리지 않음, 실패시 예외 전달)
+        self.client.download_file(self.aws_s3_bucket_name, object_name, path)
+        return path
+
     def close(self):
-        if self.client:
+        # 공유 client 는 lifespan 종료시 storage_clients.close() 에서 닫힘
+        if self.client and self._owns_client:
             self.client.close()
         
\ No newline at end of file
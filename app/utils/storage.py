@@ -0,0 +1,336 @@
+import asyncio
+import mimetypes
+import os
+import shutil
+import tempfile
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+
+from app.config.settings import settings
+from app.utils.s3client import S3Client
+
+
+class StorageBackend(ABC):
+    """
+    비동기 객체 스토리지 인터페이스
+    data 는 bytes 또는 로컬 파일 경로이며, blocking I/O 는 구현체의 스레드 풀에서 실행합니다.
+    """
+
+    def __init__(self, io_workers: int):
+        self.io_workers = io_workers
+        self._pool: ThreadPoolExecutor | None = None
+
+    @property
+    def pool(self):
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.io_workers, thread_name_prefix="storage-io"
+            )
+        return self._pool
+
+    async def run_io(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.pool, func, *args)
+
+    @staticmethod
+    def guess_content_type(key: str):
+        return mimetypes.guess_type(key)[0]
+
+    @abstractmethod
+    async def put(self, key: str, data: bytes | str, content_type: str | None = None):
+        # 저장 후 key 반환, 실패시 예외
+        pass
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        pass
+
+    @abstractmethod
+    async def get_file(self, key: str, path: str) -> str:
+        # 객체를 로컬 파일로 저장 후 path 반환, 실패시 예외
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def delete_many(self, keys: list[str]) -> int:
+        # 삭제된 개수 반환
+        pass
+
+    @abstractmethod
+    async def presign(
+        self, key: str, content_type: str, max_size: int, expiration: int
+    ) -> dict | None:
+        # 클라이언트 직접 업로드용 {"url", "fields"}, 지원하지 않으면 None
+        pass
+
+    @abstractmethod
+    async def stat(self, key: str) -> dict | None:
+        # {"size", "content_type"}, 없으면 None
+        pass
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+class S3StorageBackend(StorageBackend):
+    """
+    S3 스토리지 (워커 공유 S3 client 를 스레드 풀에서 사용)
+    multipart_threshold 를 넘는 객체는 파트 단위로 나눠 동시에 업로드하고, 파트별로 재시도하며
+    실패시 multipart 업로드를 중단(abort)해 업로드된 파트를 정리합니다.
+    """
+
+    # S3 제한: 마지막 파트 외 최소 5MB, 최대 10000 파트
+    MULTIPART_MIN_PART_SIZE = 1024 * 1024 * 5
+    MULTIPART_MAX_PARTS = 10000
+
+    def __init__(
+        self,
+        io_workers: int,
+        client: S3Client | None = None,
+        multipart_threshold: int = settings.STORAGE_MULTIPART_THRESHOLD,
+        multipart_part_size: int = settings.STORAGE_MULTIPART_PART_SIZE,
+        multipart_concurrency: int = settings.STORAGE_MULTIPART_CONCURRENCY,
+        multipart_retries: int = settings.STORAGE_MULTIPART_RETRIES,
+    ):
+        super().__init__(io_workers)
+        self._client = client
+        self.multipart_threshold = multipart_threshold
+        self.multipart_part_size = max(multipart_part_size, self.MULTIPART_MIN_PART_SIZE)
+        self.multipart_concurrency = multipart_concurrency
+        self.multipart_retries = multipart_retries
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = S3Client()
+        return self._client
+
+    def _put(self, key, data, content_type):
+        # 단일 요청 업로드 (multipart_threshold 이하)
+        if isinstance(data, str):
+            with open(data, "rb") as f:
+                return self.client.put_object(key, f, content_type)
+        return self.client.put_object(key, data, content_type)
+
+    @staticmethod
+    def _read_part(data, offset: int, size: int):
+        # 파일은 파트 단위로만 읽어 메모리 사용량을 (동시 파트 수 x 파트 크기)로 제한
+        if isinstance(data, str):
+            with open(data, "rb") as f:
+                return os.pread(f.fileno(), size, offset)
+        return data[offset : offset + size]
+
+    def _upload_part(self, key, upload_id, part_number, data, offset, size):
+        return self.client.upload_part(
+            key, upload_id, part_number, self._read_part(data, offset, size)
+        )
+
+    async def _put_multipart(self, key, data, size, content_type):
+        # 파트 수가 최대치를 넘지 않도록 파트 크기 조정
+        part_size = max(
+            self.multipart_part_size, -(-size // self.MULTIPART_MAX_PARTS)
+        )
+        upload_id = await self.run_io(
+            self.client.create_multipart_upload, key, content_type
+        )
+        semaphore = asyncio.Semaphore(self.multipart_concurrency)
+
+        async def upload_part(part_number: int, offset: int):
+            async with semaphore:
+                for attempt in range(self.multipart_retries + 1):
+                    try:
+                        etag = await self.run_io(
+                            self._upload_part,
+                            key,
+                            upload_id,
+                            part_number,
+                            data,
+                            offset,
+                            min(part_size, size - offset),
+                        )
+                        return part_number, etag
+                    except Exception as e:
+                        if attempt >= self.multipart_retries:
+                            raise
+                        print(f"Retry part {part_number} of {key}: {e}")
+                        await asyncio.sleep(0.2 * 2**attempt)
+
+        tasks = [
+            asyncio.create_task(upload_part(number, offset))
+            for number, offset in enumerate(range(0, size, part_size), start=1)
+        ]
+        try:
+            parts = await asyncio.gather(*tasks)
+            return await self.run_io(
+                self.client.complete_multipart_upload, key, upload_id, parts
+            )
+        except BaseException:
+            # 남은 파트 취소 후 업로드 중단 (취소된 경우에도 정리)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await asyncio.shield(
+                self.run_io(self.client.abort_multipart_upload, key, upload_id)
+            )
+            raise
+
+    async def put(self, key, data, content_type=None):
+        content_type = content_type or self.guess_content_type(key)
+        size = os.path.getsize(data) if isinstance(data, str) else len(data)
+        if size > self.multipart_threshold:
+            return await self._put_multipart(key, data, size, content_type)
+        return await self.run_io(self._put, key, data, content_type)
+
+    async def get(self, key):
+        return await self.run_io(self.client.read_file, key)
+
+    async def get_file(self, key, path):
+        return await self.run_io(self.client.download_file, key, path)
+
+    async def delete(self, key):
+        return bool(await self.run_io(self.client.delete_file, key))
+
+    async def delete_many(self, keys):
+        if not keys:
+            return 0
+        return await self.run_io(self.client.delete_files, list(keys))
+
+    async def presign(self, key, content_type, max_size, expiration):
+        # 서명은 로컬 계산이지만 client 생성/자격 증명 조회가 있을 수 있어 스레드 풀에서 실행
+        return await self.run_io(
+            self.client.create_presigned_post, key, content_type, max_size, expiration
+        )
+
+    async def stat(self, key):
+        head = await self.run_io(self.client.head_file, key)
+        if not head:
+            return None
+        return {
+            "size": head.get("ContentLength", 0),
+            "content_type": head.get("ContentType"),
+        }
+
+    def close(self):
+        super().close()
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+
+class LocalStorageBackend(StorageBackend):
+    """
+    로컬 디스크 스토리지 (CI/성능 측정 등 네트워크 없는 환경용)
+    파일 경로 입력은 os.sendfile 로 커널 내 복사하고, 임시 파일에 쓴 뒤 rename 으로 교체합니다.
+    """
+
+    def __init__(self, io_workers: int, root: str):
+        super().__init__(io_workers)
+        self.root = os.path.abspath(root)
+
+    def _path(self, key: str):
+        path = os.path.abspath(os.path.join(self.root, key))
+        if not path.startswith(self.root + os.sep):
+            raise ValueError(f"Invalid storage key: {key}")
+        return path
+
+    @staticmethod
+    def _copy_file(source_path: str, target):
+        with open(source_path, "rb") as source:
+            size = os.fstat(source.fileno()).st_size
+            offset = 0
+            try:
+                while offset < size:
+                    sent = os.sendfile(
+                        target.fileno(), source.fileno(), offset, size - offset
+                    )
+                    if sent == 0:
+                        break
+                    offset += sent
+            except (AttributeError, OSError):
+                # sendfile 미지원 플랫폼/파일시스템
+                source.seek(offset)
+                target.seek(offset)
+                shutil.copyfileobj(source, target)
+
+    def _put(self, key, data):
+        path = self._path(key)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=directory, delete=False) as target:
+            try:
+                if isinstance(data, str):
+                    self._copy_file(data, target)
+                else:
+                    target.write(data)
+            except Exception:
+                os.remove(target.name)
+                raise
+        os.replace(target.name, path)
+        return key
+
+    def _get(self, key):
+        try:
+            with open(self._path(key), "rb") as f:
+                return f.read()
+        except Exception as e:
+            print(e)
+            return None
+
+    def _get_file(self, key, path):
+        with open(path, "wb") as target:
+            self._copy_file(self._path(key), target)
+        return path
+
+    def _delete(self, key):
+        try:
+            os.remove(self._path(key))
+            return True
+        except Exception as e:
+            print(e)
+            return False
+
+    def _stat(self, key):
+        try:
+            size = os.path.getsize(self._path(key))
+        except (OSError, ValueError):
+            return None
+        return {"size": size, "content_type": self.guess_content_type(key)}
+
+    async def put(self, key, data, content_type=None):
+        return await self.run_io(self._put, key, data)
+
+    async def get(self, key):
+        return await self.run_io(self._get, key)
+
+    async def get_file(self, key, path):
+        return await self.run_io(self._get_file, key, path)
+
+    async def delete(self, key):
+        return await self.run_io(self._delete, key)
+
+    async def delete_many(self, keys):
+        results = await asyncio.gather(*[self.delete(key) for key in keys])
+        return sum(results)
+
+    async def presign(self, key, content_type, max_size, expiration):
+        # 로컬 스토리지는 클라이언트 직접 업로드 미지원
+        return None
+
+    async def stat(self, key):
+        return await self.run_io(self._stat, key)
+
+
+def create_storage_backend(backend: str = settings.STORAGE_BACKEND):
+    if backend == "local":
+        return LocalStorageBackend(
+            settings.STORAGE_IO_POOL_SIZE, settings.STORAGE_LOCAL_DIR
+        )
+    return S3StorageBackend(settings.STORAGE_IO_POOL_SIZE)
+
+
+storage = create_storage_backend()
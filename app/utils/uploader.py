@@ -1,139 +1,175 @@
-from abc import ABC, abstractmethod
-from io import BytesIO
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 
-import boto3
-import requests
-from PIL import Image
+from fastapi import HTTPException, status
+from PIL import Image, UnidentifiedImageError
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.config.settings import settings
+from app.config.variables import messages
+from app.database.queryset.default import create_image_hash, read_image_hash
+from app.utils.storage import StorageBackend, storage
+from app.utils.utils import make_hash_s3_path
+from app.utils.imaging import (
+    hash_image,
+    make_variant_key,
+    process_image_variant,
+)
 
 
-class ImageUploader(ABC):
-    @abstractmethod
-    def upload_from_file(self, file_path, s3_path):
-        pass
+class ImageService:
+    """
+    이미지 처리/업로드를 이벤트 루프 밖에서 실행합니다.
+    디코딩/리사이즈/인코딩(CPU)은 프로세스 풀, 저장(I/O)은 스토리지 백엔드의 스레드 풀에서 처리하며
+    처리 중인 요청이 max_pending 을 넘으면 503 을 반환합니다.
+    """
 
-    @abstractmethod
-    def upload_from_url(self, image_url, s3_path):
-        pass
+    def __init__(self, process_workers: int, max_pending: int, storage: StorageBackend):
+        self.process_workers = process_workers
+        self.max_pending = max_pending
+        self.storage = storage
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._pending = 0
 
-    @abstractmethod
-    def close(self):
-        pass
+    @property
+    def process_pool(self):
+        if self._process_pool is None:
+            # 스레드/이벤트 루프가 있는 워커를 fork 하지 않도록 spawn 사용
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.process_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._process_pool
 
+    def _check_pending(self):
+        if self._pending >= self.max_pending:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={"code": "IMAGE_SERVICE_BUSY", "Retry-After": "1"},
+                detail=messages["IMAGE_SERVICE_BUSY"],
+            )
 
-class S3ImageUploader(ImageUploader):
-    def __init__(
+    async def upload_variants(
         self,
-        uploader=None,
-        region=settings.AWS_S3_BUCKET_REGION,
-        bucket=settings.AWS_S3_BUCKET_NAME,
-        access_key_id=settings.AWS_S3_ACCESS_KEY_ID,
-        secret_access_key=settings.AWS_S3_SECRET_ACCESS_KEY,
+        data: bytes | str,
+        s3_path: str,
+        widths: list[int] = settings.PROFILE_IMAGE_WIDTHS,
+        image_formats: list[str] = settings.PROFILE_IMAGE_FORMATS,
+        default_width: int = settings.PROFILE_IMAGE_DEFAULT_WIDTH,
     ):
-        # S3 Client 생성
-        if uploader is None:
-            self.uploader = boto3.client(
-                "s3",
-                aws_access_key_id=access_key_id,
-                aws_secret_access_key=secret_access_key,
-                region_name=region,
-            )
-        else:
-            self.uploader = uploader
-        # S3 Bucket 설정
-        self.bucket = bucket
-
-    # 파일에서 이미지 생성 및 S3 업로드
-    def upload_from_file(self, file, s3_path, resize_width=None):
+        # 너비별 변형 이미지를 병렬 생성/업로드
+        # 반환: {"url": 기본 변형 키, "variants": {"160_webp": 키, ...}}, 실패시 None
+        self._check_pending()
+        loop = asyncio.get_running_loop()
+        # 너비별로 프로세스 풀에서 병렬 처리
+        futures = [
+            self.process_pool.submit(process_image_variant, data, width, image_formats)
+            for width in widths
+        ]
+        release = self._hold_slot(loop, futures)
         try:
-            print(s3_path)
-            # 파일 오픈
-            with Image.open(BytesIO(file)) as image:
-                image_format = image.format
-                image_width, image_height = image.size
-                # 이미지 리사이즈
-                if resize_width:
-                    # 이미지 리사이즈
-                    if image_width > resize_width:
-                        image = self.resize_image(image, resize_width)
-                    # 리사이즈된 이미지 정보 가져오기
-                    image_width = image.width
-                    image_height = image.height
-
-                # 리사이즈된 이미지를 BytesIO 형태로 저장
-                with BytesIO() as buffer:
-                    # 리사이즈된 이미지 저장
-                    image.save(buffer, format=image_format)
-                    image_size = buffer.tell()
-                    # 버퍼 처음 위치로 재설정
-                    buffer.seek(0)
-                    # S3에 이미지 업로드
-                    self.upload(buffer, s3_path)
-                # 이미지 파일명, 확장자, 사이즈 리턴
-                return {
-                    "url": s3_path,
-                    "extension": image_format,
-                    "width": image_width,
-                    "height": image_height,
-                    "size": image_size,
-                }
+            results = await asyncio.gather(
+                *[asyncio.wrap_future(future) for future in futures]
+            )
+            variants = {}
+            uploads = []
+            for width, encoded_variants in zip(widths, results):
+                for image_format, encoded, _ in encoded_variants:
+                    key = make_variant_key(s3_path, width, image_format)
+                    variants[f"{width}_{image_format.lower()}"] = key
+                    uploads.append(self.storage.put(key, encoded))
+            await asyncio.gather(*uploads)
+            # 기본 이미지는 호환성을 위해 JPEG
+            default_format = "JPEG" if "JPEG" in image_formats else image_formats[0]
+            return {
+                "url": make_variant_key(s3_path, default_width, default_format),
+                "variants": variants,
+            }
         except Exception as e:
             print(f"Failed to process the image: {e}")
             return None
+        finally:
+            release()
+
+    def _hold_slot(self, loop, futures):
+        # 요청이 취소(클라이언트 연결 종료 등)되어도 풀의 작업은 계속 실행되므로
+        # 대기 수는 요청 처리와 제출한 작업이 모두 끝난 시점에 감소, 요청 종료시 호출할 함수 반환
+        self._pending += 1
+        remaining = len(futures) + 1
+
+        def on_done(_=None):
+            nonlocal remaining
+            remaining -= 1
+            if remaining == 0:
+                self._pending -= 1
+
+        for future in futures:
+            future.add_done_callback(lambda f: self._schedule_done(loop, on_done, f))
+        return on_done
 
-    # 이미지 URL에서 이미지 다운로드 후 S3 업로드
-    def upload_from_url(self, image_url, s3_path):
+    @staticmethod
+    def _schedule_done(loop, callback, future):
+        # 풀 스레드에서 호출되므로 카운터 갱신은 이벤트 루프에서 실행 (종료된 루프는 무시)
         try:
-            # 이미지URL에서 다운로드
-            response = requests.get(image_url)
-            response.raise_for_status()
-            response = requests.get(image_url)
-            # Ensure we handle HTTP errors
-            # 이미지 데이터 가져오기
-            with BytesIO(response.content) as image_data:
-                # 이미지 사이즈, 확장자 가져오기
-                with Image.open(image_data) as image:
-                    image_format = image.format
-                    image_width, image_height = image.size
-                # Reset the buffer's current position to the beginning
-                image_size = len(response.content)
-                image_data.seek(0)
-                # S3에 이미지 업로드
-                self.uploader.upload_fileobj(image, self.bucket, s3_path)
-                # 이미지 확장자, 사이즈 리턴
-                return {
-                    "url": s3_path,
-                    "extension": image_format,
-                    "width": image_width,
-                    "height": image_height,
-                    "size": image_size,
-                }
-        except Exception as e:
-            print(f"Failed to process the image: {e}")
-            return None
+            loop.call_soon_threadsafe(callback, future)
+        except RuntimeError:
+            pass
 
-    # 이미지 S3 업로드
-    def upload(self, image, s3_path):
+    async def upload_variants_by_hash(
+        self,
+        db: AsyncSession,
+        data: bytes | str,
+        upload_type: str,
+        widths: list[int] = settings.PROFILE_IMAGE_WIDTHS,
+        image_formats: list[str] = settings.PROFILE_IMAGE_FORMATS,
+        default_width: int = settings.PROFILE_IMAGE_DEFAULT_WIDTH,
+    ):
+        # 내용 해시 기반 키로 변형 이미지 저장
+        # 이미 처리된 이미지면 인덱스의 키를 그대로 반환 (이미지 처리/업로드 없음)
+        # 이미지로 읽을 수 없는 본문은 클라이언트 오류(400), 그 외 실패는 None
         try:
-            self.uploader.upload_fileobj(image, self.bucket, s3_path)
-            print(f"Image uploaded to {self.bucket}/{s3_path}")
+            digest, width, height, size = await self.storage.run_io(hash_image, data)
+        except (UnidentifiedImageError, Image.DecompressionBombError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                headers={"code": "FILE_TYPE_ERR"},
+                detail=messages["FILE_TYPE_ERR"],
+            )
         except Exception as e:
-            print(f"Failed to upload the image to S3: {e}")
-            raise e
+            print(f"Failed to read the image: {e}")
+            return None
+        indexed = await read_image_hash(db, digest, upload_type)
+        if indexed:
+            return {"url": indexed["url"], "variants": indexed["variants"]}
+        uploaded = await self.upload_variants(
+            data,
+            make_hash_s3_path(upload_type, digest),
+            widths,
+            image_formats,
+            default_width,
+        )
+        if uploaded:
+            await create_image_hash(
+                db,
+                digest,
+                upload_type,
+                uploaded["url"],
+                uploaded["variants"],
+                width,
+                height,
+                size,
+            )
+        return uploaded
 
-    # 이미지 리사이즈
-    @classmethod
-    def resize_image(cls, image, size):
-        aspect_ratio = image.height / image.width
-        if image.width >= image.height:  # 가로 이미지
-            width = size
-            height = int(size * aspect_ratio)
-        else:  # 세로 이미지
-            height = size
-            width = int(size / aspect_ratio)
+    def shutdown(self):
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+        self.storage.close()
 
-        return image.resize((width, height), Image.Resampling.LANCZOS)
 
-    # S3 클라이언트 종료
-    def close(self):
-        self.uploader.close()
+image_service = ImageService(
+    settings.IMAGE_PROCESS_POOL_SIZE,
+    settings.IMAGE_SERVICE_MAX_PENDING,
+    storage,
+)
@@ -4,7 +4,7 @@ from app.config.settings import settings
 
 def make_s3_path(upload_type, key, file_name):
     # 업로드 타입이 actor, staff, video가 아니면 False 반환
-    if upload_type not in ["actor", "staff", "video", "profile"]:
+    if upload_type not in ["actor", "staff", "video", "profile", "profile_upload"]:
         return False
     # 파일명이나 키가 없으면 False 반환
     if not file_name or not key:
@@ -14,6 +14,8 @@ def make_s3_path(upload_type, key, file_name):
     # 업로드 타입에 따라 기본 경로 설정
     if upload_type == "profile":
         base_path = settings.AWS_S3_PATH_USER_PROFILE_IMAGE
+    elif upload_type == "profile_upload":
+        base_path = settings.AWS_S3_PATH_USER_PROFILE_UPLOAD
     # 기본 경로 끝이 /로 끝나지 않으면 /를 추가
     if not base_path.endswith("/"):
         base_path = f"{base_path}/"
@@ -30,3 +32,16 @@ def make_s3_path(upload_type, key, file_name):
     file_name = f"{uuid.uuid4()}.{file_ext}"
     # S3 경로 반환
     return f"{base_path}{file_name}"
+
+
+def make_hash_s3_path(upload_type, digest):
+    # 내용 해시 기반 경로 (같은 이미지는 같은 키, 디렉토리 분산을 위해 해시 앞 2자리 사용)
+    # users/profile/images/ab/ab12...(32자)
+    if upload_type not in ["profile"] or not digest:
+        return False
+    base_path = ""
+    if upload_type == "profile":
+        base_path = settings.AWS_S3_PATH_USER_PROFILE_IMAGE
+    if not base_path.endswith("/"):
+        base_path = f"{base_path}/"
+    return f"{base_path}{digest[:2]}/{digest[:32]}"
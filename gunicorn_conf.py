@@ -64,4 +64,27 @@ log_data = {
     "host": host,
     "port": port,
 }
-print(json.dumps(log_data))
\ No newline at end of file
+print(json.dumps(log_data))
+
+# Catalog snapshot builder
+# CATALOG_SNAPSHOT_PATH 가 설정된 경우 워커와 별도의 빌더 프로세스가 스냅샷을 기록하고
+# 워커들은 이를 읽기 전용 mmap 으로 공유합니다.
+def on_starting(server):
+    # 레이트 리밋 공유 버킷은 서버 시작마다 초기화 (워커들이 각각 열어서 공유)
+    rate_limit_path = os.getenv("RATE_LIMIT_SHM_PATH")
+    if rate_limit_path and os.path.exists(rate_limit_path):
+        os.remove(rate_limit_path)
+    if not os.getenv("CATALOG_SNAPSHOT_PATH"):
+        return
+    import subprocess
+    import sys
+
+    server.catalog_builder = subprocess.Popen(
+        [sys.executable, "-m", "app.cache.builder"]
+    )
+
+
+def on_exit(server):
+    builder = getattr(server, "catalog_builder", None)
+    if builder and builder.poll() is None:
+        builder.terminate()
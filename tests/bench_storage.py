@@ -0,0 +1,143 @@
+"""
+업로드 1회당 오버헤드 벤치마크 (요청마다 S3 client 생성 vs 워커 공유 client)
+
+S3 호환 스토리지(MinIO, LocalStack 등)에 대해 실행:
+    AWS_S3_ENDPOINT_URL=http://localhost:9000 AWS_S3_BUCKET_NAME=bench \
+    AWS_S3_ACCESS_KEY_ID=... AWS_S3_SECRET_ACCESS_KEY=... python tests/bench_storage.py
+AWS_S3_ENDPOINT_URL 이 없으면 PUT 만 처리하는 로컬 S3 대역 서버를 띄워 측정합니다.
+LocalStorageBackend(네트워크 없음) 결과도 함께 출력합니다.
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+for key, value in {
+    "TIME_ZONE": "Asia/Seoul",
+    "DB_DRIVER": "postgresql+asyncpg",
+    "DB_HOST": "localhost",
+    "DB_PORT": "5432",
+    "DB_NAME": "bench",
+}.items():
+    os.environ.setdefault(key, value)
+
+UPLOADS = int(os.getenv("BENCH_UPLOADS", 200))
+OBJECT_SIZE = int(os.getenv("BENCH_OBJECT_SIZE", 32 * 1024))
+
+
+class StubS3Handler(BaseHTTPRequestHandler):
+    # PUT Object 만 처리하는 S3 대역 (keep-alive 지원)
+    protocol_version = "HTTP/1.1"
+
+    def do_PUT(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("ETag", '"bench"')
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_s3():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubS3Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def report(name: str, durations: list[float]):
+    durations = sorted(durations)
+    print(
+        f"{name:<32} mean {statistics.mean(durations) * 1000:7.2f}ms  "
+        f"p50 {durations[len(durations) // 2] * 1000:7.2f}ms  "
+        f"p95 {durations[int(len(durations) * 0.95) - 1] * 1000:7.2f}ms"
+    )
+
+
+def bench_s3(endpoint_url: str):
+    import boto3
+
+    from app.config.settings import settings
+    from app.utils.s3client import S3Client, StorageClientManager
+
+    bucket = settings.AWS_S3_BUCKET_NAME or "bench"
+    credentials = {
+        "aws_access_key_id": settings.AWS_S3_ACCESS_KEY_ID or "bench",
+        "aws_secret_access_key": settings.AWS_S3_SECRET_ACCESS_KEY or "bench",
+        "region_name": settings.AWS_S3_BUCKET_REGION or "us-east-1",
+    }
+    manager = StorageClientManager(
+        credentials["aws_access_key_id"],
+        credentials["aws_secret_access_key"],
+        credentials["region_name"],
+        endpoint_url,
+    )
+    data = os.urandom(OBJECT_SIZE)
+
+    # 변경 전: 업로드마다 client 생성 (자격 증명/엔드포인트 해석, 새 커넥션 풀)
+    before = []
+    for index in range(UPLOADS):
+        started = time.perf_counter()
+        client = boto3.client("s3", endpoint_url=endpoint_url, **credentials)
+        client.put_object(Bucket=bucket, Key=f"bench/before/{index}", Body=data)
+        client.close()
+        before.append(time.perf_counter() - started)
+
+    # 변경 후: 워커 공유 client 재사용
+    after = []
+    s3 = S3Client(
+        credentials["aws_access_key_id"],
+        credentials["aws_secret_access_key"],
+        bucket,
+        credentials["region_name"],
+        endpoint_url,
+        client=manager.start(),
+    )
+    for index in range(UPLOADS):
+        started = time.perf_counter()
+        s3.put_object(f"bench/after/{index}", data)
+        after.append(time.perf_counter() - started)
+    manager.close()
+
+    print(f"S3 {endpoint_url}, {UPLOADS} uploads x {OBJECT_SIZE} bytes")
+    report("before (client per upload)", before)
+    report("after (shared client)", after)
+
+
+def bench_local():
+    from app.utils.storage import LocalStorageBackend
+
+    data = os.urandom(OBJECT_SIZE)
+
+    async def main(root: str):
+        backend = LocalStorageBackend(4, root)
+        durations = []
+        for index in range(UPLOADS):
+            started = time.perf_counter()
+            await backend.put(f"bench/{index}", data)
+            durations.append(time.perf_counter() - started)
+        backend.close()
+        return durations
+
+    with tempfile.TemporaryDirectory() as root:
+        report("LocalStorageBackend.put", asyncio.run(main(root)))
+
+
+if __name__ == "__main__":
+    endpoint_url = os.getenv("AWS_S3_ENDPOINT_URL")
+    server = None
+    if not endpoint_url:
+        server, endpoint_url = start_stub_s3()
+    try:
+        bench_s3(endpoint_url)
+        bench_local()
+    finally:
+        if server is not None:
+            server.shutdown()
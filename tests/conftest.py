@@ -0,0 +1,15 @@
+import os
+import sys
+
+# 설정 모듈 import 에 필요한 최소 환경 변수 (DB 연결은 하지 않음)
+os.environ.setdefault("TIME_ZONE", "Asia/Seoul")
+os.environ.setdefault("DB_DRIVER", "postgresql+asyncpg")
+os.environ.setdefault("DB_HOST", "localhost")
+os.environ.setdefault("DB_PORT", "5432")
+os.environ.setdefault("DB_NAME", "test")
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_TIME", "30")
+os.environ.setdefault("REFRESH_TOKEN_EXPIRE_TIME", "1440")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,58 @@
+import asyncio
+import contextlib
+
+import numpy as np
+import pytest
+
+from app.cache.catalog import CatalogState, Postings, VideoCatalog
+
+
+def make_empty_state(link_video_id: int | None = None):
+    # 비디오가 없는 상태 (링크 테이블에만 남은 행이 있을 수 있음)
+    keys = np.array([] if link_video_id is None else [1], np.uint32)
+    values = np.array([] if link_video_id is None else [link_video_id], np.uint32)
+    postings = {
+        name: Postings.from_pairs(keys, values) for name in ("genre", "actor", "staff")
+    }
+    return CatalogState(
+        np.empty(0, np.uint32), CatalogState._rows_to_columns([]), postings
+    )
+
+
+@pytest.mark.parametrize("link_video_id", [None, 5])
+def test_empty_catalog_returns_empty_results(link_video_id):
+    catalog = VideoCatalog(snapshot_path=None)
+    catalog._state = make_empty_state(link_video_id)
+    assert catalog.search() == (0, [])
+    assert catalog.search(order_by="view_desc") == (0, [])
+    assert catalog.search(genre_ids=[1], order_by="view_desc") == (0, [])
+    assert catalog.search(genre_ids=[1, 2], actor_ids=[1]) == (0, [])
+    assert catalog.person_videos("actor", 1) == (0, [])
+
+
+def test_corrupt_snapshot_falls_back_to_db(tmp_path, monkeypatch):
+    path = tmp_path / "catalog.snapshot"
+    path.write_bytes(b"corrupt" * 8)
+    catalog = VideoCatalog(snapshot_path=str(path))
+    refreshed = []
+
+    async def refresh(db):
+        refreshed.append(db)
+        catalog._state = make_empty_state()
+
+    monkeypatch.setattr(catalog, "refresh", refresh)
+
+    @contextlib.asynccontextmanager
+    async def session_factory():
+        yield "db"
+
+    async def main():
+        task = asyncio.create_task(catalog.run(session_factory))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(main())
+    assert not catalog.reload_snapshot()
+    assert refreshed == ["db"]
+    assert catalog.is_ready
@@ -0,0 +1,104 @@
+import asyncio
+import time
+from io import BytesIO
+
+import httpx
+import numpy as np
+import pytest
+from fastapi import FastAPI, HTTPException
+from PIL import Image
+
+from app.utils.storage import LocalStorageBackend
+from app.utils.uploader import ImageService
+
+
+def make_image(size: int = 2000):
+    # 압축이 잘 되지 않는 노이즈 이미지 (디코딩/리사이즈/인코딩 부하)
+    pixels = np.random.default_rng(0).integers(0, 255, (size, size, 3), np.uint8)
+    buffer = BytesIO()
+    Image.fromarray(pixels).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def make_app(image_service: ImageService, data: bytes):
+    app = FastAPI()
+
+    @app.post("/upload/{index}")
+    async def upload(index: int):
+        return await image_service.upload_variants(data, f"test/{index}.jpg")
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+
+def test_requests_served_during_uploads(tmp_path):
+    # 이미지 처리 중에도 다른 요청의 응답 시간이 일정 수준 이하로 유지
+    image_service = ImageService(2, 8, LocalStorageBackend(2, str(tmp_path)))
+    data = make_image()
+
+    async def main():
+        transport = httpx.ASGITransport(app=make_app(image_service, data))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            # 프로세스 풀 기동
+            await client.post("/upload/0")
+            started = time.perf_counter()
+            uploads = asyncio.gather(*[client.post(f"/upload/{i}") for i in range(1, 5)])
+            latencies = []
+            while not uploads.done():
+                ping_started = time.perf_counter()
+                response = await client.get("/ping")
+                assert response.status_code == 200
+                latencies.append(time.perf_counter() - ping_started)
+                await asyncio.sleep(0.01)
+            responses = await uploads
+            return time.perf_counter() - started, latencies, responses
+
+    try:
+        elapsed, latencies, responses = asyncio.run(main())
+    finally:
+        image_service.shutdown()
+    assert all(response.json()["variants"] for response in responses)
+    assert len(latencies) >= 5
+    # 업로드 전체 시간보다 훨씬 짧은 응답 시간
+    assert max(latencies) < max(0.2, elapsed / 4)
+
+
+def test_cancelled_upload_keeps_slot_until_jobs_finish(tmp_path):
+    image_service = ImageService(1, 1, LocalStorageBackend(1, str(tmp_path)))
+    data = make_image(1500)
+
+    async def main():
+        task = asyncio.create_task(image_service.upload_variants(data, "test/a.jpg"))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        # 취소 후에도 프로세스 풀 작업이 끝날 때까지 자리 유지
+        held = image_service._pending
+        deadline = time.monotonic() + 60
+        while image_service._pending and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+        return held, image_service._pending
+
+    try:
+        held, pending = asyncio.run(main())
+    finally:
+        image_service.shutdown()
+    assert held == 1
+    assert pending == 0
+
+
+def test_undecodable_image_is_client_error(tmp_path):
+    # 이미지가 아닌 본문은 저장 실패(None)와 구분되는 400 FILE_TYPE_ERR
+    image_service = ImageService(1, 1, LocalStorageBackend(1, str(tmp_path)))
+    try:
+        with pytest.raises(HTTPException) as e:
+            asyncio.run(
+                image_service.upload_variants_by_hash(None, b"not an image", "profile")
+            )
+    finally:
+        image_service.shutdown()
+    assert e.value.status_code == 400
+    assert e.value.headers["code"] == "FILE_TYPE_ERR"
@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.utils.ingest import FORM_FIELDS_SIZE_LIMIT, ingest_multipart
+
+
+def make_request(chunks: list[bytes], headers: list[tuple[bytes, bytes]]):
+    # Content-Length 없이 청크로 전송되는 본문
+    received = []
+
+    async def receive():
+        body = chunks[len(received)]
+        received.append(body)
+        return {
+            "type": "http.request",
+            "body": body,
+            "more_body": len(received) < len(chunks),
+        }
+
+    request = Request(
+        {"type": "http", "method": "POST", "path": "/", "headers": headers}, receive
+    )
+    return request, received
+
+
+URLENCODED = (b"content-type", b"application/x-www-form-urlencoded")
+
+
+def test_chunked_urlencoded_form_parsed():
+    request, _ = make_request(
+        [b"nickname=%EA%B9%80+kim&", b"profile_text="], [URLENCODED]
+    )
+    fields, upload = asyncio.run(ingest_multipart(request, "profile_image"))
+    assert fields == {"nickname": "김 kim", "profile_text": ""}
+    assert upload is None
+
+
+def test_chunked_urlencoded_form_size_limited():
+    # 제한을 넘는 순간 중단 (나머지 본문은 읽지 않음)
+    chunks = [b"a=" + b"x" * 1024] * (FORM_FIELDS_SIZE_LIMIT // 1024 + 10)
+    request, received = make_request(chunks, [URLENCODED])
+    with pytest.raises(HTTPException) as e:
+        asyncio.run(ingest_multipart(request, "profile_image"))
+    assert e.value.status_code == 413
+    assert len(received) < len(chunks)
@@ -0,0 +1,56 @@
+import random
+import string
+import time
+
+from app.utils.matcher import AhoCorasick
+
+
+def make_terms(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10)))
+        for _ in range(count)
+    ]
+
+
+def time_search(matcher: AhoCorasick, texts: list[str], repeat: int = 3):
+    # 입력 1개당 최소 검색 시간
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for text in texts:
+            matcher.search(text)
+        best = min(best, time.perf_counter() - started)
+    return best / len(texts)
+
+
+def test_normalized_variants_matched():
+    matcher = AhoCorasick(["admin", "관리자"])
+    assert matcher.search("admin123") == "admin"
+    assert matcher.search("ＡＤＭＩＮ") == "admin"
+    assert matcher.search("a.d.m.i.n") == "admin"
+    assert matcher.search("ㄱㅘㄴㄹㅣㅈㅏ_kim") == "관리자"
+    assert matcher.search("nickname") is None
+
+
+def test_search_time_independent_of_term_count():
+    # 10k 단어 컴파일 후 검색 시간이 단어 수가 아닌 닉네임 길이에 비례 (O(len(nickname)))
+    rng = random.Random(1)
+    texts = ["".join(rng.choices(string.ascii_lowercase, k=12)) for _ in range(2000)]
+    started = time.perf_counter()
+    large = AhoCorasick(make_terms(10000))
+    build_time = time.perf_counter() - started
+    small = AhoCorasick(make_terms(10))
+    large_time = time_search(large, texts)
+    small_time = time_search(small, texts)
+    long_time = time_search(large, [text * 8 for text in texts[:500]])
+    print(
+        f"build 10k: {build_time * 1000:.1f}ms, "
+        f"search 10k: {large_time * 1e6:.2f}us, 10: {small_time * 1e6:.2f}us, "
+        f"8x length: {long_time * 1e6:.2f}us"
+    )
+    assert large_time < small_time * 3
+    assert long_time > large_time * 3
+    # 10k 단어 모두 검색됨
+    terms = make_terms(10000)
+    assert all(large.search(f"x{term}1") for term in terms[::100])
@@ -0,0 +1,94 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from app.security.password import Password, PasswordHasher
+
+
+def test_cancelled_request_keeps_pending_until_job_finishes():
+    # 대기 중인 요청이 취소되어도 실행 중인 작업이 끝날 때까지 대기 수 유지
+    hasher = PasswordHasher(max_workers=1, max_pending=1)
+    release = threading.Event()
+
+    async def main():
+        task = asyncio.create_task(hasher._run(release.wait, 5))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        assert hasher.stats()["pending"] == 1
+        # 작업이 실행 중이므로 새 요청은 거절
+        with pytest.raises(HTTPException) as e:
+            await hasher.hash("password")
+        assert e.value.status_code == 503
+        release.set()
+        for _ in range(100):
+            if hasher.stats()["pending"] == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert hasher.stats()["pending"] == 0
+        assert await hasher.verify("password", await hasher.hash("password"))
+
+    try:
+        asyncio.run(main())
+    finally:
+        hasher.shutdown()
+
+
+def measure_lag(stop: asyncio.Event, interval: float = 0.005):
+    # 이벤트 루프 지연 측정용 코루틴 (sleep 초과 시간 목록)
+    async def ticker():
+        lags = []
+        loop = asyncio.get_running_loop()
+        while not stop.is_set():
+            started = loop.time()
+            await asyncio.sleep(interval)
+            lags.append(loop.time() - started - interval)
+        return lags
+
+    return ticker()
+
+
+def p99(values: list[float]):
+    return sorted(values)[int(len(values) * 0.99) - 1]
+
+
+def test_unrelated_latency_flat_during_login_storm():
+    # 로그인 폭주(해시/검증 동시 요청) 중에도 다른 코루틴의 p99 지연이 bcrypt 1회보다 훨씬 작음
+    hasher = PasswordHasher(max_workers=2, max_pending=64)
+    hashed = Password.create_password_hash("password")
+    started = time.perf_counter()
+    Password.verify_password("password", hashed)
+    bcrypt_time = time.perf_counter() - started
+
+    async def main():
+        # 기준 지연
+        stop = asyncio.Event()
+        ticker = asyncio.create_task(measure_lag(stop))
+        await asyncio.sleep(0.5)
+        stop.set()
+        baseline = await ticker
+        # 폭주 중 지연
+        stop = asyncio.Event()
+        ticker = asyncio.create_task(measure_lag(stop))
+        storm_started = time.perf_counter()
+        results = await asyncio.gather(
+            *[hasher.hash("password") for _ in range(4)],
+            *[hasher.verify("password", hashed) for _ in range(8)],
+        )
+        storm_time = time.perf_counter() - storm_started
+        stop.set()
+        return baseline, await ticker, results, storm_time
+
+    try:
+        baseline, storm, results, storm_time = asyncio.run(main())
+    finally:
+        hasher.shutdown()
+    assert all(results[4:])
+    assert hasher.stats()["completed"] == 12
+    # 폭주가 bcrypt 여러 번 분량 지속되는 동안
+    assert storm_time > bcrypt_time * 4
+    assert p99(storm) < max(0.05, p99(baseline) * 5)
+    assert p99(storm) < bcrypt_time / 2
@@ -0,0 +1,81 @@
+import asyncio
+import hashlib
+from io import BytesIO
+from urllib.parse import urlsplit
+
+import pytest
+from aiohttp import web
+from PIL import Image
+
+from app.utils import remote
+from app.utils.remote import RemoteImageIngestor
+from app.utils.storage import LocalStorageBackend
+
+
+def make_png():
+    buffer = BytesIO()
+    Image.new("RGB", (32, 16)).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+async def start_server(png: bytes):
+    # /image.png, 같은 호스트 리다이렉트, 다른 호스트(localhost) 리다이렉트
+    async def image(request):
+        return web.Response(body=png, content_type="image/png")
+
+    async def redirect_same(request):
+        raise web.HTTPFound(f"http://127.0.0.1:{request.url.port}/image.png")
+
+    async def redirect_other(request):
+        raise web.HTTPFound(f"http://localhost:{request.url.port}/image.png")
+
+    app = web.Application()
+    app.router.add_get("/image.png", image)
+    app.router.add_get("/same", redirect_same)
+    app.router.add_get("/other", redirect_other)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    return runner, runner.addresses[0][1]
+
+
+@pytest.fixture(autouse=True)
+def allow_http(monkeypatch):
+    # 테스트 서버는 http 이므로 호스트만 확인
+    monkeypatch.setattr(
+        remote, "is_allowed_url", lambda url, hosts: urlsplit(url).hostname in hosts
+    )
+
+
+def ingest(tmp_path, path: str, allowed_hosts):
+    png = make_png()
+
+    async def main():
+        runner, port = await start_server(png)
+        ingestor = RemoteImageIngestor(LocalStorageBackend(2, str(tmp_path)))
+        try:
+            return await ingestor.ingest(
+                f"http://127.0.0.1:{port}{path}", "imports/", allowed_hosts
+            )
+        finally:
+            await ingestor.close()
+            await runner.cleanup()
+
+    return png, asyncio.run(main())
+
+
+def test_redirect_within_allowed_hosts(tmp_path):
+    png, result = ingest(tmp_path, "/same", ["127.0.0.1"])
+    assert result["hash"] == hashlib.sha256(png).hexdigest()
+    assert (tmp_path / result["url"]).read_bytes() == png
+
+
+def test_redirect_to_other_host_rejected(tmp_path):
+    _, result = ingest(tmp_path, "/other", ["127.0.0.1"])
+    assert result is None
+
+
+def test_unrestricted_ingest_follows_redirects(tmp_path):
+    png, result = ingest(tmp_path, "/other", None)
+    assert result["size"] == len(png)
@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException, Response
+
+from app.cache.auth import token_versions
+from app.database.schema.users import ReqUserTokenRefresh
+from app.routes.v1 import users
+from app.security.token import JWTManager
+
+
+@pytest.fixture
+def refresh_token():
+    # 토큰 버전 맵 폴링이 멈춘 상태 (맵에는 폐기 정보 없음)
+    token_versions.polled_at = 0.0
+    return JWTManager.create_refresh_token(
+        {"id": 1, "email": "user@example.com", "token_version": 0}
+    )
+
+
+def patch_queryset(monkeypatch, token_state: dict):
+    # 교체 문장이 반환하는 회원 상태, 패밀리 폐기 여부 기록
+    calls = {"rotated": [], "revoked": []}
+
+    async def rotate_user_token_family(db, family_id, token_id, new_token_id):
+        calls["rotated"].append(new_token_id)
+        return {"id": 1, "email": "user@example.com", **token_state}
+
+    async def revoke_user_token_family(db, family_id):
+        calls["revoked"].append(family_id)
+        return True
+
+    monkeypatch.setattr(
+        users.queryset, "rotate_user_token_family", rotate_user_token_family
+    )
+    monkeypatch.setattr(
+        users.queryset, "revoke_user_token_family", revoke_user_token_family
+    )
+    return calls
+
+
+def refresh(token: str):
+    return asyncio.run(
+        users.refresh_user_token(ReqUserTokenRefresh(refresh_token=token), Response(), None)
+    )
+
+
+def test_revoked_token_rejected_when_map_stale(monkeypatch, refresh_token):
+    calls = patch_queryset(
+        monkeypatch, {"token_version": 1, "is_active": True, "is_block": False}
+    )
+    with pytest.raises(HTTPException) as e:
+        refresh(refresh_token)
+    assert e.value.headers["code"] == "ACCESS_TOKEN_REVOKED"
+    assert len(calls["revoked"]) == 1
+
+
+def test_blocked_user_rejected(monkeypatch, refresh_token):
+    calls = patch_queryset(
+        monkeypatch, {"token_version": 0, "is_active": True, "is_block": True}
+    )
+    with pytest.raises(HTTPException) as e:
+        refresh(refresh_token)
+    assert e.value.headers["code"] == "USER_BLOCKED"
+    assert len(calls["revoked"]) == 1
+
+
+def test_active_user_rotated_in_one_statement(monkeypatch, refresh_token):
+    calls = patch_queryset(
+        monkeypatch, {"token_version": 0, "is_active": True, "is_block": False}
+    )
+    result = refresh(refresh_token)
+    assert len(calls["rotated"]) == 1
+    assert not calls["revoked"]
+    claims = JWTManager.decode_refresh_token(result.refresh_token)
+    assert claims["jti"] == calls["rotated"][0]
@@ -0,0 +1,91 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.cache.auth import auth_context_cache, token_versions
+from app.security import verifier
+from app.security.token import JWTManager
+
+
+def make_request(token: str):
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "headers": [(b"authorization", f"Bearer {token}".encode())],
+        }
+    )
+
+
+def make_user_reader(is_block: bool, is_active: bool = True):
+    async def read_user_auth_by_id(db, user_id):
+        return {
+            "id": user_id,
+            "email": "user@example.com",
+            "is_active": is_active,
+            "is_block": is_block,
+        }
+
+    return read_user_auth_by_id
+
+
+def fail_user_reader(db, user_id):
+    raise AssertionError("rvvs_user should not be read")
+
+
+@pytest.fixture(autouse=True)
+def fresh_token_versions():
+    # 토큰 버전 맵이 최신인 상태
+    auth_context_cache.clear()
+    token_versions.polled_at = time.time()
+    yield
+    auth_context_cache.clear()
+    token_versions._versions.clear()
+    token_versions.polled_at = 0.0
+
+
+def test_fresh_map_accepts_token_without_db(monkeypatch):
+    # 버전 맵이 최신이면 rvvs_user 조회 없이 통과
+    monkeypatch.setattr(verifier, "read_user_auth_by_id", fail_user_reader)
+    token = JWTManager.create_access_token({"id": 3, "email": "user@example.com"})
+    user = asyncio.run(verifier.verify_access_token_user(make_request(token), None))
+    assert user["id"] == 3
+    assert not user["is_block"]
+
+
+def test_blocked_user_token_rejected(monkeypatch):
+    # 차단시 트리거가 증가시킨 토큰 버전을 폴링으로 반영하면 DB 조회 없이 거절
+    monkeypatch.setattr(verifier, "read_user_auth_by_id", fail_user_reader)
+    token = JWTManager.create_access_token({"id": 1, "email": "user@example.com"})
+    asyncio.run(verifier.verify_access_token_user(make_request(token), None))
+    token_versions.set(1, 1)
+    with pytest.raises(HTTPException) as e:
+        asyncio.run(verifier.verify_access_token_user(make_request(token), None))
+    assert e.value.status_code == 401
+    assert e.value.headers["code"] == "ACCESS_TOKEN_REVOKED"
+
+
+def test_stale_map_reads_blocked_user_from_db(monkeypatch):
+    # 버전 맵 갱신이 지연되면 DB 의 회원 상태로 검증
+    token_versions.polled_at = 0.0
+    monkeypatch.setattr(verifier, "read_user_auth_by_id", make_user_reader(True))
+    token = JWTManager.create_access_token({"id": 1, "email": "user@example.com"})
+    with pytest.raises(HTTPException) as e:
+        asyncio.run(verifier.verify_access_token_user(make_request(token), None))
+    assert e.value.status_code == 401
+    assert e.value.headers["code"] == "USER_BLOCKED"
+
+
+def test_stale_map_reads_inactive_user_from_db(monkeypatch):
+    token_versions.polled_at = 0.0
+    monkeypatch.setattr(
+        verifier, "read_user_auth_by_id", make_user_reader(False, is_active=False)
+    )
+    token = JWTManager.create_access_token({"id": 2, "email": "user@example.com"})
+    with pytest.raises(HTTPException) as e:
+        asyncio.run(verifier.verify_access_token_user(make_request(token), None))
+    assert e.value.headers["code"] == "USER_LOGIN_AUTH_FAIL"
@@ -0,0 +1,51 @@
+import asyncio
+import contextlib
+
+from app.database.model.users import UserLoginLog
+from app.database.writer import BatchWriter
+
+
+class FakeSession:
+    def __init__(self, written: list, block: asyncio.Event | None):
+        self.written = written
+        self.block = block
+        self.rows = []
+
+    async def execute(self, stmt, rows):
+        if self.block is not None:
+            await self.block.wait()
+        self.rows = list(rows)
+
+    async def commit(self):
+        self.written.extend(self.rows)
+
+
+def make_session_factory(written: list, block: asyncio.Event | None = None):
+    @contextlib.asynccontextmanager
+    async def session_factory():
+        yield FakeSession(written, block)
+
+    return session_factory
+
+
+def test_batch_in_flight_on_shutdown_is_written():
+    # 기록 중에 run 이 취소되어도 진행 중이던 배치는 종료시 기록
+    writer = BatchWriter(UserLoginLog, batch_size=10, flush_interval=0.01, max_buffer=100)
+    written = []
+
+    async def main():
+        block = asyncio.Event()
+        task = asyncio.create_task(writer.run(make_session_factory(written, block)))
+        for i in range(5):
+            writer.put({"code": str(i)})
+        await asyncio.sleep(0.05)
+        # 첫 배치 기록 중 취소 후, 종료 flush 의 기록은 진행되도록 해제
+        task.cancel()
+        await asyncio.sleep(0)
+        block.set()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(main())
+    assert [row["code"] for row in written] == [str(i) for i in range(5)]
+    assert len(writer) == 0
+    assert "created_at" not in written[0]